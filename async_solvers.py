@@ -0,0 +1,275 @@
+"""
+Variantes asíncronas (asyncio) de Bisección, Newton y Secante.
+
+Pensadas para funciones objetivo que son llamadas a un servicio (p. ej. una
+simulación remota): cada evaluación se espera con `await`, así que un solo
+event loop mantiene muchas resoluciones en curso sin bloquear un hilo por cada una.
+`f` (y `df`) pueden ser funciones `async` o funciones comunes.
+
+`solve_many` ejecuta muchas resoluciones independientes a la vez con un límite de
+concurrencia y un tiempo máximo por resolución. `LocalService` simula el servicio
+en el mismo proceso (latencia configurable), para pruebas y demostraciones.
+
+Uso:
+    python async_solvers.py                                  # 500 raíces, latencia 5 ms
+    python async_solvers.py --solves 1000 --concurrency 200 --latency 0.01
+"""
+
+import argparse
+import asyncio
+import inspect
+import math
+import sys
+from time import perf_counter_ns
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from common_functions import BISECTION_COLUMNS, ITERATIVE_COLUMNS, IterationHistory
+
+Objective = Callable[[float], Union[float, Awaitable[float]]]
+
+
+async def _call(func: Objective, x: float) -> float:
+	"""Evalúa `func(x)` esperando el resultado si es awaitable."""
+	value = func(x)
+	if inspect.isawaitable(value):
+		value = await value
+	return value
+
+
+def _history(columns: Tuple[str, ...], capacity: int, capture_history: bool, compact: bool):
+	"""Historial: None, lista de filas o `IterationHistory` (crece si hace falta)."""
+	if not capture_history:
+		return None
+	if compact:
+		return IterationHistory(columns, capacity)
+	return []
+
+
+async def async_bisection(
+	func: Objective,
+	a: float,
+	b: float,
+	tol: float = 1e-5,
+	max_iter: int = 1000,
+	capture_history: bool = True,
+	compact: bool = False,
+) -> Tuple[float, int, Optional[List[Tuple[int, float, float, float, float, float]]]]:
+	"""
+	Bisección asíncrona, con el mismo criterio de parada y formato de historial que
+	`bisection_method`: (n, a, b, p, f(p), (b-a)/2). Las dos evaluaciones de los
+	extremos se hacen en paralelo; si f se anula en uno, ese extremo es la raíz.
+	"""
+	history = _history(BISECTION_COLUMNS, 64, capture_history, compact)
+	fa, fb = await asyncio.gather(_call(func, a), _call(func, b))
+	if fa * fb > 0:
+		raise ValueError("La función no cambia de signo en el intervalo dado")
+	if fa == 0:
+		return a, 0, history
+	if fb == 0:
+		return b, 0, history
+
+	iter_count = 0
+	while (b - a) / 2.0 > tol and iter_count < max_iter:
+		p = (a + b) / 2.0
+		# a y b son floats consecutivos: la precisión de float64 se agotó
+		if p == a or p == b:
+			break
+		fp = await _call(func, p)
+		iter_count += 1
+		if history is not None:
+			history.append((iter_count, a, b, p, fp, (b - a) / 2.0))
+		if fp == 0:
+			break
+		if fa * fp < 0:
+			b, fb = p, fp
+		else:
+			a, fa = p, fp
+
+	return (a + b) / 2.0, iter_count, history
+
+
+async def async_newton(
+	f: Objective,
+	df: Objective,
+	p0: float,
+	tol: float = 1e-4,
+	max_iter: int = 50,
+	capture_history: bool = True,
+	compact: bool = False,
+) -> Tuple[float, int, Optional[List[Tuple[int, float, float, float]]]]:
+	"""
+	Newton-Raphson asíncrono con historial (n, x_n, f(x_n), delta) como
+	`newton_method`. En cada punto f y df se piden a la vez, así que cada
+	iteración espera una sola latencia del servicio; en el punto final solo se
+	pide f.
+	"""
+	rows = _history(ITERATIVE_COLUMNS, max_iter + 1, capture_history, compact)
+	p = p0
+	fp, dfp = await asyncio.gather(_call(f, p), _call(df, p))
+	n = 0
+	if rows is not None:
+		rows.append((0, p, fp, 0.0))
+	for n in range(1, max_iter + 1):
+		if dfp == 0:
+			break
+		p_new = p - fp / dfp
+		delta = abs(p_new - p)
+		done = delta < tol or delta <= sys.float_info.epsilon * abs(p_new) or n == max_iter
+		# En el último punto df no se usa: solo se pide f
+		if done:
+			fp = await _call(f, p_new)
+		else:
+			fp, dfp = await asyncio.gather(_call(f, p_new), _call(df, p_new))
+		if rows is not None:
+			rows.append((n, p_new, fp, delta))
+		p = p_new
+		if done:
+			break
+	return p, n, rows
+
+
+async def async_secant(
+	f: Objective,
+	x0: float,
+	x1: float,
+	tol: float = 1e-4,
+	max_iter: int = 50,
+	capture_history: bool = True,
+	compact: bool = False,
+) -> Tuple[float, int, Optional[List[Tuple[int, float, float, float]]]]:
+	"""
+	Método de la Secante asíncrono con historial (n, x_n, f(x_n), delta) como
+	`secant_method`; f(x0) y f(x1) se piden a la vez.
+	"""
+	rows = _history(ITERATIVE_COLUMNS, max_iter + 1, capture_history, compact)
+	f0, f1 = await asyncio.gather(_call(f, x0), _call(f, x1))
+	n = 1
+	if rows is not None:
+		rows.append((0, x0, f0, 0.0))
+		rows.append((1, x1, f1, abs(x1 - x0)))
+	for n in range(2, max_iter + 1):
+		if (f1 - f0) == 0:
+			break
+		x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
+		delta = abs(x2 - x1)
+		f2 = await _call(f, x2)
+		if rows is not None:
+			rows.append((n, x2, f2, delta))
+		if delta < tol:
+			return x2, n, rows
+		x0, f0 = x1, f1
+		x1, f1 = x2, f2
+	return x1, n, rows
+
+
+# =============================================================================
+# Planificador
+# =============================================================================
+
+async def solve_many(
+	jobs: List[Callable[[], Awaitable[tuple]]],
+	concurrency: int = 100,
+	timeout: Optional[float] = None,
+) -> List[Dict[str, object]]:
+	"""
+	Ejecuta resoluciones independientes en el event loop actual, con a lo sumo
+	`concurrency` en curso a la vez y `timeout` segundos como máximo cada una
+	(contados desde que la resolución obtiene su turno).
+
+	Cada trabajo es una función sin argumentos que retorna la corrutina, p. ej.
+	`lambda: async_newton(f, df, 1.0, capture_history=False)`; así la corrutina se
+	crea recién cuando hay lugar. Retorna, en el orden de `jobs`, un diccionario
+	por trabajo con "root", "iterations" y "time_ns", o "error" si lanzó cualquier
+	excepción o excedió el tiempo; un error no cancela a los demás.
+	"""
+	if concurrency < 1:
+		raise ValueError("concurrency debe ser un entero positivo")
+	limit = asyncio.Semaphore(concurrency)
+
+	async def run(index: int, job: Callable[[], Awaitable[tuple]]) -> Dict[str, object]:
+		async with limit:
+			start = perf_counter_ns()
+			try:
+				root, iters, _ = await asyncio.wait_for(job(), timeout)
+			except asyncio.TimeoutError:
+				return {"job": index, "error": f"tiempo agotado ({timeout} s)", "time_ns": perf_counter_ns() - start}
+			except Exception as exc:
+				# Cualquier falla del trabajo (también del servicio: OSError, KeyError, ...) queda en su resultado
+				return {"job": index, "error": f"{type(exc).__name__}: {exc}", "time_ns": perf_counter_ns() - start}
+			return {"job": index, "root": root, "iterations": iters, "time_ns": perf_counter_ns() - start}
+
+	return await asyncio.gather(*(run(i, job) for i, job in enumerate(jobs)))
+
+
+def run_many(
+	jobs: List[Callable[[], Awaitable[tuple]]],
+	concurrency: int = 100,
+	timeout: Optional[float] = None,
+) -> List[Dict[str, object]]:
+	"""Versión síncrona de `solve_many`: crea un event loop propio y espera el resultado."""
+	return asyncio.run(solve_many(jobs, concurrency, timeout))
+
+
+# =============================================================================
+# Servicio simulado en el mismo proceso
+# =============================================================================
+
+class LocalService:
+	"""
+	Simula un servicio remoto que evalúa `func`: cada llamada espera `latency`
+	segundos (sin bloquear el event loop) antes de responder. Cuenta las llamadas
+	y el máximo de llamadas simultáneas observado.
+	"""
+
+	def __init__(self, func: Callable[[float], float], latency: float = 0.005) -> None:
+		self.func = func
+		self.latency = latency
+		self.calls = 0
+		self.in_flight = 0
+		self.max_in_flight = 0
+
+	async def __call__(self, x: float) -> float:
+		self.calls += 1
+		self.in_flight += 1
+		self.max_in_flight = max(self.max_in_flight, self.in_flight)
+		try:
+			await asyncio.sleep(self.latency)
+			return self.func(x)
+		finally:
+			self.in_flight -= 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+	parser = argparse.ArgumentParser(description="Muchas resoluciones de Newton contra un servicio simulado")
+	parser.add_argument("--solves", type=int, default=500, help="cantidad de raíces (√c para c = 2, 3, ...)")
+	parser.add_argument("--concurrency", type=int, default=100, help="resoluciones en curso a la vez")
+	parser.add_argument("--latency", type=float, default=0.005, help="latencia de cada llamada (s)")
+	parser.add_argument("--timeout", type=float, default=None, help="tiempo máximo por resolución (s)")
+	args = parser.parse_args(argv)
+
+	services = []
+	jobs = []
+	for k in range(args.solves):
+		c = k + 2.0
+		fc = LocalService(lambda x, c=c: x * x - c, args.latency)
+		dfc = LocalService(lambda x: 2.0 * x, args.latency)
+		services.append((fc, dfc))
+		jobs.append(lambda fc=fc, dfc=dfc, c=c: async_newton(fc, dfc, c, tol=1e-10, capture_history=False))
+
+	start = perf_counter_ns()
+	results = run_many(jobs, args.concurrency, args.timeout)
+	elapsed = (perf_counter_ns() - start) / 1e9
+
+	calls = sum(fc.calls + dfc.calls for fc, dfc in services)
+	errors = sum("error" in r for r in results)
+	# Si todas las resoluciones fallaron (p. ej. por --timeout) no hay error que medir
+	worst = max((abs(r["root"] - math.sqrt(k + 2.0)) for k, r in enumerate(results) if "root" in r), default=math.nan)
+	sequential = sum(fc.calls for fc, _ in services) * args.latency
+	print(f"{args.solves} resoluciones, {calls} llamadas al servicio, {errors} errores")
+	print(f"Tiempo total: {elapsed:.3f} s (en serie serían ~{sequential:.1f} s)")
+	print(f"Error máximo contra math.sqrt: {worst:.2e}")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
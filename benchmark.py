@@ -0,0 +1,280 @@
+"""
+Benchmark de los métodos de búsqueda de raíces sobre los problemas de los ejercicios.
+
+Ejecuta bisección, Illinois, Brent, Newton y Secante (también con aceleración de
+Aitken y en sus versiones en lote) sobre los problemas de ex1–ex8 para tolerancias
+de 10^-1 a 10^-15, con y sin historial y con distintos tamaños de lote. Para cada caso reporta iteraciones, evaluaciones de f,
+tiempo (mejor de varias repeticiones, `perf_counter_ns`) y memoria pico (`tracemalloc`).
+En los métodos en lote cada llamada con un arreglo cuenta una evaluación por elemento.
+
+Uso:
+    python benchmark.py                         # imprime la tabla
+    python benchmark.py --save baseline.json    # guarda una línea base
+    python benchmark.py --compare baseline.json # marca regresiones contra la línea base
+"""
+
+import argparse
+import json
+import math
+import sys
+import tracemalloc
+from time import perf_counter_ns
+from typing import Callable, Dict, List, Optional, Tuple
+
+from common_functions import (
+	CountedFunction,
+	Polynomial,
+	bisection_method,
+	illinois_method,
+	brent_method,
+	newton_steps,
+	secant_steps,
+	accelerated_steps,
+	accelerated_method,
+	newton_method,
+	secant_method,
+	bisection_batch,
+	newton_batch,
+	secant_batch,
+)
+from problems import Problem, load_problems
+
+TOLERANCES = [10.0 ** (-p) for p in range(1, 16)]
+BATCH_SIZES = [1, 100, 10_000]
+
+
+# =============================================================================
+# Ejecución de un caso
+# =============================================================================
+
+def _consume(steps) -> tuple:
+	"""Agota un generador de pasos sin guardar filas y devuelve su valor de retorno."""
+	while True:
+		try:
+			next(steps)
+		except StopIteration as stop:
+			return stop.value
+
+
+def _bracketing(method: Callable) -> Callable:
+	def run(problem: Problem, f: Callable, df: Optional[Callable], tol: float, history: bool, batch: int):
+		return method(f, *problem.bracket, tol=tol, max_iter=1000, capture_history=history)[:2]
+	return run
+
+
+def _newton(problem, f, df, tol, history, batch):
+	if history:
+		return newton_method(f, df, problem.p0, tol=tol, max_iter=100)[:2]
+	return _consume(newton_steps(f, df, problem.p0, tol=tol, max_iter=100))
+
+
+def _secant(problem, f, df, tol, history, batch):
+	if history:
+		return secant_method(f, *problem.x0x1, tol=tol, max_iter=100)[:2]
+	return _consume(secant_steps(f, *problem.x0x1, tol=tol, max_iter=100))
+
+
+def _newton_aitken(problem, f, df, tol, history, batch):
+	if history:
+		return accelerated_method(newton_steps, f, df, problem.p0, tol=tol, max_iter=100)[:2]
+	return _consume(accelerated_steps(newton_steps, f, df, problem.p0, tol=tol, max_iter=100))[:2]
+
+
+def _secant_aitken(problem, f, df, tol, history, batch):
+	if history:
+		return accelerated_method(secant_steps, f, *problem.x0x1, tol=tol, max_iter=100)[:2]
+	return _consume(accelerated_steps(secant_steps, f, *problem.x0x1, tol=tol, max_iter=100))[:2]
+
+
+def _bisection_batch(problem, f, df, tol, history, batch):
+	import numpy as np
+
+	a, b = problem.bracket
+	roots, iters = bisection_batch(f, np.full(batch, a), np.full(batch, b), tol=tol, max_iter=1000)
+	return float(roots[0]), int(iters.max())
+
+
+def _newton_batch(problem, f, df, tol, history, batch):
+	import numpy as np
+
+	roots, iters, _, _ = newton_batch(f, df, np.full(batch, problem.p0), tol=tol, max_iter=100)
+	return float(roots[0]), int(iters.max())
+
+
+def _secant_batch(problem, f, df, tol, history, batch):
+	import numpy as np
+
+	x0, x1 = problem.x0x1
+	roots, iters, _, _ = secant_batch(f, np.full(batch, x0), np.full(batch, x1), tol=tol, max_iter=100)
+	return float(roots[0]), int(iters.max())
+
+
+# nombre -> (ejecutor, usa df, es en lote). Sin df del problema, Newton escalar
+# usa diferenciación automática y Newton en lote la derivada del `Polynomial`.
+METHODS: Dict[str, Tuple[Callable, bool, bool]] = {
+	"bisection": (_bracketing(bisection_method), False, False),
+	"illinois": (_bracketing(illinois_method), False, False),
+	"brent": (_bracketing(brent_method), False, False),
+	"newton": (_newton, True, False),
+	"secant": (_secant, False, False),
+	"newton_aitken": (_newton_aitken, True, False),
+	"secant_aitken": (_secant_aitken, False, False),
+	"bisection_batch": (_bisection_batch, False, True),
+	"newton_batch": (_newton_batch, True, True),
+	"secant_batch": (_secant_batch, False, True),
+}
+
+
+def _explicit_derivative(problem: Problem) -> Optional[Callable]:
+	"""df del problema o, para un `Polynomial`, su derivada; None si no hay forma cerrada."""
+	if problem.df is not None:
+		return problem.df
+	if isinstance(problem.f, Polynomial):
+		return problem.f.derivative()
+	return None
+
+
+def run_case(
+	method: str, problem: Problem, tol: float, history: bool, batch: int, repeat: int
+) -> Dict[str, object]:
+	"""Ejecuta un caso y devuelve sus métricas."""
+	runner, _, is_batch = METHODS[method]
+	df = _explicit_derivative(problem) if is_batch else problem.df
+	f = CountedFunction(problem.f)
+	root, iters = runner(problem, f, df, tol, history, batch)
+	# Los métodos en lote evalúan f en todos los elementos de cada llamada
+	evaluations = f.evaluations
+
+	best_ns = math.inf
+	for _ in range(repeat):
+		start = perf_counter_ns()
+		runner(problem, problem.f, df, tol, history, batch)
+		best_ns = min(best_ns, perf_counter_ns() - start)
+
+	tracemalloc.start()
+	runner(problem, problem.f, df, tol, history, batch)
+	_, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+
+	return {
+		"problem": problem.name,
+		"method": method,
+		"tol": tol,
+		"history": history,
+		"batch": batch,
+		"root": root,
+		"iterations": iters,
+		"evaluations": evaluations,
+		"time_ns": best_ns,
+		"peak_bytes": peak,
+	}
+
+
+def case_key(result: Dict[str, object]) -> str:
+	return f"{result['problem']}|{result['method']}|{result['tol']:.0e}|{int(result['history'])}|{result['batch']}"
+
+
+def run_suite(
+	methods: Optional[List[str]] = None,
+	tolerances: Optional[List[float]] = None,
+	batch_sizes: Optional[List[int]] = None,
+	repeat: int = 5,
+) -> List[Dict[str, object]]:
+	"""Recorre problemas x métodos x tolerancias x historial x tamaño de lote."""
+	methods = methods or list(METHODS)
+	tolerances = tolerances or TOLERANCES
+	batch_sizes = batch_sizes or BATCH_SIZES
+	results = []
+	for problem in load_problems():
+		vectorized = problem.vectorized
+		for method in methods:
+			_, needs_df, is_batch = METHODS[method]
+			if needs_df and is_batch and _explicit_derivative(problem) is None:
+				continue
+			if is_batch and not vectorized:
+				continue
+			for tol in tolerances:
+				if is_batch:
+					for batch in batch_sizes:
+						results.append(run_case(method, problem, tol, False, batch, repeat))
+				else:
+					for history in (True, False):
+						results.append(run_case(method, problem, tol, history, 1, repeat))
+	return results
+
+
+# =============================================================================
+# Línea base y regresiones
+# =============================================================================
+
+def save_baseline(results: List[Dict[str, object]], path: str) -> None:
+	with open(path, "w", encoding="utf-8") as fh:
+		json.dump({case_key(r): r for r in results}, fh, indent=1)
+
+
+def compare_baseline(
+	results: List[Dict[str, object]], path: str, threshold: float = 1.25
+) -> List[Tuple[str, str]]:
+	"""
+	Compara contra una línea base guardada. Es regresión que aumenten las iteraciones
+	o las evaluaciones, o que el tiempo o la memoria pico superen `threshold` veces
+	el valor base. Retorna una lista de (caso, motivo).
+	"""
+	with open(path, encoding="utf-8") as fh:
+		baseline = json.load(fh)
+	regressions = []
+	for result in results:
+		key = case_key(result)
+		base = baseline.get(key)
+		if base is None:
+			continue
+		for field in ("iterations", "evaluations"):
+			if result[field] > base[field]:
+				regressions.append((key, f"{field}: {base[field]} -> {result[field]}"))
+		for field in ("time_ns", "peak_bytes"):
+			if base[field] > 0 and result[field] > threshold * base[field]:
+				regressions.append((key, f"{field}: {base[field]} -> {result[field]} (x{result[field] / base[field]:.2f})"))
+	return regressions
+
+
+def print_results(results: List[Dict[str, object]]) -> None:
+	print(f"{'problema':<7} | {'método':<15} | {'tol':>7} | {'hist':>4} | {'lote':>6} | "
+		  f"{'iter':>4} | {'eval f':>6} | {'tiempo (µs)':>12} | {'pico (KiB)':>10}")
+	print("-" * 98)
+	for r in results:
+		print(f"{r['problem']:<7} | {r['method']:<15} | {r['tol']:7.0e} | {'sí' if r['history'] else 'no':>4} | "
+			  f"{r['batch']:6d} | {r['iterations']:4d} | {r['evaluations']:6d} | "
+			  f"{r['time_ns'] / 1e3:12.1f} | {r['peak_bytes'] / 1024:10.1f}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+	parser = argparse.ArgumentParser(description="Benchmark de métodos de búsqueda de raíces")
+	parser.add_argument("--methods", nargs="+", choices=list(METHODS), help="métodos a ejecutar")
+	parser.add_argument("--quick", action="store_true", help="solo tolerancias 1e-5 y 1e-10 y lotes de 1 y 100")
+	parser.add_argument("--repeat", type=int, default=5, help="repeticiones por caso (se toma el mínimo)")
+	parser.add_argument("--save", metavar="JSON", help="guarda los resultados como línea base")
+	parser.add_argument("--compare", metavar="JSON", help="compara contra una línea base")
+	parser.add_argument("--threshold", type=float, default=1.25, help="factor de tiempo/memoria que cuenta como regresión")
+	args = parser.parse_args(argv)
+
+	tolerances = [1e-5, 1e-10] if args.quick else None
+	batch_sizes = [1, 100] if args.quick else None
+	results = run_suite(args.methods, tolerances, batch_sizes, args.repeat)
+	print_results(results)
+
+	if args.save:
+		save_baseline(results, args.save)
+		print(f"\nLínea base guardada en {args.save}")
+	if args.compare:
+		regressions = compare_baseline(results, args.compare, args.threshold)
+		if regressions:
+			print(f"\n{len(regressions)} regresiones:")
+			for key, reason in regressions:
+				print(f"  REGRESIÓN {key}: {reason}")
+			return 1
+		print("\nSin regresiones respecto de la línea base")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,273 @@
+"""
+Punto de entrada único para los ejercicios y los métodos, sin preguntas por teclado.
+
+Cada comando importa solo lo que usa: resolver un problema no carga NumPy ni
+matplotlib, y los ejercicios con gráficos los cargan únicamente si se grafica.
+
+Uso:
+    python -m cli ex1 -p 6                        # Ejercicio 1 con tolerancia 10^-6
+    python -m cli ex2 -p 25                       # precisión extendida para p > 15
+    python -m cli ex3 --no-plot                   # solo las tablas
+    python -m cli ex6 --save graficos/            # guarda los gráficos en lugar de mostrarlos
+    python -m cli solve brent ex1a --tol 1e-12    # un método sobre un problema de los ejercicios
+    python -m cli solve newton --expr "x - cos(x)" --p0 1 --table
+    python -m cli bench --quick                   # benchmark.py, sweep.py y async_solvers.py
+    python -m cli startup -- solve brent ex1a     # mide el arranque contra un presupuesto
+"""
+
+import argparse
+import importlib
+import os
+import sys
+from time import perf_counter_ns
+from typing import Callable, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Módulos pesados que un comando corto no debería cargar
+HEAVY_MODULES = ("numpy", "matplotlib")
+
+BRACKETING = ("bisection", "illinois", "brent", "ksection")
+SOLVERS = BRACKETING + ("newton", "secant", "chebyshev")
+
+
+def load_exercise(n: int):
+	"""Importa el módulo exN desde su carpeta."""
+	if ROOT not in sys.path:
+		sys.path.insert(0, ROOT)
+	folder = os.path.join(ROOT, f"ex{n}")
+	if folder not in sys.path:
+		sys.path.insert(0, folder)
+	return importlib.import_module(f"ex{n}")
+
+
+# =============================================================================
+# Ejercicios
+# =============================================================================
+
+def _run_exercise(args: argparse.Namespace) -> int:
+	ex = load_exercise(args.exercise)
+	kwargs = {}
+	if getattr(args, "p", None) is not None:
+		kwargs["prec_exp"] = args.p
+	if getattr(args, "no_plot", False):
+		kwargs["plot"] = False
+	if getattr(args, "save", None):
+		from common_functions import use_headless_backend
+
+		use_headless_backend()
+		if args.exercise == 6:
+			os.makedirs(args.save, exist_ok=True)
+			kwargs["output_dir"] = args.save
+		else:
+			kwargs["save_path"] = args.save
+	ex.main(**kwargs)
+	return 0
+
+
+# =============================================================================
+# Métodos sobre un problema
+# =============================================================================
+
+def _expression(expr: str) -> Callable[[float], float]:
+	"""
+	Compila una expresión en x usando las funciones de `dual_math` (exp, cos, ...),
+	así Newton puede derivarla por diferenciación automática.
+	"""
+	import dual_math
+
+	namespace = {name: getattr(dual_math, name) for name in dir(dual_math) if not name.startswith("_")}
+	namespace["__builtins__"] = {"abs": abs, "min": min, "max": max}
+	code = compile(expr, "<expr>", "eval")
+
+	def f(x):
+		namespace["x"] = x
+		return eval(code, namespace)
+	return f
+
+
+def _problem(args: argparse.Namespace) -> Tuple[Callable, Optional[Callable], Tuple[float, float], float, Tuple[float, float]]:
+	"""(f, df, [a, b], p0, (x0, x1)) del problema pedido, con los valores de la línea de comandos."""
+	if args.expr is not None:
+		f, df = _expression(args.expr), None
+		bracket = (args.a if args.a is not None else 0.0, args.b if args.b is not None else 1.0)
+		p0 = sum(bracket) / 2.0
+		x0x1 = bracket
+	else:
+		from problems import PROBLEMS
+
+		if args.problem not in PROBLEMS:
+			raise SystemExit(f"Problema desconocido: {args.problem} (disponibles: {', '.join(PROBLEMS)})")
+		problem = PROBLEMS[args.problem]
+		f, df, bracket, p0, x0x1 = problem.f, problem.df, problem.bracket, problem.p0, problem.x0x1
+		bracket = (args.a if args.a is not None else bracket[0], args.b if args.b is not None else bracket[1])
+	p0 = args.p0 if args.p0 is not None else p0
+	x0x1 = (args.x0 if args.x0 is not None else x0x1[0], args.x1 if args.x1 is not None else x0x1[1])
+	return f, df, bracket, p0, x0x1
+
+
+def _run_solve(args: argparse.Namespace) -> int:
+	import common_functions as cf
+
+	if (args.problem is None) == (args.expr is None):
+		print("Indique un problema (p. ej. ex1a) o una expresión con --expr", file=sys.stderr)
+		return 2
+	f, df, (a, b), p0, (x0, x1) = _problem(args)
+	counted = cf.CountedFunction(f)
+	start = perf_counter_ns()
+	if args.method == "chebyshev":
+		roots = cf.chebyshev_roots(counted, a, b, tol=max(args.tol, 1e-15))
+		elapsed = perf_counter_ns() - start
+		print(f"Raíces en [{a}, {b}]: {', '.join(f'{r:.15g}' for r in roots)}")
+		print(f"Evaluaciones: {counted.calls} | tiempo: {elapsed / 1e3:.1f} µs")
+		return 0
+
+	if args.method in BRACKETING:
+		method = getattr(cf, f"{args.method}_method")
+		root, iters, history = method(counted, a, b, tol=args.tol, max_iter=args.max_iter)
+	elif args.method == "newton":
+		root, iters, history = cf.newton_method(counted, df, p0, tol=args.tol, max_iter=args.max_iter)
+	else:
+		root, iters, history = cf.secant_method(counted, x0, x1, tol=args.tol, max_iter=args.max_iter)
+	elapsed = perf_counter_ns() - start
+
+	if args.table:
+		if args.method in BRACKETING:
+			cf.print_bisection_table(args.method, history)
+		else:
+			cf.print_iteration_table(args.method, history)
+	print(f"Raíz: {root:.15g} | iteraciones: {iters} | evaluaciones: {counted.calls} | "
+		  f"tiempo: {elapsed / 1e3:.1f} µs")
+	return 0
+
+
+# =============================================================================
+# Scripts de la raíz
+# =============================================================================
+
+def _run_script(module: str) -> Callable[[argparse.Namespace], int]:
+	def run(args: argparse.Namespace) -> int:
+		return importlib.import_module(module).main(args.rest)
+	return run
+
+
+# =============================================================================
+# Medición del arranque
+# =============================================================================
+
+def _parse_importtime(stderr: str) -> Dict[str, int]:
+	"""Tiempo acumulado (µs) de cada import de primer nivel según `python -X importtime`."""
+	totals: Dict[str, int] = {}
+	for line in stderr.splitlines():
+		if not line.startswith("import time:") or "|" not in line:
+			continue
+		_, cumulative, name = line.split("|", 2)
+		if name.startswith("  ") or not cumulative.strip().isdigit():
+			continue
+		totals[name.strip()] = int(cumulative)
+	return totals
+
+
+def measure_startup(command: List[str], repeat: int = 5) -> Dict[str, object]:
+	"""
+	Ejecuta `python -X importtime -m cli <command>` `repeat` veces en procesos nuevos
+	y retorna el mejor tiempo total, el tiempo de imports de esa corrida y los
+	módulos de primer nivel más costosos. Antes compila los .pyc para medir el
+	arranque en caliente (el entorno puede tener PYTHONDONTWRITEBYTECODE).
+	"""
+	import compileall
+	import subprocess
+
+	compileall.compile_dir(ROOT, quiet=1)
+	best = None
+	for _ in range(repeat):
+		start = perf_counter_ns()
+		proc = subprocess.run(
+			[sys.executable, "-X", "importtime", "-m", "cli", *command],
+			cwd=ROOT, capture_output=True, text=True,
+		)
+		elapsed = perf_counter_ns() - start
+		if proc.returncode != 0:
+			raise RuntimeError(f"El comando falló ({proc.returncode}):\n{proc.stderr[-2000:]}")
+		if best is None or elapsed < best[0]:
+			best = (elapsed, _parse_importtime(proc.stderr))
+	elapsed, imports = best
+	top = sorted(imports.items(), key=lambda item: item[1], reverse=True)
+	return {
+		"wall_ms": elapsed / 1e6,
+		"import_ms": sum(imports.values()) / 1e3,
+		"top": [(name, us / 1e3) for name, us in top[:8]],
+		"heavy": [name for name in imports if name.split(".")[0] in HEAVY_MODULES],
+	}
+
+
+def _run_startup(args: argparse.Namespace) -> int:
+	command = args.rest or ["solve", "brent", "ex1a"]
+	report = measure_startup(command, args.repeat)
+	print(f"Comando: python -m cli {' '.join(command)}")
+	print(f"Arranque total (mejor de {args.repeat}): {report['wall_ms']:.1f} ms "
+		  f"(presupuesto {args.budget_ms:.0f} ms)")
+	print(f"Imports: {report['import_ms']:.1f} ms")
+	for name, ms in report["top"]:
+		print(f"  {name:<24} {ms:8.1f} ms")
+	if report["heavy"]:
+		print(f"Módulos pesados cargados: {', '.join(report['heavy'])}")
+	if report["wall_ms"] > args.budget_ms:
+		print("Fuera de presupuesto")
+		return 1
+	return 0
+
+
+# =============================================================================
+# Línea de comandos
+# =============================================================================
+
+def build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(prog="python -m cli", description="Ejercicios y métodos de búsqueda de raíces")
+	commands = parser.add_subparsers(dest="command", required=True)
+
+	for n in range(1, 9):
+		sub = commands.add_parser(f"ex{n}", help=f"Ejercicio {n}")
+		sub.set_defaults(run=_run_exercise, exercise=n)
+		if n in (1, 2):
+			sub.add_argument("-p", type=int, required=True, help="exponente de la tolerancia 10^-p")
+		if n in (3, 4, 6):
+			sub.add_argument("--no-plot", action="store_true", help="solo tablas, sin gráficos")
+			sub.add_argument("--save", metavar="RUTA", help="guarda los gráficos en lugar de mostrarlos")
+
+	solve = commands.add_parser("solve", help="un método sobre un problema o una expresión")
+	solve.set_defaults(run=_run_solve)
+	solve.add_argument("method", choices=SOLVERS)
+	solve.add_argument("problem", nargs="?", help="problema de los ejercicios (ex1a, ex1b, ex2, ..., ex8)")
+	solve.add_argument("--expr", help="expresión en x, p. ej. \"x - exp(-x)\"")
+	solve.add_argument("--a", type=float, help="extremo izquierdo del intervalo")
+	solve.add_argument("--b", type=float, help="extremo derecho del intervalo")
+	solve.add_argument("--p0", type=float, help="punto inicial de Newton")
+	solve.add_argument("--x0", type=float, help="primer punto de la Secante")
+	solve.add_argument("--x1", type=float, help="segundo punto de la Secante")
+	solve.add_argument("--tol", type=float, default=1e-10)
+	solve.add_argument("--max-iter", type=int, default=100)
+	solve.add_argument("--table", action="store_true", help="imprime la tabla de iteraciones")
+
+	for name, module in (("bench", "benchmark"), ("sweep", "sweep"), ("async", "async_solvers")):
+		sub = commands.add_parser(name, help=f"{module}.py (los argumentos siguientes pasan tal cual)")
+		sub.set_defaults(run=_run_script(module))
+
+	startup = commands.add_parser("startup", help="mide el tiempo de arranque de un comando")
+	startup.set_defaults(run=_run_startup)
+	startup.add_argument("--budget-ms", type=float, default=80.0, help="presupuesto de arranque (ms)")
+	startup.add_argument("--repeat", type=int, default=5)
+	return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+	parser = build_parser()
+	args, rest = parser.parse_known_args(argv)
+	if rest and args.command not in ("bench", "sweep", "async", "startup"):
+		parser.error(f"argumentos no reconocidos: {' '.join(rest)}")
+	args.rest = [arg for arg in rest if arg != "--"] if args.command == "startup" else rest
+	return args.run(args)
+
+
+if __name__ == "__main__":
+	sys.exit(main())
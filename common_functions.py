@@ -3,46 +3,238 @@ Funciones comunes para los ejercicios de Cálculo Numérico.
 
 Incluye implementaciones genéricas de:
 - Método de Bisección (con historial opcional)
-- Método de Newton-Raphson (con historial)
+- Generadores de iteraciones (bisección, Newton, Secante) para consumir filas en streaming
+- Método de Bisección vectorizado sobre lotes de intervalos (NumPy)
+- Métodos de intervalo superlineales: Brent y Regula Falsi (Illinois)
+- k-sección: k-1 evaluaciones por ronda en paralelo (hilos o procesos)
+- Método de Newton-Raphson (con historial; derivada opcional por diferenciación automática;
+  detección de raíces múltiples con Newton modificado)
 - Método de la Secante (con historial)
+- Iteración de punto fijo (con historial)
+- Aceleración Δ² de Aitken / Steffensen y estimación del orden de convergencia observado
+- Modo de precisión adaptativa: float64 y luego refinamiento con mpmath/decimal
+- Continuación en un parámetro: arranque en caliente con predictor tangente y paso adaptativo
+- Métodos de Newton y Secante vectorizados sobre lotes de puntos iniciales y parámetros
+- Historial compacto de iteraciones (columnas `array('d')` y modo anillo)
+- Conteo de evaluaciones e instrumentación (tiempos por iteración y dentro de f/df)
+- Caché LRU de evaluaciones compartible entre métodos y gráficos
 - Utilidades para imprimir tablas de iteraciones
+- Exportación en bloque de historiales a texto, CSV, JSON lines y .npy/.npz
+- Evaluación vectorizada para gráficos con detección de polos y muestreo adaptativo
+- Búsqueda automática de todos los intervalos con cambio de signo en un dominio
+- Polinomios: evaluación de Horner, derivada por coeficientes y todas las raíces
+- Todas las raíces de una función suave por aproximación de Chebyshev (matriz colega)
+- Renderizado de gráficos sin pantalla (Agg) reutilizando la figura, en serie o en paralelo
 """
 
-from typing import Callable, List, Tuple, Optional
+import math
+from array import array
+from collections import OrderedDict
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import IO, TYPE_CHECKING, Callable, Dict, Generator, Iterator, List, Tuple, Optional
+
+from dual_math import value_and_derivative
+
+if TYPE_CHECKING:
+	from concurrent.futures import Executor
+	from decimal import Decimal
+
+	import numpy as np
+
+
+_EPS = 2.220446049250313e-16
+
+BISECTION_COLUMNS = ("n", "a", "b", "p", "f(p)", "(b-a)/2")
+ITERATIVE_COLUMNS = ("n", "x", "f(x)", "delta")
+
+
+# =============================================================================
+# Historial compacto
+# =============================================================================
+
+def bisection_iteration_bound(a: float, b: float, tol: float) -> int:
+	"""
+	Cota del Teorema 2.1: |p_n - p| <= (b-a)/2^n, por lo que bastan
+	n >= log2((b-a)/tol) iteraciones para alcanzar la tolerancia.
+	Requiere tol > 0.
+	"""
+	if tol <= 0:
+		raise ValueError("La cota requiere tol > 0")
+	if b - a <= tol:
+		return 0
+	return math.ceil(math.log2((b - a) / tol))
+
+
+class IterationHistory:
+	"""
+	Historial de iteraciones almacenado por columnas en arreglos `array`
+	preasignados, en lugar de una lista de tuplas.
+
+	Con `keep_last=N` funciona como un buffer circular: conserva solo las últimas
+	N filas y lleva un resumen (filas totales, primera fila, mínimo y máximo de
+	la última columna, sin contar la fila 0). Iterar o indexar devuelve tuplas con
+	el mismo formato que las listas de historial, por lo que sirve directamente
+	para las funciones de impresión y los gráficos de convergencia.
+	"""
+
+	def __init__(self, columns: Tuple[str, ...], capacity: int, keep_last: Optional[int] = None) -> None:
+		if keep_last is not None:
+			if keep_last < 1:
+				raise ValueError("keep_last debe ser un entero positivo")
+			capacity = keep_last
+		capacity = max(capacity, 1)
+		self.columns = tuple(columns)
+		self.keep_last = keep_last
+		self._capacity = capacity
+		self._n = array("q", bytes(8 * capacity))
+		self._data = [array("d", bytes(8 * capacity)) for _ in self.columns[1:]]
+		self._size = 0
+		self._start = 0
+		self.total_rows = 0
+		self.first: Optional[tuple] = None
+		self.min_last = math.inf
+		self.max_last = -math.inf
+
+	@classmethod
+	def for_bisection(
+		cls, a: float, b: float, tol: float, max_iter: int, keep_last: Optional[int] = None
+	) -> "IterationHistory":
+		"""
+		Historial de bisección con capacidad dada por la cota del Teorema 2.1. Con
+		tol <= 0 no hay cota y se usa max_iter; con keep_last la cota no se usa.
+		"""
+		if keep_last is not None or tol <= 0:
+			capacity = max_iter
+		else:
+			capacity = min(max_iter, bisection_iteration_bound(a, b, tol) + 1)
+		return cls(BISECTION_COLUMNS, capacity, keep_last)
+
+	@classmethod
+	def for_iterative(cls, max_iter: int, keep_last: Optional[int] = None) -> "IterationHistory":
+		"""Historial de Newton/Secante: max_iter filas más la fila inicial."""
+		return cls(ITERATIVE_COLUMNS, max_iter + 1, keep_last)
+
+	def _grow(self) -> None:
+		extra = self._capacity
+		self._n.extend(array("q", bytes(8 * extra)))
+		for col in self._data:
+			col.extend(array("d", bytes(8 * extra)))
+		self._capacity += extra
+
+	def append(self, row: tuple) -> None:
+		if self.keep_last is None:
+			if self._size == self._capacity:
+				self._grow()
+			pos = self._size
+			self._size += 1
+		elif self._size < self._capacity:
+			pos = (self._start + self._size) % self._capacity
+			self._size += 1
+		else:
+			pos = self._start
+			self._start = (self._start + 1) % self._capacity
+
+		self._n[pos] = row[0]
+		for col, value in zip(self._data, row[1:]):
+			col[pos] = value
+
+		if self.first is None:
+			self.first = tuple(row)
+		# La fila 0 de Newton/Secante no tiene delta real
+		if row[0] > 0:
+			last = row[-1]
+			if last < self.min_last:
+				self.min_last = last
+			if last > self.max_last:
+				self.max_last = last
+		self.total_rows += 1
+
+	def _pos(self, i: int) -> int:
+		return (self._start + i) % self._capacity
+
+	def __len__(self) -> int:
+		return self._size
+
+	def __getitem__(self, i: int) -> tuple:
+		if i < 0:
+			i += self._size
+		if not 0 <= i < self._size:
+			raise IndexError("índice de historial fuera de rango")
+		pos = self._pos(i)
+		return (self._n[pos],) + tuple(col[pos] for col in self._data)
+
+	def __iter__(self) -> Iterator[tuple]:
+		for i in range(self._size):
+			yield self[i]
+
+	def column(self, name: str) -> array:
+		"""Devuelve una columna (en orden cronológico) como `array`."""
+		j = self.columns.index(name)
+		source = self._n if j == 0 else self._data[j - 1]
+		if self._start == 0:
+			return source[: self._size]
+		end = self._start + self._size - self._capacity
+		return source[self._start:] + source[:end]
+
+	def as_arrays(self) -> Dict[str, "np.ndarray"]:
+		"""Columnas como arreglos NumPy (sin copiar fila por fila)."""
+		import numpy as np
+
+		return {name: np.frombuffer(self.column(name), dtype=np.int64 if j == 0 else float)
+				for j, name in enumerate(self.columns)}
+
+	def summary(self) -> Dict[str, object]:
+		"""Resumen del historial completo, incluidas las filas descartadas."""
+		return {
+			"total_rows": self.total_rows,
+			"dropped_rows": self.total_rows - self._size,
+			"first": self.first,
+			"last": self[-1] if self._size else None,
+			f"min {self.columns[-1]}": self.min_last,
+			f"max {self.columns[-1]}": self.max_last,
+		}
 
 
 # =============================================================================
 # Métodos de búsqueda de raíces
 # =============================================================================
 
-def bisection_method(
+def bisection_steps(
 	func: Callable[[float], float],
 	a: float,
 	b: float,
 	tol: float = 1e-5,
 	max_iter: int = 1000,
-	capture_history: bool = True,
-) -> Tuple[float, int, Optional[List[Tuple[int, float, float, float, float, float]]]]:
+) -> Generator[Tuple[int, float, float, float, float, float], None, Tuple[float, int]]:
 	"""
-	Método de la Bisección para localizar una raíz en [a, b].
+	Generador del Método de la Bisección: produce cada fila (n, a, b, p, f(p), (b-a)/2)
+	en cuanto se calcula, sin almacenar el historial.
 
-	Retorna (raíz_aprox, num_iter, historial) donde historial, si se captura,
-	es una lista de tuplas: (n, a, b, p, f(p), (b-a)/2).
+	Al agotarse, el valor de retorno del generador (StopIteration.value) es
+	(raíz_aprox, num_iter). El consumidor puede cortar la iteración cuando quiera.
+	Si f se anula en un extremo, ese extremo es la raíz y no hay iteraciones.
 	"""
 	fa = func(a)
 	fb = func(b)
 	if fa * fb > 0:
 		raise ValueError("La función no cambia de signo en el intervalo dado")
+	# Un extremo que ya es raíz se retorna sin iterar
+	if fa == 0:
+		return a, 0
+	if fb == 0:
+		return b, 0
 
-	history: Optional[List[Tuple[int, float, float, float, float, float]]] = [] if capture_history else None
 	iter_count = 0
 
 	while (b - a) / 2.0 > tol and iter_count < max_iter:
 		p = (a + b) / 2.0
+		# a y b son floats consecutivos: la precisión de float64 se agotó
+		if p == a or p == b:
+			break
 		fp = func(p)
 		iter_count += 1
-		if capture_history and history is not None:
-			history.append((iter_count, a, b, p, fp, (b - a) / 2.0))
+		yield (iter_count, a, b, p, fp, (b - a) / 2.0)
 		if fp == 0:
 			break
 		if fa * fp < 0:
@@ -52,95 +244,2280 @@ def bisection_method(
 			a = p
 			fa = fp
 
-	return (a + b) / 2.0, iter_count, history
+	return (a + b) / 2.0, iter_count
 
 
-def newton_method(
+def _drain(steps: Generator, history) -> tuple:
+	"""Consume un generador de pasos guardando las filas en `history` (si no es None)."""
+	while True:
+		try:
+			row = next(steps)
+		except StopIteration as stop:
+			return stop.value
+		if history is not None:
+			history.append(row)
+
+
+def bisection_method(
+	func: Callable[[float], float],
+	a: float,
+	b: float,
+	tol: float = 1e-5,
+	max_iter: int = 1000,
+	capture_history: bool = True,
+	compact: bool = False,
+	keep_last: Optional[int] = None,
+	adaptive_precision: bool = False,
+) -> Tuple[float, int, Optional[List[Tuple[int, float, float, float, float, float]]]]:
+	"""
+	Método de la Bisección para localizar una raíz en [a, b].
+
+	Retorna (raíz_aprox, num_iter, historial) donde historial, si se captura,
+	es una lista de tuplas: (n, a, b, p, f(p), (b-a)/2). Con `compact=True` o
+	`keep_last=N` el historial es un `IterationHistory` con las mismas filas.
+
+	Con `adaptive_precision=True` y una `tol` menor que la resolución de float64
+	cerca de la raíz, la bisección corre en float64 hasta agotar esa precisión y
+	los últimos pasos se hacen con Illinois en precisión extendida (ver
+	`extended_precision`) sobre el intervalo de pocos ulp que quedó (agrandado si
+	ahí no hay cambio de signo). `func` debe aceptar esos números sin pasar por
+	float64 (si no, TypeError); la raíz se retorna como `decimal.Decimal`. Si el
+	resultado no se puede certificar a `tol` (raíces planas), se duplican los
+	dígitos y se repite; ValueError si ni así se logra.
+	"""
+	history = _bracketing_history(a, b, tol, max_iter, capture_history, compact, keep_last)
+	root, iter_count = _drain(bisection_steps(func, a, b, tol, max_iter), history)
+	if adaptive_precision and tol < math.ulp(root) and iter_count < max_iter:
+		root, iter_count = _extended_bisection(func, a, b, root, tol, max_iter, iter_count, history)
+	return root, iter_count, history
+
+
+def _bracketing_history(
+	a: float, b: float, tol: float, max_iter: int,
+	capture_history: bool, compact: bool, keep_last: Optional[int],
+):
+	"""Historial de un método de intervalo: None, lista de filas o `IterationHistory`."""
+	if not capture_history:
+		return None
+	if compact or keep_last is not None:
+		return IterationHistory.for_bisection(a, b, tol, max_iter, keep_last)
+	return []
+
+
+def illinois_steps(
+	func: Callable[[float], float],
+	a: float,
+	b: float,
+	tol: float = 1e-5,
+	max_iter: int = 1000,
+) -> Generator[Tuple[int, float, float, float, float, float], None, Tuple[float, int]]:
+	"""
+	Generador del método de Regula Falsi modificado (Illinois).
+
+	Como Regula Falsi, toma el corte de la secante con el eje x y conserva el
+	intervalo con cambio de signo; si el mismo extremo queda retenido dos veces
+	seguidas, su valor de f se divide por 2, lo que evita el estancamiento de un
+	extremo y da convergencia superlineal. Si aun así el intervalo no se reduce a
+	la mitad en cuatro pasos se hace un paso de bisección, de modo que nunca es mucho
+	más lento que la bisección. Produce filas con el formato de la bisección:
+	(n, a, b, p, f(p), (b-a)/2), con [a, b] el intervalo antes del paso.
+
+	Se detiene cuando |b - a| <= tol, así el último iterado dista de la raíz a lo
+	sumo tol. El valor de retorno del generador es (raíz, iteraciones).
+	"""
+	fa = func(a)
+	fb = func(b)
+	if fa * fb > 0:
+		raise ValueError("La función no cambia de signo en el intervalo dado")
+	if fa == 0:
+		return a, 0
+	if fb == 0:
+		return b, 0
+
+	iter_count = 0
+	p = b
+	# Salvaguarda: si el intervalo no se redujo a la mitad en cuatro pasos, se bisecta
+	width_ref = abs(b - a)
+	stalled = 0
+	while abs(b - a) > tol and iter_count < max_iter:
+		bisect = stalled >= 4
+		# Literales enteros: el mismo código sirve con mpmath.mpf o decimal.Decimal
+		p = (a + b) / 2 if bisect else b - fb * (b - a) / (fb - fa)
+		fp = func(p)
+		iter_count += 1
+		yield (iter_count, min(a, b), max(a, b), p, fp, abs(b - a) / 2)
+		if fp == 0:
+			break
+		if fp * fb < 0:
+			a, fa = b, fb
+		elif not bisect:
+			fa = fa / 2
+		b, fb = p, fp
+		if abs(b - a) <= width_ref / 2:
+			width_ref = abs(b - a)
+			stalled = 0
+		else:
+			stalled += 1
+
+	return p, iter_count
+
+
+def ksection_steps(
+	func: Callable[[float], float],
+	a: float,
+	b: float,
+	tol: float = 1e-5,
+	max_iter: int = 1000,
+	k: int = 4,
+	executor: Optional["Executor"] = None,
+) -> Generator[Tuple[int, float, float, float, float, float], None, Tuple[float, int]]:
+	"""
+	Generador del método de k-sección: en cada ronda evalúa los k-1 puntos interiores
+	equiespaciados de [a, b] (en paralelo con `executor.map` si se indica un
+	`concurrent.futures.Executor`) y conserva el subintervalo con cambio de signo.
+	El intervalo se divide por k en cada ronda, así que hacen falta log_k((b-a)/tol)
+	rondas en lugar de log_2; con k=2 es la bisección.
+
+	Produce una fila por ronda con el formato de la bisección (n, a, b, p, f(p),
+	(b-a)/2), con [a, b] el intervalo antes de la ronda y p el punto interior que
+	quedó como extremo del nuevo intervalo (el de menor |f| si son dos). El valor de
+	retorno del generador es (raíz_aprox, num_rondas). Si f se anula en un extremo
+	retorna ese extremo; si f no es finita en algún punto, ValueError.
+	"""
+	if k < 2:
+		raise ValueError("k debe ser al menos 2")
+	fa = func(a)
+	fb = func(b)
+	if not (math.isfinite(fa) and math.isfinite(fb)):
+		raise ValueError(f"f no es finita en los extremos: f({a}) = {fa}, f({b}) = {fb}")
+	if fa * fb > 0:
+		raise ValueError("La función no cambia de signo en el intervalo dado")
+	if fa == 0:
+		return a, 0
+	if fb == 0:
+		return b, 0
+
+	evaluate = executor.map if executor is not None else map
+	iter_count = 0
+
+	while (b - a) / 2.0 > tol and iter_count < max_iter:
+		h = (b - a) / k
+		points = [a + i * h for i in range(1, k)]
+		# Puntos repetidos o iguales a un extremo: la precisión de float64 se agotó
+		if points[0] <= a or points[-1] >= b or any(x1 >= x2 for x1, x2 in zip(points, points[1:])):
+			break
+		values = list(evaluate(func, points))
+		iter_count += 1
+		if not all(math.isfinite(v) for v in values):
+			raise ValueError(f"f no es finita en algún punto interior de [{a}, {b}]")
+
+		xs = [a] + points + [b]
+		fs = [fa] + values + [fb]
+		zero = next((i for i in range(1, k) if fs[i] == 0), None)
+		if zero is not None:
+			yield (iter_count, a, b, xs[zero], 0.0, (b - a) / 2.0)
+			return xs[zero], iter_count
+		i = next(i for i in range(k) if fs[i] * fs[i + 1] < 0)
+		# Extremo interior del nuevo intervalo con menor |f|
+		inner = [j for j in (i, i + 1) if 0 < j < k]
+		j = min(inner, key=lambda j: abs(fs[j]))
+		yield (iter_count, a, b, xs[j], fs[j], (b - a) / 2.0)
+		a, fa, b, fb = xs[i], fs[i], xs[i + 1], fs[i + 1]
+
+	return (a + b) / 2.0, iter_count
+
+
+def brent_steps(
+	func: Callable[[float], float],
+	a: float,
+	b: float,
+	tol: float = 1e-5,
+	max_iter: int = 1000,
+) -> Generator[Tuple[int, float, float, float, float, float], None, Tuple[float, int]]:
+	"""
+	Generador del Método de Brent: combina interpolación cuadrática inversa,
+	secante y bisección, manteniendo siempre un intervalo con cambio de signo.
+
+	Acepta el paso interpolado solo si cae dentro del intervalo y reduce lo
+	suficiente respecto del paso anterior; si no, bisecta. Así conserva la garantía
+	de la bisección pero converge superlinealmente cuando f es suave. Produce filas
+	con el formato de la bisección: (n, a, b, p, f(p), (b-a)/2).
+
+	Se detiene cuando el intervalo que encierra la raíz mide a lo sumo tol. El valor
+	de retorno del generador es (raíz, iteraciones).
+	"""
+	fa = func(a)
+	fb = func(b)
+	if fa * fb > 0:
+		raise ValueError("La función no cambia de signo en el intervalo dado")
+
+	c, fc = a, fa
+	d = e = b - a
+	iter_count = 0
+
+	while iter_count < max_iter:
+		if fb * fc > 0:
+			c, fc = a, fa
+			d = e = b - a
+		if abs(fc) < abs(fb):
+			a, b, c = b, c, b
+			fa, fb, fc = fb, fc, fb
+
+		tol1 = 2.0 * _EPS * abs(b) + 0.5 * tol
+		m = (c - b) / 2.0
+		if abs(m) <= tol1 or fb == 0:
+			break
+
+		if abs(e) >= tol1 and abs(fa) > abs(fb):
+			s = fb / fa
+			if a == c:
+				# Secante
+				p = 2.0 * m * s
+				q = 1.0 - s
+			else:
+				# Interpolación cuadrática inversa
+				q = fa / fc
+				r = fb / fc
+				p = s * (2.0 * m * q * (q - r) - (b - a) * (r - 1.0))
+				q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+			if p > 0:
+				q = -q
+			else:
+				p = -p
+			if 2.0 * p < min(3.0 * m * q - abs(tol1 * q), abs(e * q)):
+				e, d = d, p / q
+			else:
+				d = e = m
+		else:
+			d = e = m
+
+		lo, hi = min(b, c), max(b, c)
+		a, fa = b, fb
+		b += d if abs(d) > tol1 else math.copysign(tol1, m)
+		fb = func(b)
+		iter_count += 1
+		yield (iter_count, lo, hi, b, fb, (hi - lo) / 2.0)
+
+	return b, iter_count
+
+
+def illinois_method(
+	func: Callable[[float], float],
+	a: float,
+	b: float,
+	tol: float = 1e-5,
+	max_iter: int = 1000,
+	capture_history: bool = True,
+	compact: bool = False,
+	keep_last: Optional[int] = None,
+) -> Tuple[float, int, Optional[List[Tuple[int, float, float, float, float, float]]]]:
+	"""
+	Regula Falsi (Illinois) en [a, b]. Misma firma e historial que `bisection_method`.
+	"""
+	history = _bracketing_history(a, b, tol, max_iter, capture_history, compact, keep_last)
+	root, iter_count = _drain(illinois_steps(func, a, b, tol, max_iter), history)
+	return root, iter_count, history
+
+
+def brent_method(
+	func: Callable[[float], float],
+	a: float,
+	b: float,
+	tol: float = 1e-5,
+	max_iter: int = 1000,
+	capture_history: bool = True,
+	compact: bool = False,
+	keep_last: Optional[int] = None,
+) -> Tuple[float, int, Optional[List[Tuple[int, float, float, float, float, float]]]]:
+	"""
+	Método de Brent en [a, b]. Misma firma e historial que `bisection_method`.
+	"""
+	history = _bracketing_history(a, b, tol, max_iter, capture_history, compact, keep_last)
+	root, iter_count = _drain(brent_steps(func, a, b, tol, max_iter), history)
+	return root, iter_count, history
+
+
+def ksection_method(
+	func: Callable[[float], float],
+	a: float,
+	b: float,
+	tol: float = 1e-5,
+	max_iter: int = 1000,
+	capture_history: bool = True,
+	compact: bool = False,
+	keep_last: Optional[int] = None,
+	k: Optional[int] = None,
+	executor: Optional["Executor"] = None,
+) -> Tuple[float, int, Optional[List[Tuple[int, float, float, float, float, float]]]]:
+	"""
+	k-sección en [a, b] (ver `ksection_steps`). Misma firma e historial que
+	`bisection_method`, con una fila por ronda.
+
+	Por defecto k = núcleos + 1 y, si no se pasa `executor`, los k-1 puntos de cada
+	ronda se evalúan en un `ThreadPoolExecutor` propio: conviene cuando f es cara y
+	libera el GIL (E/S, NumPy, código nativo). Para f en Python puro se puede pasar
+	un `ProcessPoolExecutor` (f debe poder serializarse con pickle).
+	"""
+	import os
+	from concurrent.futures import ThreadPoolExecutor
+
+	if k is None:
+		k = (os.cpu_count() or 1) + 1
+	history = _bracketing_history(a, b, tol, max_iter, capture_history, compact, keep_last)
+	if executor is not None:
+		root, iter_count = _drain(ksection_steps(func, a, b, tol, max_iter, k, executor), history)
+	else:
+		with ThreadPoolExecutor(max_workers=k - 1) as pool:
+			root, iter_count = _drain(ksection_steps(func, a, b, tol, max_iter, k, pool), history)
+	return root, iter_count, history
+
+
+def _flatten_batch(*arrays) -> Tuple[Tuple[int, ...], List["np.ndarray"]]:
+	"""
+	Difunde (broadcast) los arreglos a una forma común y devuelve esa forma junto
+	con copias planas en float64, listas para ser modificadas por índice.
+	"""
+	import numpy as np
+
+	broadcast = np.broadcast_arrays(*[np.asarray(arr, dtype=float) for arr in arrays])
+	shape = broadcast[0].shape
+	return shape, [np.array(arr, dtype=float).ravel() for arr in broadcast]
+
+
+def _eval_batch(func: Callable, x: "np.ndarray", params: List["np.ndarray"], idx=None) -> "np.ndarray":
+	"""Evalúa `func` sobre `x` pasando los parámetros restringidos a los índices `idx`."""
+	import numpy as np
+
+	if idx is not None:
+		params = [q[idx] for q in params]
+	return np.broadcast_to(np.asarray(func(x, *params), dtype=float), x.shape)
+
+
+def bisection_batch(
+	func: Callable[["np.ndarray"], "np.ndarray"],
+	a: "np.ndarray",
+	b: "np.ndarray",
+	tol: float = 1e-5,
+	max_iter: int = 1000,
+	args: Tuple = (),
+) -> Tuple["np.ndarray", "np.ndarray"]:
+	"""
+	Método de la Bisección aplicado en paralelo a muchos intervalos [a_i, b_i].
+
+	`func` debe estar vectorizada: recibe un arreglo de puntos (y, si se pasan en
+	`args`, los parámetros de cada elemento) y devuelve un arreglo de valores.
+	Todos los intervalos avanzan a la vez con una sola llamada a `func` por
+	iteración, evaluada únicamente sobre los intervalos que siguen activos; cada
+	intervalo se retira cuando (b-a)/2 <= tol o cuando f(p) == 0. Si f se anula en
+	un extremo, ese extremo es la raíz (sin iteraciones).
+
+	Retorna (raíces, iteraciones) con la forma de `a` y `b` difundidos.
+	"""
+	import numpy as np
+
+	shape, (a, b, *params) = _flatten_batch(a, b, *args)
+	fa = _eval_batch(func, a, params).copy()
+	fb = _eval_batch(func, b, params)
+	bad = fa * fb > 0
+	if np.any(bad):
+		raise ValueError(
+			f"La función no cambia de signo en los intervalos con índices {np.flatnonzero(bad).tolist()}"
+		)
+
+	# Un extremo que ya es raíz colapsa su intervalo a ese punto
+	at_a = fa == 0
+	b[at_a] = a[at_a]
+	at_b = ~at_a & (fb == 0)
+	a[at_b] = b[at_b]
+
+	iters = np.zeros(a.shape, dtype=int)
+	active = (b - a) / 2.0 > tol
+	iter_count = 0
+
+	while iter_count < max_iter and active.any():
+		idx = np.flatnonzero(active)
+		p = (a[idx] + b[idx]) / 2.0
+		fp = _eval_batch(func, p, params, idx)
+		iter_count += 1
+		iters[idx] = iter_count
+
+		# Con f(p) == 0 el intervalo queda congelado y (a+b)/2 es exactamente p
+		zero = fp == 0
+		left = ~zero & (fa[idx] * fp < 0)
+		right = ~zero & ~left
+		b[idx[left]] = p[left]
+		a[idx[right]] = p[right]
+		fa[idx[right]] = fp[right]
+
+		active[idx] = ~zero & ((b[idx] - a[idx]) / 2.0 > tol)
+
+	return ((a + b) / 2.0).reshape(shape), iters.reshape(shape)
+
+
+def _iterative_history(max_iter: int, compact: bool, keep_last: Optional[int]):
+	"""Lista de filas o `IterationHistory` según el modo pedido."""
+	if compact or keep_last is not None:
+		return IterationHistory.for_iterative(max_iter, keep_last)
+	return []
+
+
+def _is_finite(x) -> bool:
+	"""math.isfinite para float, mpmath.mpf o decimal.Decimal (otros tipos cuentan como finitos)."""
+	try:
+		return math.isfinite(x)
+	except (TypeError, OverflowError):
+		return True
+
+
+def _multiplicity_from_steps(step_prev: float, step: float, m: float) -> Optional[float]:
+	"""
+	Multiplicidad M estimada a partir de dos pasos con signo de x_{n+1} = x_n - m·f/f'.
+	Cerca de una raíz de multiplicidad M el cociente de pasos tiende a 1 - m/M.
+	"""
+	if step_prev == 0:
+		return None
+	ratio = step / step_prev
+	if ratio >= 1:
+		return None
+	return m / (1.0 - ratio)
+
+
+# Pasos consecutivos (con |f| decreciente y cociente estable) que exige la detección
+_MULTIPLICITY_WINDOW = 3
+
+
+def _asymptotic_multiplicity(steps: List[float], values: List[float], m: float) -> Optional[int]:
+	"""
+	Multiplicidad detectada a partir de los últimos pasos y valores |f| del Newton
+	con factor m, o None si la iteración todavía no está en régimen asintótico:
+	hace falta que |f| decrezca y los pasos se achiquen sin cambiar de signo
+	durante `_MULTIPLICITY_WINDOW` pasos, con cocientes estables que redondeen
+	todos al mismo entero.
+	"""
+	if len(steps) < _MULTIPLICITY_WINDOW + 1:
+		return None
+	if any(later >= earlier for earlier, later in zip(values, values[1:])):
+		return None
+	ratios = [later / earlier for earlier, later in zip(steps, steps[1:])]
+	if any(not 0 < r < 1 for r in ratios) or max(ratios) - min(ratios) > 0.05:
+		return None
+	estimates = [_multiplicity_from_steps(earlier, later, m) for earlier, later in zip(steps, steps[1:])]
+	rounded = {round(e) for e in estimates}
+	if len(rounded) != 1 or any(abs(e - round(e)) >= 0.2 for e in estimates):
+		return None
+	return max(1, rounded.pop())
+
+
+def estimate_multiplicity(history) -> Optional[int]:
+	"""
+	Estima la multiplicidad de la raíz a partir de las tres últimas filas de un
+	historial del Método de Newton clásico: con una raíz de multiplicidad m la
+	convergencia es lineal con razón 1 - 1/m. Retorna None si no hay filas
+	suficientes o los pasos no decrecen.
+	"""
+	if len(history) < 3:
+		return None
+	x0, x1, x2 = (history[i][1] for i in range(len(history) - 3, len(history)))
+	m = _multiplicity_from_steps(x1 - x0, x2 - x1, 1.0)
+	return None if m is None else max(1, round(m))
+
+
+def newton_steps(
 	f: Callable[[float], float],
-	df: Callable[[float], float],
+	df: Optional[Callable[[float], float]],
 	p0: float,
 	tol: float = 1e-4,
 	max_iter: int = 50,
-) -> Tuple[float, int, List[Tuple[int, float, float, float]]]:
+	multiplicity: Optional[int] = 1,
+) -> Generator[Tuple[int, float, float, float], None, Tuple[float, int]]:
 	"""
-	Método de Newton-Raphson con historial de iteraciones.
+	Generador del Método de Newton-Raphson: produce las filas (n, x_n, f(x_n), delta)
+	a medida que se calculan, empezando por (0, p0, f(p0), 0.0).
 
-	Retorna (raíz, iteraciones, historial) donde historial contiene
-	(n, x_n, f(x_n), delta) y la primera fila es (0, p0, f(p0)).
+	Con `df=None` la derivada se obtiene por diferenciación automática (números
+	duales, ver `dual_math`): cada punto se evalúa una sola vez y da f y f' juntos.
+
+	Con `multiplicity=m` se usa el Newton modificado x - m·f/f', que converge
+	cuadráticamente a raíces de multiplicidad m. Con `multiplicity=None` la
+	multiplicidad se detecta durante la iteración: el cociente de dos pasos
+	consecutivos tiende a 1 - m/M, de donde se estima M. La estimación solo se
+	acepta en régimen asintótico (ver `_asymptotic_multiplicity`): lejos de la
+	raíz el término de mayor grado domina y el cociente imita una raíz múltiple.
+	Si con el nuevo factor |f| deja de decrecer, los pasos dejan de achicarse o
+	alternan de signo sin reducirse a la mitad, si el primer paso modificado no
+	deja un paso clásico menor, o si f desborda o da un valor no finito, se vuelve
+	a m = 1 desde el punto donde se cambió el factor y la detección queda
+	desactivada.
+
+	El valor de retorno del generador es (raíz, iteraciones).
 	"""
-	rows: List[Tuple[int, float, float, float]] = []
+	m = 1 if multiplicity is None else multiplicity
+	detect = multiplicity is None
+	# Resolución relativa de float64 (no aplica a mpmath.mpf ni decimal.Decimal)
+	resolution = _EPS if isinstance(p0, (int, float, complex)) else 0
+	steps: List[float] = []
+	values: List[float] = []
+	switched = probation = False
 	p = p0
-	rows.append((0, p, f(p), 0.0))
+	if df is None:
+		fp, dfp = value_and_derivative(f, p)
+	else:
+		fp, dfp = f(p), None
+	n = 0
+	yield (0, p, fp, 0.0)
 	for n in range(1, max_iter + 1):
-		fp = f(p)
-		dfp = df(p)
+		if dfp is None:
+			dfp = df(p)
 		if dfp == 0:
 			break
-		p_new = p - fp / dfp
+		p_new = p - m * fp / dfp
 		delta = abs(p_new - p)
-		rows.append((n, p_new, f(p_new), delta))
+		# f(p_new) se reutiliza en la siguiente iteración: una sola evaluación por punto
+		try:
+			if df is None:
+				fp_new, dfp_new = value_and_derivative(f, p_new)
+			else:
+				fp_new, dfp_new = f(p_new), None
+			if switched and probation and dfp_new is None:
+				# f'(p_new) se pide ya para el período de prueba y se reutiliza después
+				dfp_new = df(p_new)
+		except (OverflowError, ZeroDivisionError):
+			if not switched:
+				raise
+			# El paso con el nuevo factor salió del dominio numérico de f
+			m, detect, switched = 1, False, False
+			p, fp, dfp = anchor
+			continue
+		if switched and not (_is_finite(p_new) and _is_finite(fp_new)):
+			m, detect, switched = 1, False, False
+			p, fp, dfp = anchor
+			continue
+		yield (n, p_new, fp_new, delta)
 		if delta < tol:
-			return p_new, n, rows
-		p = p_new
-	return p, n, rows
+			return p_new, n
+		# El paso ya está por debajo de la resolución de float64: no puede mejorar
+		if resolution and delta <= resolution * abs(p_new):
+			return p_new, n
+		if detect:
+			step = p_new - p
+			if switched:
+				# El factor m no acelera: se vuelve al Newton clásico. Un paso que
+				# alterna de signo se tolera solo si se achica a menos de la mitad
+				# (el Newton modificado puede pasarse apenas de una raíz múltiple).
+				# En el primer paso con el nuevo factor se exige además que el paso
+				# clásico siguiente sea menor: lejos de una raíz simple el cociente
+				# de pasos imita una raíz múltiple y el paso m·f/f' cae muy lejos.
+				shrink = abs(step) / abs(steps[-1])
+				rejected = abs(fp_new) >= abs(fp) or shrink >= 1 or (step * steps[-1] < 0 and shrink > 0.5)
+				if probation and not rejected:
+					# f(p_new) = 0 es la raíz exacta: no hay paso siguiente que comparar
+					rejected = fp_new != 0 and (dfp_new == 0 or not abs(fp_new / dfp_new) < abs(step))
+					probation = False
+				if rejected:
+					m, detect, switched = 1, False, False
+					p, fp, dfp = anchor
+					continue
+				steps[-1] = step
+			else:
+				steps = steps[-_MULTIPLICITY_WINDOW:] + [step]
+				values = values[-_MULTIPLICITY_WINDOW:] + [abs(fp_new)]
+				detected = _asymptotic_multiplicity(steps, values, m)
+				if detected is not None and detected != m:
+					# Paso que habría dado el nuevo factor, para comparar el siguiente
+					steps[-1] *= detected / m
+					m, switched, probation = detected, True, True
+					anchor = (p_new, fp_new, dfp_new)
+		p, fp, dfp = p_new, fp_new, dfp_new
+	return p, n
 
 
-def secant_method(
+def newton_method(
 	f: Callable[[float], float],
-	x0: float,
-	x1: float,
+	df: Optional[Callable[[float], float]],
+	p0: float,
 	tol: float = 1e-4,
 	max_iter: int = 50,
+	compact: bool = False,
+	keep_last: Optional[int] = None,
+	multiplicity: Optional[int] = 1,
+	adaptive_precision: bool = False,
 ) -> Tuple[float, int, List[Tuple[int, float, float, float]]]:
 	"""
-	Método de la Secante con historial de iteraciones.
+	Método de Newton-Raphson con historial de iteraciones.
 
 	Retorna (raíz, iteraciones, historial) donde historial contiene
-	(n, x_n, f(x_n), delta) y las dos primeras filas corresponden a x0 y x1.
+	(n, x_n, f(x_n), delta) y la primera fila es (0, p0, f(p0)). Con
+	`compact=True` o `keep_last=N` el historial es un `IterationHistory`.
+	Con `df=None` la derivada se calcula por diferenciación automática.
+	Con `multiplicity=None` se detecta la multiplicidad de la raíz y se pasa al
+	Newton modificado (ver `newton_steps`).
+
+	Con `adaptive_precision=True` y una `tol` menor que la resolución de float64
+	cerca de la raíz, Newton itera en float64 hasta que el paso cae por debajo de
+	esa resolución y continúa desde allí en precisión extendida (ver
+	`extended_precision`); al ser cuadrático bastan uno o dos pasos más. `f` y `df`
+	deben aceptar esos números y `f` no debe pasar por float64 (TypeError); la raíz
+	se retorna como `decimal.Decimal`, certificada como en `bisection_method`.
+	"""
+	rows = _iterative_history(max_iter, compact, keep_last)
+	root, n = _drain(newton_steps(f, df, p0, tol, max_iter, multiplicity), rows)
+	if adaptive_precision and tol < math.ulp(root) and n < max_iter:
+		root, n = _extended_newton(f, df, root, tol, max_iter, n, multiplicity, rows)
+	return root, n, rows
+
+
+def secant_steps(
+	f: Callable[[float], float],
+	x0: float,
+	x1: float,
+	tol: float = 1e-4,
+	max_iter: int = 50,
+) -> Generator[Tuple[int, float, float, float], None, Tuple[float, int]]:
+	"""
+	Generador del Método de la Secante: produce las filas (n, x_n, f(x_n), delta)
+	a medida que se calculan; las dos primeras corresponden a x0 y x1.
+
+	El valor de retorno del generador es (raíz, iteraciones).
 	"""
-	rows: List[Tuple[int, float, float, float]] = []
 	f0 = f(x0)
 	f1 = f(x1)
-	rows.append((0, x0, f0, 0.0))
-	rows.append((1, x1, f1, abs(x1 - x0)))
+	n = 1
+	yield (0, x0, f0, 0.0)
+	yield (1, x1, f1, abs(x1 - x0))
 	for n in range(2, max_iter + 1):
 		if (f1 - f0) == 0:
 			break
 		x2 = x1 - f1 * (x1 - x0) / (f1 - f0)
 		delta = abs(x2 - x1)
-		rows.append((n, x2, f(x2), delta))
+		f2 = f(x2)
+		yield (n, x2, f2, delta)
 		if delta < tol:
-			return x2, n, rows
+			return x2, n
 		x0, f0 = x1, f1
-		x1, f1 = x2, f(x2)
-	return x1, n, rows
+		x1, f1 = x2, f2
+	return x1, n
 
 
-# =============================================================================
-# Impresión de tablas
-# =============================================================================
+def secant_method(
+	f: Callable[[float], float],
+	x0: float,
+	x1: float,
+	tol: float = 1e-4,
+	max_iter: int = 50,
+	compact: bool = False,
+	keep_last: Optional[int] = None,
+) -> Tuple[float, int, List[Tuple[int, float, float, float]]]:
+	"""
+	Método de la Secante con historial de iteraciones.
 
-def print_iteration_table(title: str, rows: List[Tuple[int, float, float, float]]) -> None:
-	"""Imprime una tabla genérica para métodos iterativos (Newton/Secante)."""
-	print("\n" + title)
-	print(f"{'n':>2} {'x':>14} {'f(x)':>15} {'delta':>12}")
-	print("-" * 45)
-	for n, x, fx, delta in rows:
-		if n == 0:
-			print(f"{n:2d} {x:14.7f} {fx:15.7e} {'':12}")
-		else:
-			print(f"{n:2d} {x:14.7f} {fx:15.7e} {delta:12.7e}")
-	print("-" * 45)
+	Retorna (raíz, iteraciones, historial) donde historial contiene
+	(n, x_n, f(x_n), delta) y las dos primeras filas corresponden a x0 y x1.
+	Con `compact=True` o `keep_last=N` el historial es un `IterationHistory`.
+	"""
+	rows = _iterative_history(max_iter, compact, keep_last)
+	root, n = _drain(secant_steps(f, x0, x1, tol, max_iter), rows)
+	return root, n, rows
 
 
-def print_bisection_table(label: str, history: List[Tuple[int, float, float, float, float, float]]) -> None:
-	"""
+def fixed_point_steps(
+	g: Callable[[float], float],
+	p0: float,
+	tol: float = 1e-4,
+	max_iter: int = 50,
+) -> Generator[Tuple[int, float, float, float], None, Tuple[float, int]]:
+	"""
+	Generador de la iteración de punto fijo p_{n+1} = g(p_n): produce las filas
+	(n, p_n, g(p_n) - p_n, delta), empezando por (0, p0, g(p0) - p0, 0.0).
+
+	La columna f(x) es el residuo g(p) - p, que se anula en el punto fijo; g(p_n)
+	se reutiliza como p_{n+1}, así que hay una sola evaluación de g por iteración.
+
+	El valor de retorno del generador es (punto fijo, iteraciones).
+	"""
+	p = p0
+	gp = g(p)
+	n = 0
+	yield (0, p, gp - p, 0.0)
+	for n in range(1, max_iter + 1):
+		p_new = gp
+		delta = abs(p_new - p)
+		gp = g(p_new)
+		yield (n, p_new, gp - p_new, delta)
+		if delta < tol:
+			return p_new, n
+		p = p_new
+	return p, n
+
+
+def fixed_point_method(
+	g: Callable[[float], float],
+	p0: float,
+	tol: float = 1e-4,
+	max_iter: int = 50,
+	compact: bool = False,
+	keep_last: Optional[int] = None,
+) -> Tuple[float, int, List[Tuple[int, float, float, float]]]:
+	"""
+	Iteración de punto fijo con historial de iteraciones.
+
+	Retorna (punto fijo, iteraciones, historial) donde historial contiene
+	(n, p_n, g(p_n) - p_n, delta). Con `compact=True` o `keep_last=N` el
+	historial es un `IterationHistory`.
+	"""
+	rows = _iterative_history(max_iter, compact, keep_last)
+	root, n = _drain(fixed_point_steps(g, p0, tol, max_iter), rows)
+	return root, n, rows
+
+
+def newton_batch(
+	f: Callable[..., "np.ndarray"],
+	df: Callable[..., "np.ndarray"],
+	p0: "np.ndarray",
+	tol: float = 1e-4,
+	max_iter: int = 50,
+	args: Tuple = (),
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+	"""
+	Método de Newton-Raphson aplicado en paralelo a un lote de puntos iniciales.
+
+	`f` y `df` deben estar vectorizadas y recibir (x, *args), donde cada parámetro de
+	`args` se difunde con `p0` (por ejemplo f(x, c) = x*x - c para muchos c). En cada
+	iteración se hace una sola evaluación de `f` y de `df` sobre los elementos activos.
+
+	Retorna (raíces, iteraciones, convergió, derivada_nula) con la forma difundida;
+	`derivada_nula` marca los elementos que se detuvieron por df(p) == 0.
+	"""
+	import numpy as np
+
+	shape, (p, *params) = _flatten_batch(p0, *args)
+	iters = np.zeros(p.shape, dtype=int)
+	converged = np.zeros(p.shape, dtype=bool)
+	breakdown = np.zeros(p.shape, dtype=bool)
+	active = np.ones(p.shape, dtype=bool)
+
+	for n in range(1, max_iter + 1):
+		idx = np.flatnonzero(active)
+		if idx.size == 0:
+			break
+		x = p[idx]
+		fx = _eval_batch(f, x, params, idx)
+		dfx = _eval_batch(df, x, params, idx)
+		iters[idx] = n
+
+		zero = dfx == 0
+		with np.errstate(divide="ignore", invalid="ignore"):
+			x_new = x - fx / dfx
+		done = ~zero & (np.abs(x_new - x) < tol)
+		p[idx[~zero]] = x_new[~zero]
+		converged[idx[done]] = True
+		breakdown[idx[zero]] = True
+		active[idx[zero | done]] = False
+
+	return p.reshape(shape), iters.reshape(shape), converged.reshape(shape), breakdown.reshape(shape)
+
+
+def secant_batch(
+	f: Callable[..., "np.ndarray"],
+	x0: "np.ndarray",
+	x1: "np.ndarray",
+	tol: float = 1e-4,
+	max_iter: int = 50,
+	args: Tuple = (),
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+	"""
+	Método de la Secante aplicado en paralelo a un lote de pares iniciales (x0, x1).
+
+	`f` debe estar vectorizada y recibir (x, *args) como en `newton_batch`. Tras las
+	evaluaciones iniciales, cada iteración hace una sola llamada a `f` sobre los
+	elementos que siguen activos.
+
+	Retorna (raíces, iteraciones, convergió, secante_plana) con la forma difundida;
+	`secante_plana` marca los elementos que se detuvieron por f(x1) - f(x0) == 0.
+	"""
+	import numpy as np
+
+	shape, (x0, x1, *params) = _flatten_batch(x0, x1, *args)
+	f0 = _eval_batch(f, x0, params).copy()
+	f1 = _eval_batch(f, x1, params).copy()
+	iters = np.ones(x1.shape, dtype=int)
+	converged = np.zeros(x1.shape, dtype=bool)
+	breakdown = np.zeros(x1.shape, dtype=bool)
+	active = np.ones(x1.shape, dtype=bool)
+
+	for n in range(2, max_iter + 1):
+		idx = np.flatnonzero(active)
+		if idx.size == 0:
+			break
+		denom = f1[idx] - f0[idx]
+		iters[idx] = n
+
+		flat = denom == 0
+		with np.errstate(divide="ignore", invalid="ignore"):
+			x2 = x1[idx] - f1[idx] * (x1[idx] - x0[idx]) / denom
+		done = ~flat & (np.abs(x2 - x1[idx]) < tol)
+		x1[idx[done]] = x2[done]
+		converged[idx[done]] = True
+		breakdown[idx[flat]] = True
+		active[idx[flat | done]] = False
+
+		cont = ~flat & ~done
+		ci = idx[cont]
+		x0[ci] = x1[ci]
+		f0[ci] = f1[ci]
+		x1[ci] = x2[cont]
+		f1[ci] = _eval_batch(f, x1[ci], params, ci)
+
+	return x1.reshape(shape), iters.reshape(shape), converged.reshape(shape), breakdown.reshape(shape)
+
+
+# =============================================================================
+# Aceleración de convergencia
+# =============================================================================
+
+def _order_from_deltas(d1: float, d2: float, d3: float) -> Tuple[Optional[float], Optional[float]]:
+	"""Orden q y constante λ de e_{n+1} ≈ λ·e_n^q a partir de tres deltas consecutivos."""
+	if d1 <= 0 or d2 <= 0 or d3 <= 0 or d1 == d2:
+		return None, None
+	order = math.log(d3 / d2) / math.log(d2 / d1)
+	try:
+		rate = d3 / d2 ** order
+	except (OverflowError, ZeroDivisionError):
+		return order, None
+	return order, rate
+
+
+def estimate_order(history) -> Tuple[Optional[float], Optional[float]]:
+	"""
+	Estima el orden de convergencia observado q y la constante asintótica λ
+	(e_{n+1} ≈ λ·e_n^q) con los tres últimos deltas de un historial de
+	Newton/Secante/punto fijo, tomando |x_{n+1} - x_n| como estimación del error.
+
+	q ≈ 1 indica convergencia lineal (λ es entonces la razón), q ≈ 1.618 la de la
+	Secante y q ≈ 2 la de Newton. Retorna (None, None) si no hay deltas suficientes
+	o alguno es nulo.
+	"""
+	deltas = [history[i][-1] for i in range(max(len(history) - 3, 0), len(history)) if history[i][0] > 0]
+	if len(deltas) < 3:
+		return None, None
+	return _order_from_deltas(*deltas[-3:])
+
+
+def aitken_extrapolate(x0: float, x1: float, x2: float) -> Optional[float]:
+	"""
+	Extrapolación Δ² de Aitken: x̂ = x2 - (x2 - x1)² / (x2 - 2·x1 + x0).
+	Retorna None si la segunda diferencia se anula.
+	"""
+	denom = x2 - 2.0 * x1 + x0
+	if denom == 0:
+		return None
+	return x2 - (x2 - x1) ** 2 / denom
+
+
+# Cantidad de puntos iniciales de cada generador de pasos (los últimos argumentos posicionales)
+_STARTING_POINTS = {secant_steps: 2}
+
+
+def accelerated_steps(
+	steps: Callable[..., Generator],
+	*args,
+	tol: float = 1e-4,
+	max_iter: int = 50,
+	linear_tol: float = 0.25,
+) -> Generator[Tuple[int, float, float, float], None, Tuple[float, int, Dict[str, object]]]:
+	"""
+	Capa de aceleración sobre `newton_steps`, `secant_steps` o `fixed_point_steps`.
+
+	Ejecuta `steps(*args, tol, max_iter)` y, tras cada fila, estima el orden de
+	convergencia con los tres últimos deltas. Si dos estimaciones seguidas indican
+	convergencia lineal (|q - 1| < `linear_tol`, con deltas decrecientes), reemplaza
+	el iterado actual por la extrapolación Δ² de Aitken de los tres últimos y
+	reinicia el método desde allí (con `fixed_point_steps` esto es el método de
+	Steffensen). La Secante se reinicia con el último iterado y el extrapolado como
+	puntos iniciales. Si la convergencia es superlineal, el método corre sin cambios.
+
+	Las filas tienen el mismo formato (n, x, f(x), delta) que las del método base,
+	con numeración continua; la fila extrapolada cuenta como una iteración y su
+	delta es el salto de Aitken.
+
+	El valor de retorno del generador es (raíz, iteraciones, diagnóstico), con
+	diagnóstico = {"order": q, "rate": λ, "extrapolations": k}: el último orden y
+	la constante observados en el método base (None si no hubo deltas suficientes)
+	y la cantidad de pasos de Aitken aplicados.
+	"""
+	k = _STARTING_POINTS.get(steps, 1)
+	fixed, starts = args[:-k], args[-k:]
+	shift = 0
+	extrapolations = 0
+	n = 0
+	previous: Optional[float] = None
+	observed: Tuple[Optional[float], Optional[float]] = (None, None)
+	while True:
+		inner = steps(*fixed, *starts, tol, max_iter - shift)
+		xs: List[float] = []
+		deltas: List[float] = []
+		while True:
+			try:
+				row = next(inner)
+			except StopIteration as stop:
+				root, _ = stop.value
+				return root, n, {"order": observed[0], "rate": observed[1], "extrapolations": extrapolations}
+			if previous is not None and row[0] < k - 1:
+				continue
+			n = row[0] + shift
+			if previous is not None and not xs:
+				# Fila del punto extrapolado: su delta es el salto de Aitken
+				row = (n, row[1], row[2], abs(row[1] - previous))
+				yield row
+				if row[-1] < tol:
+					return row[1], n, {"order": observed[0], "rate": observed[1], "extrapolations": extrapolations}
+			else:
+				row = (n,) + tuple(row[1:])
+				yield row
+				if xs:
+					deltas.append(row[-1])
+			xs.append(row[1])
+			if len(deltas) < 3:
+				continue
+			order, rate = _order_from_deltas(*deltas[-3:])
+			if order is None:
+				continue
+			was_linear = observed[0] is not None and abs(observed[0] - 1.0) < linear_tol
+			observed = (order, rate)
+			if not was_linear or abs(order - 1.0) >= linear_tol or deltas[-1] >= deltas[-2] or n >= max_iter:
+				continue
+			extrapolated = aitken_extrapolate(*xs[-3:])
+			if extrapolated is not None and math.isfinite(extrapolated):
+				break
+		inner.close()
+		extrapolations += 1
+		previous = xs[-1]
+		starts = (previous, extrapolated)[-k:]
+		shift = n + 1 - (k - 1)
+
+
+def accelerated_method(
+	steps: Callable[..., Generator],
+	*args,
+	tol: float = 1e-4,
+	max_iter: int = 50,
+	linear_tol: float = 0.25,
+	compact: bool = False,
+	keep_last: Optional[int] = None,
+) -> Tuple[float, int, List[Tuple[int, float, float, float]], Dict[str, object]]:
+	"""
+	Ejecuta `accelerated_steps` guardando el historial.
+
+	Retorna (raíz, iteraciones, historial, diagnóstico); el diagnóstico contiene el
+	orden y la constante observados en el método base y la cantidad de pasos de
+	Aitken (ver `accelerated_steps`).
+	"""
+	rows = _iterative_history(max_iter, compact, keep_last)
+	root, n, info = _drain(accelerated_steps(steps, *args, tol=tol, max_iter=max_iter, linear_tol=linear_tol), rows)
+	return root, n, rows, info
+
+
+# =============================================================================
+# Precisión extendida
+# =============================================================================
+
+@contextmanager
+def extended_precision(digits: int) -> Iterator[Callable]:
+	"""
+	Contexto de precisión extendida con `digits` dígitos significativos.
+
+	Usa `mpmath` si está instalado (admite funciones escritas con mpmath.exp,
+	mpmath.cos, ... o con `dual_math`) y si no `decimal`, que solo sirve para
+	aritmética básica, `Polynomial` y dual_math.exp/log/sqrt. Produce la
+	conversión float -> número extendido.
+	"""
+	try:
+		import mpmath
+	except ImportError:
+		import decimal
+
+		with decimal.localcontext() as ctx:
+			ctx.prec = digits
+			yield decimal.Decimal
+		return
+	with mpmath.workdps(digits):
+		yield mpmath.mpf
+
+
+def _to_decimal(x, digits: int) -> "Decimal":
+	"""Convierte un resultado de precisión extendida a `decimal.Decimal` con `digits` dígitos."""
+	from decimal import Context, Decimal
+
+	if isinstance(x, Decimal):
+		return Context(prec=digits).plus(x)
+	import mpmath
+
+	return Decimal(mpmath.nstr(x, digits, strip_zeros=False, min_fixed=-math.inf, max_fixed=math.inf))
+
+
+def _extended_digits(tol: float, scale: float) -> int:
+	"""Dígitos necesarios para resolver `tol` en un número de magnitud `scale`, con margen."""
+	return math.ceil(math.log10(max(abs(scale), 1.0) / tol)) + 10
+
+
+def _check_extended(func: Callable, root: float, digits: int) -> None:
+	"""
+	Verifica que `func` conserve la precisión extendida cerca de `root`: la
+	pendiente sobre un paso h menor que un ulp debe coincidir con la pendiente
+	sobre unos miles de ulp. Una función que pasa por float64 (math.* o un float
+	intermedio) no ve el paso chico y las pendientes difieren. Se evalúa con 20
+	dígitos de más para que la cancelación en f no tape el paso chico.
+
+	En una raíz múltiple f' se anula y la comparación no dice nada, por eso se
+	prueba también a una distancia de 10^-3 (relativa) a cada lado: basta con
+	que las pendientes coincidan en un punto donde no son nulas. Si f es
+	constante en los tres puntos no hay evidencia y no se lanza nada.
+	"""
+	with extended_precision(digits + 20) as convert:
+		x = convert(root)
+		if isinstance(func(x), float):
+			raise TypeError(
+				"La función devolvió un float con argumento de precisión extendida: "
+				"escríbala con mpmath (mpmath.exp, ...), dual_math o aritmética básica"
+			)
+		scale = max(abs(root), 1.0)
+		h = convert(scale * _EPS / 100)
+		H = convert(scale * _EPS * 1e4)
+		offset = convert(scale * 1e-3)
+		informative = False
+		for point in (x, x + offset, x - offset):
+			try:
+				fine = (func(point + h) - func(point)) / h
+				coarse = (func(point + H) - func(point - H)) / (2 * H)
+			except (ValueError, ZeroDivisionError, OverflowError, ArithmeticError):
+				# Fuera del dominio de f (p. ej. log o sqrt junto a la raíz)
+				continue
+			if fine == 0 and coarse == 0:
+				continue
+			informative = True
+			if coarse != 0 and abs(fine - coarse) <= max(abs(fine), abs(coarse)) / 100:
+				return
+		if informative:
+			raise TypeError(
+				"La función pierde precisión con argumentos de precisión extendida (pasa "
+				"por float64, p. ej. math.exp): escríbala con mpmath, dual_math o aritmética básica"
+			)
+
+
+def _renumbered(steps: Generator, offset: int, skip_first: bool = False) -> Generator:
+	"""Reenumera las filas de un generador de pasos sumando `offset` a n."""
+	while True:
+		try:
+			row = next(steps)
+		except StopIteration as stop:
+			root, n = stop.value
+			return root, n + offset
+		if skip_first and row[0] == 0:
+			continue
+		yield (row[0] + offset,) + tuple(row[1:])
+
+
+# Veces que se duplica la precisión si el resultado no se puede certificar
+_EXTENDED_ATTEMPTS = 4
+
+
+def _certified(func: Callable, root, tol: float, digits: int, previous=None) -> bool:
+	"""
+	True si `root` está a menos de `tol` de una raíz: f cambia de signo en
+	[root - tol, root + tol] evaluada con el doble de dígitos, o coincide con el
+	resultado `previous` obtenido con la mitad de dígitos (raíces de multiplicidad par).
+	Con raíces planas el ruido de redondeo de f puede fingir un cambio de signo
+	lejos de la raíz; esta verificación lo detecta.
+	"""
+	if previous is not None and abs(root - previous) <= tol:
+		return True
+	with extended_precision(2 * digits) as convert:
+		r, t = convert(root), convert(tol)
+		return func(r - t) * func(r + t) <= 0
+
+
+def _extended_bisection(func, a, b, root, tol, max_iter, iter_count, history):
+	"""Fase final de `bisection_method` en precisión extendida (ver allí)."""
+	digits = shown = _extended_digits(tol, root)
+	_check_extended(func, root, digits)
+	start, previous = root, None
+	for _ in range(_EXTENDED_ATTEMPTS):
+		with extended_precision(digits) as convert:
+			# El cambio de signo suele estar a pocos ulp de la raíz en float64; con raíces
+			# planas o múltiples el ruido de f lo aleja, así que el intervalo crece hasta [a, b]
+			width = 4 * math.ulp(start)
+			while True:
+				lo, hi = convert(max(a, start - width)), convert(min(b, start + width))
+				if func(lo) * func(hi) <= 0 or (lo <= a and hi >= b):
+					break
+				width *= 16
+			steps = illinois_steps(func, lo, hi, tol, max_iter - iter_count)
+			root, iter_count = _drain(_renumbered(steps, iter_count), history)
+			if iter_count >= max_iter or _certified(func, root, tol, digits, previous):
+				return _to_decimal(root, shown), iter_count
+		previous = root
+		digits *= 2
+	raise ValueError(f"No se pudo resolver la raíz con tol={tol:g} ni con {digits // 2} dígitos")
+
+
+def _extended_newton(f, df, root, tol, max_iter, n, multiplicity, rows):
+	"""Fase final de `newton_method` en precisión extendida (ver allí)."""
+	digits = shown = _extended_digits(tol, root)
+	_check_extended(f, root, digits)
+	previous = None
+	for _ in range(_EXTENDED_ATTEMPTS):
+		with extended_precision(digits) as convert:
+			steps = newton_steps(f, df, convert(root), tol, max_iter - n, multiplicity)
+			root, n = _drain(_renumbered(steps, n, skip_first=True), rows)
+			if n >= max_iter or _certified(f, root, tol, digits, previous):
+				return _to_decimal(root, shown), n
+		previous = root
+		digits *= 2
+	raise ValueError(f"No se pudo resolver la raíz con tol={tol:g} ni con {digits // 2} dígitos")
+
+
+# =============================================================================
+# Continuación en un parámetro
+# =============================================================================
+
+def _partial(func: Callable, x: float, theta: float, wrt: int) -> float:
+	"""Derivada parcial de func(x, θ) respecto de x (wrt=0) o θ (wrt=1) por números duales."""
+	if wrt == 0:
+		return value_and_derivative(lambda t: func(t, theta), x)[1]
+	return value_and_derivative(lambda t: func(x, t), theta)[1]
+
+
+def _continuation_solve(
+	f: Callable[[float], float],
+	df: Optional[Callable[[float], float]],
+	x: float,
+	step: float,
+	tol: float,
+	max_iter: int,
+	method: str,
+) -> Tuple[float, int, bool]:
+	"""Una resolución desde `x`; retorna (raíz, iteraciones, convergió)."""
+	if method == "newton":
+		steps = newton_steps(f, df, x, tol, max_iter)
+	else:
+		h = step if step else 1e-4 * max(1.0, abs(x))
+		steps = secant_steps(f, x - h, x, tol, max_iter)
+	delta = math.inf
+	fx = math.nan
+	try:
+		while True:
+			try:
+				row = next(steps)
+			except StopIteration as stop:
+				root, n = stop.value
+				break
+			fx, delta = row[2], row[3] if row[0] > 0 else math.inf
+	except (ZeroDivisionError, OverflowError, ValueError):
+		return x, max_iter, False
+	converged = math.isfinite(root) and (delta < tol or fx == 0)
+	return root, n, converged
+
+
+def continuation(
+	f: Callable[[float, float], float],
+	thetas: List[float],
+	x0: float,
+	df: Optional[Callable[[float, float], float]] = None,
+	dtheta: Optional[Callable[[float, float], float]] = None,
+	tol: float = 1e-10,
+	max_iter: int = 8,
+	method: str = "newton",
+	predictor: bool = True,
+	max_refinements: int = 12,
+) -> List[Tuple[float, float, int]]:
+	"""
+	Resuelve f(x, θ) = 0 para cada θ de `thetas` recorriéndolos en orden
+	(continuación): cada resolución parte de la raíz anterior en lugar de un punto
+	fijo. `x0` es la aproximación inicial para thetas[0].
+
+	Con `predictor=True` el punto inicial es el predictor de primer orden
+	x + (dx/dθ)·Δθ, con dx/dθ = -f_θ / f_x en la raíz anterior (teorema de la función
+	implícita). `df(x, θ)` = ∂f/∂x y `dtheta(x, θ)` = ∂f/∂θ son opcionales; si faltan
+	se calculan por diferenciación automática, así que f debe usar `dual_math`.
+
+	Cada resolución usa Newton (`method="newton"`) o la Secante (`"secant"`) con a lo
+	sumo `max_iter` iteraciones. Si no converge en ese presupuesto (o diverge), el
+	paso Δθ se parte a la mitad y se intercalan parámetros intermedios, hasta
+	`max_refinements` veces por tramo; si aun así falla se lanza ValueError. Tras
+	una resolución con la mitad del presupuesto o menos, el paso se duplica.
+
+	Retorna una lista de (θ, raíz, iteraciones) para los θ pedidos; las
+	iteraciones incluyen las de los parámetros intermedios del tramo.
+	"""
+	if method not in ("newton", "secant"):
+		raise ValueError(f"Método desconocido: {method!r} (use 'newton' o 'secant')")
+	if not thetas:
+		raise ValueError("thetas no puede estar vacío")
+
+	def solve_at(theta: float, x: float, step: float) -> Tuple[float, int, bool]:
+		f_theta = lambda t: f(t, theta)
+		df_theta = (lambda t: df(t, theta)) if df is not None else None
+		return _continuation_solve(f_theta, df_theta, x, step, tol, max_iter, method)
+
+	def tangent(x: float, theta: float) -> float:
+		fx = df(x, theta) if df is not None else _partial(f, x, theta, 0)
+		ft = dtheta(x, theta) if dtheta is not None else _partial(f, x, theta, 1)
+		return -ft / fx if fx != 0 else 0.0
+
+	results: List[Tuple[float, float, int]] = []
+	x, iters, ok = solve_at(thetas[0], x0, 0.0)
+	if not ok:
+		raise ValueError(f"No converge en θ = {thetas[0]!r} desde x0 = {x0!r}")
+	results.append((thetas[0], x, iters))
+	theta = thetas[0]
+	slope = tangent(x, theta) if predictor else 0.0
+
+	for target in thetas[1:]:
+		total = 0
+		h = target - theta
+		refinements = 0
+		while theta != target:
+			step_to = target if abs(h) >= abs(target - theta) else theta + h
+			guess = x + slope * (step_to - theta)
+			root, n, ok = solve_at(step_to, guess, guess - x)
+			total += n
+			if not ok:
+				refinements += 1
+				if refinements > max_refinements:
+					raise ValueError(f"La continuación no converge cerca de θ = {step_to!r}")
+				h /= 2
+				continue
+			x, theta = root, step_to
+			if predictor:
+				slope = tangent(x, theta)
+			# Convergencia holgada: se vuelve a agrandar el paso
+			if n <= max_iter // 2:
+				h *= 2
+		results.append((target, x, total))
+	return results
+
+
+# =============================================================================
+# Conteo de evaluaciones e instrumentación
+# =============================================================================
+
+class CountedFunction:
+	"""
+	Envoltorio invocable que cuenta cuántas veces se llama a `func` (`calls`) y en
+	cuántos puntos se evalúa (`evaluations`): una llamada con un arreglo de NumPy
+	cuenta una evaluación por elemento, como lo harían los métodos en lote.
+	"""
+
+	def __init__(self, func: Callable) -> None:
+		self.func = func
+		self.calls = 0
+		self.evaluations = 0
+
+	def _count(self, args) -> None:
+		self.calls += 1
+		self.evaluations += getattr(args[0], "size", 1) if args else 1
+
+	def __call__(self, *args, **kwargs):
+		self._count(args)
+		return self.func(*args, **kwargs)
+
+
+def count_evaluations(method: Callable, func: Callable, *args, **kwargs) -> Tuple[float, int, int]:
+	"""
+	Ejecuta `method(func, *args, **kwargs)` contando las evaluaciones de `func`.
+
+	Retorna (raíz, iteraciones, evaluaciones).
+	"""
+	counted = CountedFunction(func)
+	root, iters = method(counted, *args, **kwargs)[:2]
+	return root, iters, counted.calls
+
+
+class TimedFunction(CountedFunction):
+	"""`CountedFunction` que además acumula el tiempo (ns) pasado dentro de `func`."""
+
+	def __init__(self, func: Callable) -> None:
+		super().__init__(func)
+		self.time_ns = 0
+
+	def __call__(self, *args, **kwargs):
+		self._count(args)
+		start = perf_counter_ns()
+		try:
+			return self.func(*args, **kwargs)
+		finally:
+			self.time_ns += perf_counter_ns() - start
+
+
+class SolverStats:
+	"""
+	Estadísticas de una corrida instrumentada: llamadas y tiempo dentro de cada
+	función del usuario (f, df, ...), tiempo de cada iteración y tiempo total,
+	todo medido con `perf_counter_ns`.
+
+	El tiempo de overhead del solver es el total menos el tiempo dentro de las
+	funciones envueltas con `wrap`.
+	"""
+
+	def __init__(self, callback: Optional[Callable[[tuple, int], None]] = None) -> None:
+		self.callback = callback
+		self.functions: Dict[str, TimedFunction] = {}
+		self.iteration_ns = array("q")
+		self.total_ns = 0
+
+	def wrap(self, func: Callable, name: str = "f") -> TimedFunction:
+		"""Envuelve `func` para contar y cronometrar sus llamadas bajo `name`."""
+		timed = TimedFunction(func)
+		self.functions[name] = timed
+		return timed
+
+	def calls(self, name: str = "f") -> int:
+		timed = self.functions.get(name)
+		return timed.calls if timed is not None else 0
+
+	@property
+	def function_ns(self) -> int:
+		return sum(timed.time_ns for timed in self.functions.values())
+
+	@property
+	def overhead_ns(self) -> int:
+		return self.total_ns - self.function_ns
+
+	def run(self, steps: Generator, history=None) -> tuple:
+		"""
+		Consume un generador de pasos (p. ej. `bisection_steps`) midiendo cada
+		iteración. Las filas se guardan en `history` y se pasan a `callback(fila, ns)`
+		fuera de la medición. Retorna el valor de retorno del generador.
+		"""
+		while True:
+			start = perf_counter_ns()
+			try:
+				row = next(steps)
+			except StopIteration as stop:
+				self.total_ns += perf_counter_ns() - start
+				return stop.value
+			elapsed = perf_counter_ns() - start
+			self.total_ns += elapsed
+			self.iteration_ns.append(elapsed)
+			if history is not None:
+				history.append(row)
+			if self.callback is not None:
+				self.callback(row, elapsed)
+
+	def as_dict(self) -> Dict[str, object]:
+		return {
+			"calls": {name: timed.calls for name, timed in self.functions.items()},
+			"function_ns": {name: timed.time_ns for name, timed in self.functions.items()},
+			"steps": len(self.iteration_ns),
+			"total_ns": self.total_ns,
+			"overhead_ns": self.overhead_ns,
+		}
+
+	def report(self) -> str:
+		lines = [f"Tiempo total: {self.total_ns / 1e9:.9f} s ({len(self.iteration_ns)} pasos)"]
+		for name, timed in self.functions.items():
+			lines.append(f"  en {name}: {timed.time_ns / 1e9:.9f} s ({timed.calls} llamadas)")
+		lines.append(f"  overhead del método: {self.overhead_ns / 1e9:.9f} s")
+		return "\n".join(lines)
+
+
+def profile_solver(
+	steps: Callable[..., Generator],
+	*args,
+	history=None,
+	callback: Optional[Callable[[tuple, int], None]] = None,
+	**kwargs,
+) -> Tuple[float, int, SolverStats]:
+	"""
+	Ejecuta un generador de pasos (`bisection_steps`, `newton_steps`, ...) con
+	instrumentación. Los argumentos posicionales invocables se envuelven en orden
+	como "f", "df", ... para contar y cronometrar sus llamadas.
+
+	Retorna (raíz, iteraciones, estadísticas).
+	"""
+	stats = SolverStats(callback)
+	names = iter(("f", "df", "ddf"))
+	wrapped = [stats.wrap(arg, next(names)) if callable(arg) else arg for arg in args]
+	root, iters = stats.run(steps(*wrapped, **kwargs), history)
+	return root, iters, stats
+
+
+# =============================================================================
+# Caché de evaluaciones
+# =============================================================================
+
+class CachedFunction:
+	"""
+	Envoltorio invocable con caché LRU acotada de evaluaciones de `func`, indexada
+	por el valor float exacto del argumento.
+
+	Sirve para compartir evaluaciones entre varias corridas (Newton, Secante y el
+	gráfico de un mismo problema) cuando f es costosa. Si recibe un arreglo de
+	NumPy, busca cada valor distinto en la caché y evalúa los faltantes en una sola
+	llamada; un arreglo con más valores distintos que `maxsize` se evalúa entero sin
+	pasar por la caché. Los NaN se evalúan pero no se guardan, y -0.0 se guarda
+	aparte de 0.0 (f puede distinguirlos: copysign, atan2, 1/x).
+	"""
+
+	def __init__(self, func: Callable[[float], float], maxsize: int = 4096) -> None:
+		if maxsize < 1:
+			raise ValueError("maxsize debe ser un entero positivo")
+		self.func = func
+		self.maxsize = maxsize
+		self.hits = 0
+		self.misses = 0
+		self._cache: "OrderedDict[float, float]" = OrderedDict()
+
+	@staticmethod
+	def _key(x: float):
+		"""Clave de la caché: el propio float, salvo -0.0 (que se compara igual a 0.0)."""
+		if x == 0 and math.copysign(1.0, x) < 0:
+			return (x, -1.0)
+		return x
+
+	def _store(self, x: float, value: float) -> None:
+		self._cache[x] = value
+		if len(self._cache) > self.maxsize:
+			self._cache.popitem(last=False)
+
+	def __call__(self, x):
+		if isinstance(x, (list, tuple)) or getattr(x, "ndim", 0) > 0:
+			return self._call_array(x)
+		if not isinstance(x, (int, float)):
+			# Duales y otros tipos no se cachean: la clave por valor perdería la derivada
+			return self.func(x)
+		x = float(x)
+		key = self._key(x)
+		try:
+			value = self._cache[key]
+		except KeyError:
+			self.misses += 1
+			value = self.func(x)
+			# NaN no sirve como clave (NaN != NaN): se evalúa sin guardarlo
+			if x == x:
+				self._store(key, value)
+			return value
+		self.hits += 1
+		self._cache.move_to_end(key)
+		return value
+
+	def _evaluate(self, points):
+		"""Evalúa `func` en un arreglo de puntos con una sola llamada (o punto a punto si no es vectorizada)."""
+		import numpy as np
+
+		try:
+			return np.broadcast_to(np.asarray(self.func(points), dtype=float), points.shape)
+		except (TypeError, ValueError):
+			return np.array([self.func(float(xi)) for xi in points], dtype=float)
+
+	def _call_array(self, x):
+		import numpy as np
+
+		x = np.asarray(x, dtype=float)
+		# Cada valor distinto se busca y se evalúa una sola vez; los repetidos cuentan como aciertos.
+		# Se agrupa por patrón de bits: np.unique sobre floats junta -0.0 con 0.0
+		bits, inverse = np.unique(x.ravel().view(np.int64), return_inverse=True)
+		keys = bits.view(float)
+		values = np.empty(keys.shape, dtype=float)
+		if keys.size > self.maxsize:
+			# No entrarían en la caché: se evalúan todos juntos sin consultarla
+			missing = np.ones(keys.shape, dtype=bool)
+		else:
+			cache = self._cache
+			found = [cache.get(self._key(k)) for k in keys.tolist()]
+			missing = np.array([v is None for v in found], dtype=bool)
+			for k in keys[~missing].tolist():
+				cache.move_to_end(self._key(k))
+			values[~missing] = [v for v in found if v is not None]
+		if missing.any():
+			points = keys[missing]
+			values[missing] = fresh = self._evaluate(points)
+			if keys.size <= self.maxsize:
+				for k, v in zip(points.tolist(), fresh.tolist()):
+					# NaN no sirve como clave (NaN != NaN): se evalúa sin guardarlo
+					if k == k:
+						self._store(self._key(k), v)
+		evaluated = int(missing.sum())
+		self.misses += evaluated
+		self.hits += x.size - evaluated
+		return values[inverse].reshape(x.shape)
+
+	def cache_info(self) -> Dict[str, int]:
+		return {"hits": self.hits, "misses": self.misses, "maxsize": self.maxsize, "currsize": len(self._cache)}
+
+	def cache_clear(self) -> None:
+		self._cache.clear()
+		self.hits = 0
+		self.misses = 0
+
+
+# =============================================================================
+# Impresión de tablas
+# =============================================================================
+
+def format_iteration_table(title: str, rows: List[Tuple[int, float, float, float]]) -> str:
+	"""Arma en memoria la tabla genérica para métodos iterativos (Newton/Secante)."""
+	lines = ["\n" + title, f"{'n':>2} {'x':>14} {'f(x)':>15} {'delta':>12}", "-" * 45]
+	lines.extend(
+		f"{n:2d} {x:14.7f} {fx:15.7e} {'':12}" if n == 0 else f"{n:2d} {x:14.7f} {fx:15.7e} {delta:12.7e}"
+		for n, x, fx, delta in rows
+	)
+	lines.append("-" * 45)
+	return "\n".join(lines)
+
+
+def print_iteration_table(title: str, rows: List[Tuple[int, float, float, float]]) -> None:
+	"""Imprime una tabla genérica para métodos iterativos (Newton/Secante)."""
+	print(format_iteration_table(title, rows))
+
+
+def print_evaluation_comparison(func: Callable[[float], float], a: float, b: float, tol: float) -> None:
+	"""Compara iteraciones y evaluaciones de f de bisección, Illinois y Brent en [a, b]."""
+	print(f"\n{'Método':<10} | {'raíz':>17} | {'iter':>4} | {'eval f':>6}")
+	print("-" * 47)
+	for name, method in (("Bisección", bisection_method), ("Illinois", illinois_method), ("Brent", brent_method)):
+		root, iters, evals = count_evaluations(method, func, a, b, tol=tol, capture_history=False)
+		print(f"{name:<10} | {root:17.15f} | {iters:4d} | {evals:6d}")
+
+
+def format_bisection_table(label: str, history: List[Tuple[int, float, float, float, float, float]]) -> str:
+	"""Arma en memoria la tabla de bisección con columnas: n, a, b, p, f(p), (b-a)/2."""
+	lines = [
+		f"{label}) Tabla de iteraciones",
+		f"{'Iter':>4} | {'a':>17} | {'b':>17} | {'p=(a+b)/2':>17} | {'f(p)':>20} | {'(b-a)/2':>17}",
+		"-" * 105,
+	]
+	lines.extend(
+		f"{n:4d} | {a:17.15f} | {b:17.15f} | {p:17.15f} | {fp:20.15e} | {half_width:17.15f}"
+		for (n, a, b, p, fp, half_width) in history
+	)
+	return "\n".join(lines)
+
+
+def print_bisection_table(label: str, history: List[Tuple[int, float, float, float, float, float]]) -> None:
+	"""
 	Imprime la tabla de bisección con columnas: n, a, b, p, f(p), (b-a)/2.
 	"""
-	print(f"{label}) Tabla de iteraciones")
-	print(f"{'Iter':>4} | {'a':>17} | {'b':>17} | {'p=(a+b)/2':>17} | {'f(p)':>20} | {'(b-a)/2':>17}")
-	print("-" * 105)
-	for (n, a, b, p, fp, half_width) in history:
-		print(f"{n:4d} | {a:17.15f} | {b:17.15f} | {p:17.15f} | {fp:20.15e} | {half_width:17.15f}")
+	print(format_bisection_table(label, history))
+
+
+# =============================================================================
+# Exportación de historiales
+# =============================================================================
+
+# Nombres de columna aptos como claves de archivo (.npz)
+_ARRAY_KEYS = {"f(p)": "fp", "(b-a)/2": "half_width", "f(x)": "fx"}
+
+
+def history_columns(history) -> Tuple[str, ...]:
+	"""Nombres de columna de un historial (lista de filas o `IterationHistory`)."""
+	if isinstance(history, IterationHistory):
+		return history.columns
+	if history and len(history[0]) == len(BISECTION_COLUMNS):
+		return BISECTION_COLUMNS
+	return ITERATIVE_COLUMNS
+
+
+def write_history(history, fh: IO[str], fmt: str = "csv", title: str = "") -> None:
+	"""
+	Escribe un historial completo en `fh` con una sola llamada a `write`.
+
+	Formatos: "text" (la tabla legible de `print_bisection_table` o
+	`print_iteration_table`, con `title` como rótulo), "csv" (con encabezado) y
+	"jsonl" (un objeto JSON por fila).
+	"""
+	columns = history_columns(history)
+	if fmt == "text":
+		if columns == BISECTION_COLUMNS:
+			text = format_bisection_table(title, history)
+		else:
+			text = format_iteration_table(title, history)
+		fh.write(text + "\n")
+	elif fmt == "csv":
+		import csv
+		import io
+
+		buffer = io.StringIO()
+		writer = csv.writer(buffer, lineterminator="\n")
+		writer.writerow(columns)
+		writer.writerows(history)
+		fh.write(buffer.getvalue())
+	elif fmt == "jsonl":
+		import json
+
+		fh.write("".join(json.dumps(dict(zip(columns, row))) + "\n" for row in history))
+	else:
+		raise ValueError(f"Formato desconocido: {fmt!r} (use 'text', 'csv' o 'jsonl')")
+
+
+def save_history_arrays(history, path: str) -> None:
+	"""
+	Guarda un historial en binario de NumPy sin formatear fila por fila.
+
+	Con extensión .npz guarda una entrada por columna (n, a, b, p, fp, half_width
+	o n, x, fx, delta); con .npy guarda una matriz float de una fila por iteración.
+	"""
+	import numpy as np
+
+	columns = history_columns(history)
+	if isinstance(history, IterationHistory):
+		arrays = history.as_arrays()
+	else:
+		table = np.array(history, dtype=float).reshape(-1, len(columns))
+		arrays = {name: table[:, j] for j, name in enumerate(columns)}
+		arrays["n"] = arrays["n"].astype(np.int64)
+
+	if path.endswith(".npz"):
+		np.savez(path, **{_ARRAY_KEYS.get(name, name): arrays[name] for name in columns})
+	else:
+		np.save(path, np.column_stack([arrays[name].astype(float) for name in columns]))
+
+
+# =============================================================================
+# Evaluación para gráficos
+# =============================================================================
+
+def evaluate_grid(func: Callable, x: "np.ndarray") -> "np.ndarray":
+	"""
+	Evalúa `func` sobre el arreglo `x` en una sola llamada; si `func` no acepta
+	arreglos, recurre a evaluar punto a punto. Los puntos donde la función no está
+	definida o no es finita quedan como NaN.
+	"""
+	import numpy as np
+
+	x = np.asarray(x, dtype=float)
+	with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+		try:
+			y = np.broadcast_to(np.asarray(func(x), dtype=float), x.shape).copy()
+		except (TypeError, ValueError, ZeroDivisionError):
+			y = np.empty_like(x)
+			for i, xi in np.ndenumerate(x):
+				try:
+					y[i] = func(float(xi))
+				except (ValueError, ZeroDivisionError, OverflowError):
+					y[i] = np.nan
+	y[~np.isfinite(y)] = np.nan
+	return y
+
+
+def evaluate_for_plot(
+	func: Callable,
+	x: "np.ndarray",
+	detect_poles: bool = True,
+	jump_factor: float = 50.0,
+) -> Tuple["np.ndarray", "np.ndarray"]:
+	"""
+	Evalúa `func` sobre toda la grilla `x` en una sola llamada vectorizada y prepara
+	los datos para graficar (como `detect_poles=True` en Sage).
+
+	Los valores no finitos se reemplazan por NaN. Con `detect_poles`, entre dos
+	muestras consecutivas que encierran un polo, de orden par o impar (máximo local
+	de |f| con un salto mayor que `jump_factor` veces el salto mediano), se inserta
+	un NaN, de modo que matplotlib corta la curva en el polo en lugar de unir
+	ambas ramas.
+
+	Si `func` no acepta arreglos (p. ej. usa `math` o lanza ValueError en el polo),
+	se evalúa punto a punto y los puntos no definidos quedan como NaN.
+
+	Retorna (x, y), posiblemente con NaN intercalados.
+	"""
+	import numpy as np
+
+	x = np.asarray(x, dtype=float)
+	y = evaluate_grid(func, x)
+	if not detect_poles:
+		return x, y
+	return insert_pole_breaks(x, y, jump_factor)
+
+
+def insert_pole_breaks(x: "np.ndarray", y: "np.ndarray", jump_factor: float = 50.0) -> Tuple["np.ndarray", "np.ndarray"]:
+	"""
+	Intercala NaN entre muestras con un salto anómalo que cruza un polo (ver
+	`evaluate_for_plot`). Se buscan los máximos locales de |f| con un salto hacia un
+	vecino mayor que `jump_factor` veces el salto mediano, haya o no cambio de signo
+	(1/(x-2) y 1/(x-2)² por igual); un tramo empinado pero monótono o una raíz
+	junto al polo no se cortan. Los valores no finitos quedan como NaN.
+	"""
+	import numpy as np
+
+	y = np.where(np.isfinite(y), y, np.nan)
+	if x.size < 3:
+		return x, y
+	jumps = np.abs(np.diff(y))
+	finite_jumps = jumps[np.isfinite(jumps)]
+	if finite_jumps.size == 0:
+		return x, y
+	threshold = jump_factor * max(float(np.median(finite_jumps)), np.finfo(float).tiny)
+
+	# Cerca de un polo |y| tiene un máximo local en la muestra más cercana y el polo
+	# está en uno de los dos huecos vecinos. Un hueco es candidato si el salto es
+	# grande y |y| también crece hacia él desde el otro lado (en una raíz decrece).
+	# Si solo un candidato cambia de signo (polo de orden impar) se corta ese; si no
+	# (orden par, ambiguo con muestras ralas) se cortan los dos.
+	magnitude = np.abs(y)
+	with np.errstate(invalid="ignore"):
+		peak = np.flatnonzero((magnitude[1:-1] > magnitude[:-2]) & (magnitude[1:-1] > magnitude[2:])) + 1
+		peak = peak[(peak >= 2) & (peak <= y.size - 3)]
+		left = (jumps[peak - 1] > threshold) & (magnitude[peak - 1] > magnitude[peak - 2])
+		right = (jumps[peak] > threshold) & (magnitude[peak + 1] > magnitude[peak + 2])
+		sign_left = left & (y[peak - 1] * y[peak] < 0)
+		sign_right = right & (y[peak] * y[peak + 1] < 0)
+		left &= ~(sign_right & ~sign_left)
+		right &= ~(sign_left & ~sign_right)
+		poles = np.unique(np.concatenate((peak[left] - 1, peak[right])))
+	if poles.size == 0:
+		return x, y
+
+	cut = poles + 1
+	x_break = (x[poles] + x[cut]) / 2.0
+	return np.insert(x, cut, x_break), np.insert(y, cut, np.nan)
+
+
+def adaptive_sample(
+	func: Callable,
+	a: float,
+	b: float,
+	initial: int = 33,
+	max_evals: int = 1000,
+	tol: float = 2e-3,
+	min_width: Optional[float] = None,
+	ylim: Optional[Tuple[float, float]] = None,
+) -> Tuple["np.ndarray", "np.ndarray"]:
+	"""
+	Muestreo adaptativo de `func` en [a, b] para graficar con pocas evaluaciones.
+
+	Parte de `initial` puntos equiespaciados y subdivide por rondas: en cada ronda
+	evalúa de una sola vez los puntos medios de los subintervalos pendientes. Un
+	subintervalo se sigue dividiendo si el punto medio se aparta de la cuerda más
+	de `tol` veces la escala de la gráfica (curvatura), si el salto de f entre sus
+	extremos supera esa escala multiplicada por 0.1, o si alguno de sus valores no
+	es finito (polos, puntos no definidos). Donde la función es suave se detiene.
+
+	La escala es el rango de los valores visibles: `ylim` si se indica, o si no el
+	rango entre los percentiles 5 y 95, para que un polo no aplane todo lo demás.
+	El total de evaluaciones no supera `max_evals`; los subintervalos se dividen
+	hasta `min_width` (por defecto (b-a)·1e-6).
+
+	Retorna (x, y) ordenados, con NaN donde f no es finita.
+	"""
+	import numpy as np
+
+	min_width = (b - a) * 1e-6 if min_width is None else min_width
+	xs = [np.linspace(a, b, initial)]
+	ys = [evaluate_grid(func, xs[0])]
+	evals = initial
+
+	def scale_of(values: "np.ndarray") -> float:
+		if ylim is not None:
+			return ylim[1] - ylim[0]
+		finite = values[np.isfinite(values)]
+		if finite.size == 0:
+			return 1.0
+		lo, hi = np.percentile(finite, [5, 95])
+		return max(hi - lo, np.finfo(float).tiny)
+
+	def clip(values: "np.ndarray") -> "np.ndarray":
+		return values if ylim is None else np.clip(values, *ylim)
+
+	left, right = xs[0][:-1], xs[0][1:]
+	y_left, y_right = ys[0][:-1], ys[0][1:]
+	scale = scale_of(ys[0])
+
+	while left.size and evals < max_evals:
+		# Con presupuesto escaso se priorizan los subintervalos con mayor salto
+		budget = max_evals - evals
+		if left.size > budget:
+			jump = np.abs(clip(y_right) - clip(y_left))
+			order = np.argsort(np.where(np.isfinite(jump), -jump, -np.inf))[:budget]
+			left, right, y_left, y_right = left[order], right[order], y_left[order], y_right[order]
+
+		mid = (left + right) / 2.0
+		y_mid = evaluate_grid(func, mid)
+		evals += mid.size
+		xs.append(mid)
+		ys.append(y_mid)
+
+		finite = np.isfinite(y_left) & np.isfinite(y_mid) & np.isfinite(y_right)
+		with np.errstate(invalid="ignore"):
+			bend = np.abs(clip(y_mid) - (clip(y_left) + clip(y_right)) / 2.0)
+			jump = np.abs(clip(y_right) - clip(y_left))
+			refine = ~finite | (bend > tol * scale) | (jump > 0.1 * scale)
+		refine &= (right - left) / 2.0 > min_width
+
+		left = np.concatenate((left[refine], mid[refine]))
+		right = np.concatenate((mid[refine], right[refine]))
+		y_left = np.concatenate((y_left[refine], y_mid[refine]))
+		y_right = np.concatenate((y_mid[refine], y_right[refine]))
+		scale = scale_of(np.concatenate(ys))
+
+	x = np.concatenate(xs)
+	y = np.concatenate(ys)
+	order = np.argsort(x, kind="stable")
+	return x[order], y[order]
+
+
+# =============================================================================
+# Búsqueda de intervalos con cambio de signo
+# =============================================================================
+
+def find_brackets(
+	func: Callable,
+	a: float,
+	b: float,
+	samples: int = 1000,
+	reject_poles: bool = True,
+	pole_check_iter: int = 20,
+) -> List[Tuple[float, float]]:
+	"""
+	Muestrea `func` en `samples` puntos de [a, b] con una sola evaluación vectorizada
+	y devuelve todos los subintervalos [x_i, x_{i+1}] donde la función cambia de signo.
+	Las muestras donde f vale exactamente 0 se devuelven como intervalos degenerados
+	[x_i, x_i].
+
+	Un cambio de signo también puede deberse a un polo (como en el Ejercicio 3 con
+	1/(x-2)). Con `reject_poles`, todos los candidatos se acortan a la vez con
+	`pole_check_iter` pasos de bisección: si |f| en el punto final supera a |f| en
+	los extremos originales, el intervalo encierra un polo y se descarta.
+	"""
+	import numpy as np
+
+	x = np.linspace(a, b, samples)
+	y = evaluate_grid(func, x)
+
+	exact = np.flatnonzero(y == 0)
+	change = np.flatnonzero(y[:-1] * y[1:] < 0)
+	left, right = x[change], x[change + 1]
+
+	if reject_poles and change.size:
+		grid_func = lambda t: evaluate_grid(func, t)
+		mid, _ = bisection_batch(grid_func, left, right, tol=0.0, max_iter=pole_check_iter)
+		f_mid = np.abs(grid_func(mid))
+		bound = np.maximum(np.abs(y[change]), np.abs(y[change + 1]))
+		keep = np.isfinite(f_mid) & (f_mid <= bound)
+		left, right = left[keep], right[keep]
 
+	brackets = [(float(xi), float(xi)) for xi in x[exact]]
+	brackets += list(zip(left.tolist(), right.tolist()))
+	brackets.sort()
+	return brackets
+
+
+def find_all_roots(
+	func: Callable,
+	a: float,
+	b: float,
+	samples: int = 1000,
+	tol: float = 1e-10,
+	max_iter: int = 1000,
+	refine: Callable = None,
+) -> "np.ndarray":
+	"""
+	Localiza todas las raíces de `func` en [a, b]: busca los intervalos con
+	`find_brackets` y los refina todos en un solo lote con `refine`
+	(por defecto `bisection_batch`, con la misma firma).
+
+	Retorna las raíces ordenadas como arreglo de NumPy.
+	"""
+	import numpy as np
+
+	refine = refine or bisection_batch
+	brackets = find_brackets(func, a, b, samples)
+	if not brackets:
+		return np.empty(0)
+	left, right = (np.array(side, dtype=float) for side in zip(*brackets))
+	roots, _ = refine(lambda t: evaluate_grid(func, t), left, right, tol=tol, max_iter=max_iter)
+	return roots
+
+
+# =============================================================================
+# Polinomios
+# =============================================================================
+
+class Polynomial:
+	"""
+	Polinomio p(x) = c0·x^n + c1·x^(n-1) + ... + cn con coeficientes en orden
+	descendente (como `numpy.polyval`).
+
+	Se evalúa con el esquema de Horner, que funciona igual con floats, complejos,
+	arreglos de NumPy (vectorizado) y números duales, así que se puede pasar
+	directamente como `f` o `df` a `newton_method`, `secant_method` o a los métodos
+	en lote.
+	"""
+
+	def __init__(self, coeffs) -> None:
+		coeffs = [float(c) if not isinstance(c, complex) else c for c in coeffs]
+		# Los ceros a la izquierda no cambian el polinomio
+		while len(coeffs) > 1 and coeffs[0] == 0:
+			coeffs.pop(0)
+		if not coeffs:
+			coeffs = [0.0]
+		self.coeffs = tuple(coeffs)
+
+	@property
+	def degree(self) -> int:
+		return len(self.coeffs) - 1
+
+	def __repr__(self) -> str:
+		return f"Polynomial({list(self.coeffs)!r})"
+
+	def __call__(self, x):
+		coeffs = self.coeffs
+		if not isinstance(x, float) and getattr(x, "ndim", 0) > 0:
+			# Arreglos: un solo arreglo de salida actualizado en el lugar
+			import numpy as np
+
+			y = np.full_like(x, coeffs[0], dtype=np.result_type(x, coeffs[0], float))
+			for c in coeffs[1:]:
+				y *= x
+				if c:
+					y += c
+			return y
+		y = coeffs[0]
+		try:
+			for c in coeffs[1:]:
+				y = y * x + c
+		except TypeError:
+			# decimal.Decimal no se mezcla con float: coeficientes convertidos (exactos)
+			if type(getattr(x, "value", x)).__module__ != "decimal":
+				raise
+			from decimal import Decimal
+
+			y = Decimal(coeffs[0])
+			for c in coeffs[1:]:
+				y = y * x + Decimal(c)
+		return y
+
+	def derivative(self) -> "Polynomial":
+		"""Derivada a partir de los coeficientes: d/dx c·x^k = k·c·x^(k-1)."""
+		n = self.degree
+		if n == 0:
+			return Polynomial([0.0])
+		return Polynomial([c * (n - i) for i, c in enumerate(self.coeffs[:-1])])
+
+	def roots(self, polish: bool = True, tol: float = 1e-14, max_iter: int = 20) -> "np.ndarray":
+		"""
+		Todas las raíces (complejas) como autovalores de la matriz compañera.
+
+		Con `polish`, cada raíz se refina con unas iteraciones de Newton sobre el
+		propio polinomio (en aritmética compleja), lo que corrige el error de la
+		descomposición espectral en raíces mal condicionadas.
+		"""
+		import numpy as np
+
+		n = self.degree
+		if n < 1:
+			return np.empty(0, dtype=complex)
+		c = np.asarray(self.coeffs, dtype=complex if any(isinstance(k, complex) for k in self.coeffs) else float)
+		companion = np.zeros((n, n), dtype=c.dtype)
+		companion[0, :] = -c[1:] / c[0]
+		companion[1:, :-1] = np.eye(n - 1)
+		roots = np.linalg.eigvals(companion).astype(complex)
+
+		if polish:
+			dp = self.derivative()
+			for i, r in enumerate(roots):
+				candidate, _, _ = newton_method(self, dp, complex(r), tol=tol, max_iter=max_iter)
+				# Solo se acepta el refinamiento si mejora el residuo
+				if abs(self(candidate)) <= abs(self(complex(r))):
+					roots[i] = candidate
+		return roots
+
+	def real_roots(self, polish: bool = True, imag_tol: float = 1e-10) -> "np.ndarray":
+		"""Raíces reales ordenadas (parte imaginaria menor que `imag_tol` en valor relativo)."""
+		import numpy as np
+
+		roots = self.roots(polish)
+		real = roots[np.abs(roots.imag) <= imag_tol * np.maximum(1.0, np.abs(roots.real))].real
+		return np.sort(real)
+
+
+# =============================================================================
+# Raíces por aproximación de Chebyshev
+# =============================================================================
+
+def _chebyshev_coefficients(values: "np.ndarray") -> "np.ndarray":
+	"""
+	Coeficientes c_k del interpolante Σ c_k T_k en los puntos de Chebyshev
+	x_j = cos(jπ/n), j = 0..n, calculados con la DCT-I vía FFT de la extensión par.
+	"""
+	import numpy as np
+
+	n = values.size - 1
+	if n == 0:
+		return values.copy()
+	extended = np.concatenate((values, values[-2:0:-1]))
+	coeffs = np.fft.rfft(extended).real[: n + 1] / n
+	coeffs[0] /= 2.0
+	coeffs[n] /= 2.0
+	return coeffs
+
+
+def _chebyshev_fit(
+	func: Callable, a: float, b: float, tol: float, min_degree: int, max_degree: int
+) -> Tuple[Optional["np.ndarray"], int]:
+	"""
+	Interpolante de Chebyshev de `func` en [a, b] con grado creciente (16, 32, 64, ...)
+	hasta que los últimos coeficientes caen por debajo de `tol` veces el mayor.
+	Al duplicar el grado se reutilizan las muestras anteriores (los puntos están
+	anidados), así que solo se evalúan los nuevos, en un lote vectorizado.
+
+	Retorna (coeficientes recortados, evaluaciones), o (None, evaluaciones) si no
+	converge hasta `max_degree` o f no es finita en alguna muestra.
+	"""
+	import numpy as np
+
+	mid, half = (a + b) / 2.0, (b - a) / 2.0
+	n = min_degree
+	values = evaluate_grid(func, mid + half * np.cos(np.pi * np.arange(n + 1) / n))
+	evals = n + 1
+	while True:
+		if not np.all(np.isfinite(values)):
+			return None, evals
+		coeffs = _chebyshev_coefficients(values)
+		scale = np.max(np.abs(coeffs))
+		if scale == 0:
+			return coeffs[:1], evals
+		tail = np.max(np.abs(coeffs[-4:]))
+		if tail <= tol * scale:
+			keep = np.flatnonzero(np.abs(coeffs) > tol * scale)
+			return coeffs[: keep[-1] + 1], evals
+		if 2 * n > max_degree:
+			return None, evals
+		# Puntos nuevos del grado 2n: los de índice impar
+		new = evaluate_grid(func, mid + half * np.cos(np.pi * np.arange(1, 2 * n, 2) / (2 * n)))
+		evals += n
+		merged = np.empty(2 * n + 1)
+		merged[::2] = values
+		merged[1::2] = new
+		values, n = merged, 2 * n
+
+
+def _colleague_roots(coeffs: "np.ndarray", imag_tol: float = 1e-8) -> "np.ndarray":
+	"""
+	Raíces reales en [-1, 1] de Σ c_k T_k como autovalores de la matriz colega
+	(la análoga de la matriz compañera en la base de Chebyshev).
+	"""
+	import numpy as np
+
+	m = coeffs.size - 1
+	if m < 1:
+		return np.empty(0)
+	if m == 1:
+		roots = np.array([-coeffs[0] / coeffs[1]])
+	else:
+		colleague = np.zeros((m, m))
+		colleague[0, 1] = 1.0
+		i = np.arange(1, m)
+		colleague[i, i - 1] = 0.5
+		colleague[i[:-1], i[:-1] + 1] = 0.5
+		colleague[-1, :] -= coeffs[:-1] / (2.0 * coeffs[-1])
+		eig = np.linalg.eigvals(colleague)
+		roots = eig[np.abs(eig.imag) <= imag_tol].real
+	return np.sort(roots[np.abs(roots) <= 1.0 + 1e-10].clip(-1.0, 1.0))
+
+
+def chebyshev_roots(
+	func: Callable,
+	a: float,
+	b: float,
+	tol: float = 1e-13,
+	min_degree: int = 16,
+	max_degree: int = 256,
+	max_depth: int = 12,
+	polish: bool = True,
+) -> List[float]:
+	"""
+	Todas las raíces reales de una función suave en [a, b] (al estilo de Chebfun).
+
+	Muestrea `func` en puntos de Chebyshev, construye el interpolante con la DCT y
+	duplica el grado hasta que los coeficientes decaen (ver `_chebyshev_fit`); si el
+	grado supera `max_degree`, divide el intervalo en dos y repite en cada mitad
+	(hasta `max_depth` niveles). Las raíces del interpolante son los autovalores
+	reales de la matriz colega. Con `polish`, todas se refinan juntas con tres pasos
+	de Newton sobre la `func` original (una evaluación vectorizada por paso), usando
+	la derivada del interpolante; un paso solo se acepta si reduce |f|.
+
+	`func` se evalúa en lotes con `evaluate_grid`, así que conviene que acepte
+	arreglos. Para funciones con polos o no suaves la aproximación no converge y se
+	lanza ValueError. Retorna las raíces ordenadas.
+	"""
+	import numpy as np
+
+	pieces: List[Tuple[float, float, "np.ndarray"]] = []
+	pending = [(a, b, 0)]
+	while pending:
+		lo, hi, depth = pending.pop()
+		coeffs, _ = _chebyshev_fit(func, lo, hi, tol, min_degree, max_degree)
+		if coeffs is not None:
+			pieces.append((lo, hi, coeffs))
+			continue
+		if depth >= max_depth:
+			raise ValueError(f"La aproximación de Chebyshev no converge en [{lo}, {hi}]: ¿f es suave?")
+		# Corte levemente descentrado para no caer justo sobre una raíz simétrica
+		cut = lo + (hi - lo) * 0.5004
+		pending.extend(((lo, cut, depth + 1), (cut, hi, depth + 1)))
+
+	roots, slopes = [], []
+	for lo, hi, coeffs in pieces:
+		t = _colleague_roots(coeffs)
+		if t.size == 0:
+			continue
+		half = (hi - lo) / 2.0
+		roots.append((lo + hi) / 2.0 + half * t)
+		slopes.append(np.polynomial.chebyshev.chebval(t, np.polynomial.chebyshev.chebder(coeffs)) / half)
+	if not roots:
+		return []
+	x = np.concatenate(roots)
+	dfx = np.concatenate(slopes)
+	order = np.argsort(x)
+	x, dfx = x[order], dfx[order]
+
+	if polish:
+		fx = evaluate_grid(func, x)
+		safe = np.where(dfx != 0, dfx, 1.0)
+		for _ in range(3):
+			x_new = np.clip(x - np.where(dfx != 0, fx / safe, 0.0), a, b)
+			f_new = evaluate_grid(func, x_new)
+			better = np.abs(f_new) < np.abs(fx)
+			x = np.where(better, x_new, x)
+			fx = np.where(better, f_new, fx)
+
+	# Raíces repetidas en el borde común de dos subintervalos
+	keep = np.concatenate(([True], np.diff(x) > 1e-10 * max(1.0, abs(a), abs(b))))
+	return [float(r) for r in x[keep]]
+
+
+# =============================================================================
+# Renderizado sin pantalla
+# =============================================================================
+
+def use_headless_backend() -> None:
+	"""Selecciona el backend Agg de matplotlib: `plt.show()` no abre ventanas."""
+	import matplotlib
+
+	matplotlib.use("Agg")
+
+
+def show_or_save(save_path: Optional[str] = None) -> None:
+	"""Guarda la figura actual de pyplot en `save_path` (PNG/SVG según extensión) y la
+	cierra; sin ruta, la muestra como siempre."""
+	import matplotlib.pyplot as plt
+
+	if save_path is None:
+		plt.show()
+	else:
+		plt.savefig(save_path)
+		plt.close()
+
+
+def convergence_series(rows) -> Tuple[List[int], List[float]]:
+	"""Pares (n, delta) de un historial de Newton/Secante, omitiendo la fila 0."""
+	n_values = [row[0] for row in rows if row[0] > 0]
+	errors = [row[3] for row in rows if row[0] > 0]
+	return n_values, errors
+
+
+class ConvergencePlotter:
+	"""
+	Gráfico de convergencia reutilizable para renderizar muchos problemas sin pantalla.
+
+	Crea una sola figura (sobre un lienzo Agg, sin pasar por pyplot) con una curva
+	por método; cada `render` solo actualiza los datos de las curvas, títulos y
+	leyenda y guarda el archivo, en lugar de construir la figura desde cero. Con
+	`pyplot=True` la figura se crea con pyplot para poder mostrarla en pantalla.
+	"""
+
+	def __init__(
+		self,
+		labels: Tuple[str, ...] = ("Newton", "Secante"),
+		styles: Tuple[str, ...] = ("bo-", "ro-"),
+		figsize: Tuple[float, float] = (12, 7),
+		pyplot: bool = False,
+	) -> None:
+		if pyplot:
+			import matplotlib.pyplot as plt
+
+			self.figure = plt.figure(figsize=figsize)
+		else:
+			from matplotlib.backends.backend_agg import FigureCanvasAgg
+			from matplotlib.figure import Figure
+
+			self.figure = Figure(figsize=figsize)
+			FigureCanvasAgg(self.figure)
+		self.axes = self.figure.add_subplot()
+		# Margen fijo para la leyenda bajo el eje (evita recalcular el recorte en cada guardado)
+		self.figure.subplots_adjust(bottom=0.2, top=0.85)
+		self.labels = labels
+		self.lines = [self.axes.semilogy([], [], style)[0] for style in styles[: len(labels)]]
+		self.axes.grid(True, alpha=0.3)
+		self.axes.set_xlabel("Número de Iteración")
+		self.axes.set_ylabel("Error (escala logarítmica)")
+		self.info = self.axes.text(0.02, 0.02, "", transform=self.axes.transAxes,
+								   bbox=dict(facecolor="white", alpha=0.8), fontsize=9)
+
+	def render(self, histories, title: str, path: Optional[str] = None, problem_num: Optional[int] = None) -> None:
+		"""
+		Dibuja un historial por método y guarda la figura en `path` (sin ruta la
+		muestra con pyplot). Las curvas sin historial en esta llamada se ocultan y
+		el título general se borra si no hay `problem_num`, así nada queda de un
+		render anterior.
+		"""
+		histories = list(histories)
+		if len(histories) > len(self.lines):
+			raise ValueError(f"Se pasaron {len(histories)} historiales para {len(self.lines)} curvas")
+		final = []
+		for i, (line, label) in enumerate(zip(self.lines, self.labels)):
+			if i >= len(histories):
+				line.set_data([], [])
+				line.set_visible(False)
+				line.set_label("_nolegend_")
+				continue
+			n_values, errors = convergence_series(histories[i])
+			line.set_data(n_values, errors)
+			line.set_visible(True)
+			line.set_label(f"{label} (convergencia en {len(errors)} pasos)")
+			final.append(f"{label}: {errors[-1]:.2e}" if errors else f"{label}: -")
+		self.info.set_text("Error final:\n" + "\n".join(final))
+		self.axes.relim(visible_only=True)
+		self.axes.autoscale_view()
+		self.axes.set_title(f"Análisis de Convergencia: {title}", pad=20, size=12)
+		self.figure.suptitle(f"Velocidad de Convergencia - Problema {problem_num}" if problem_num is not None else "", size=14)
+		self.axes.legend(handles=self.lines[: len(histories)], bbox_to_anchor=(0.5, -0.15), loc="upper center", ncol=2)
+		if path is None:
+			import matplotlib.pyplot as plt
+
+			plt.show()
+		else:
+			self.figure.savefig(path)
+
+
+_PLOTTER: Optional[ConvergencePlotter] = None
+
+
+def _render_job(job: tuple) -> str:
+	"""Renderiza un trabajo (historiales, título, ruta) con el plotter del proceso."""
+	global _PLOTTER
+	if _PLOTTER is None:
+		_PLOTTER = ConvergencePlotter()
+	histories, title, path = job[:3]
+	_PLOTTER.render(histories, title, path, *job[3:])
+	return path
+
+
+def render_convergence_plots(jobs: List[tuple], workers: int = 1, chunksize: Optional[int] = None) -> List[str]:
+	"""
+	Renderiza muchos gráficos de convergencia. Cada trabajo es
+	(historiales, título, ruta[, número de problema]). Con `workers > 1` los reparte
+	en un `ProcessPoolExecutor`; cada proceso reutiliza su propia figura.
+
+	Retorna las rutas escritas.
+	"""
+	if workers <= 1:
+		return [_render_job(job) for job in jobs]
+	from concurrent.futures import ProcessPoolExecutor
 
+	# Los historiales se convierten a listas de tuplas para poder enviarlos a los procesos
+	jobs = [(tuple(list(rows) for rows in job[0]),) + tuple(job[1:]) for job in jobs]
+	if chunksize is None:
+		chunksize = max(1, len(jobs) // (4 * workers))
+	with ProcessPoolExecutor(max_workers=workers) as pool:
+		return list(pool.map(_render_job, jobs, chunksize=chunksize))
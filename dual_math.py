@@ -0,0 +1,195 @@
+"""
+Diferenciación automática en modo directo (forward-mode) con números duales.
+
+Un número dual x = a + b·ε con ε² = 0 propaga a la vez el valor a y la derivada b:
+evaluar f(Dual(p, 1)) una sola vez da f(p) y f'(p). Este módulo reemplaza a `math`
+en las funciones objetivo: `dual_math.cos(x)` se comporta como `math.cos(x)` para
+floats y además deriva cuando x es un `Dual`.
+
+Las funciones de `math` no saben derivar, por eso `Dual` no se convierte a float:
+llamar a `math.cos` con un dual lanza TypeError en lugar de perder la derivada en
+silencio.
+"""
+
+import math
+from typing import Callable, Optional, Tuple
+
+pi = math.pi
+e = math.e
+
+
+class Dual:
+	"""Número dual value + deriv·ε."""
+
+	__slots__ = ("value", "deriv")
+
+	def __init__(self, value: float, deriv: float = 0.0) -> None:
+		self.value = value
+		self.deriv = deriv
+
+	def __repr__(self) -> str:
+		return f"Dual({self.value!r}, {self.deriv!r})"
+
+	def __float__(self) -> float:
+		raise TypeError("Un Dual no se convierte a float: use las funciones de dual_math (exp, sin, cos, ...)")
+
+	# --- aritmética -----------------------------------------------------------
+
+	def __add__(self, other):
+		if isinstance(other, Dual):
+			return Dual(self.value + other.value, self.deriv + other.deriv)
+		return Dual(self.value + other, self.deriv)
+
+	__radd__ = __add__
+
+	def __sub__(self, other):
+		if isinstance(other, Dual):
+			return Dual(self.value - other.value, self.deriv - other.deriv)
+		return Dual(self.value - other, self.deriv)
+
+	def __rsub__(self, other):
+		return Dual(other - self.value, -self.deriv)
+
+	def __mul__(self, other):
+		if isinstance(other, Dual):
+			return Dual(self.value * other.value, self.deriv * other.value + self.value * other.deriv)
+		return Dual(self.value * other, self.deriv * other)
+
+	__rmul__ = __mul__
+
+	def __truediv__(self, other):
+		if isinstance(other, Dual):
+			return Dual(
+				self.value / other.value,
+				(self.deriv * other.value - self.value * other.deriv) / (other.value * other.value),
+			)
+		return Dual(self.value / other, self.deriv / other)
+
+	def __rtruediv__(self, other):
+		return Dual(other / self.value, -other * self.deriv / (self.value * self.value))
+
+	def __pow__(self, other):
+		if isinstance(other, Dual):
+			value = self.value ** other.value
+			return Dual(value, value * (other.deriv * math.log(self.value) + other.value * self.deriv / self.value))
+		if other == 0:
+			return Dual(1.0, 0.0)
+		return Dual(self.value ** other, other * self.value ** (other - 1) * self.deriv)
+
+	def __rpow__(self, other):
+		value = other ** self.value
+		return Dual(value, value * math.log(other) * self.deriv)
+
+	def __neg__(self):
+		return Dual(-self.value, -self.deriv)
+
+	def __pos__(self):
+		return self
+
+	def __abs__(self):
+		return Dual(abs(self.value), math.copysign(1.0, self.value) * self.deriv)
+
+	# --- comparaciones (sobre el valor) ----------------------------------------
+
+	def __eq__(self, other):
+		return self.value == (other.value if isinstance(other, Dual) else other)
+
+	def __ne__(self, other):
+		return not self == other
+
+	def __lt__(self, other):
+		return self.value < (other.value if isinstance(other, Dual) else other)
+
+	def __le__(self, other):
+		return self.value <= (other.value if isinstance(other, Dual) else other)
+
+	def __gt__(self, other):
+		return self.value > (other.value if isinstance(other, Dual) else other)
+
+	def __ge__(self, other):
+		return self.value >= (other.value if isinstance(other, Dual) else other)
+
+	def __hash__(self):
+		return hash(self.value)
+
+
+def _real(name: str, decimal_method: Optional[str] = None) -> Callable:
+	"""
+	math.<name> que además acepta números de precisión extendida: con mpmath.mpf
+	usa mpmath.<name> y con decimal.Decimal el método `decimal_method` (exp, ln,
+	sqrt); así la función objetivo no pierde precisión pasando por float64.
+	"""
+	math_func = getattr(math, name)
+
+	def func(x):
+		if type(x) is float or type(x) is int:
+			return math_func(x)
+		module = type(x).__module__
+		if module.startswith("mpmath"):
+			import mpmath
+
+			return getattr(mpmath, name)(x)
+		if module == "decimal":
+			if decimal_method is None:
+				raise TypeError(f"dual_math.{name} no admite decimal.Decimal: instale mpmath")
+			return getattr(x, decimal_method)()
+		return math_func(x)
+	func.__name__ = name
+	return func
+
+
+def _lift(func: Callable[[float], float], dfunc: Callable[[float], float]) -> Callable:
+	"""Extiende una función real a duales usando su derivada: f(a + bε) = f(a) + f'(a)·bε."""
+	fast = getattr(math, func.__name__)
+
+	def lifted(x):
+		if type(x) is float:
+			return fast(x)
+		if isinstance(x, Dual):
+			return Dual(func(x.value), dfunc(x.value) * x.deriv)
+		return func(x)
+	lifted.__name__ = func.__name__
+	lifted.__doc__ = f"Como math.{func.__name__}, pero acepta también Dual, mpmath.mpf y decimal.Decimal."
+	return lifted
+
+
+_exp = _real("exp", "exp")
+_log = _real("log", "ln")
+_sqrt = _real("sqrt", "sqrt")
+_sin = _real("sin")
+_cos = _real("cos")
+_tan = _real("tan")
+_sinh = _real("sinh")
+_cosh = _real("cosh")
+_tanh = _real("tanh")
+
+# Derivadas con literales enteros: float y decimal.Decimal no se mezclan
+exp = _lift(_exp, _exp)
+log = _lift(_log, lambda x: 1 / x)
+sqrt = _lift(_sqrt, lambda x: 1 / (2 * _sqrt(x)))
+sin = _lift(_sin, _cos)
+cos = _lift(_cos, lambda x: -_sin(x))
+tan = _lift(_tan, lambda x: 1 / _cos(x) ** 2)
+asin = _lift(_real("asin"), lambda x: 1 / _sqrt(1 - x * x))
+acos = _lift(_real("acos"), lambda x: -1 / _sqrt(1 - x * x))
+atan = _lift(_real("atan"), lambda x: 1 / (1 + x * x))
+sinh = _lift(_sinh, _cosh)
+cosh = _lift(_cosh, _sinh)
+tanh = _lift(_tanh, lambda x: 1 - _tanh(x) ** 2)
+
+
+def value_and_derivative(f: Callable, x: float) -> Tuple[float, float]:
+	"""Evalúa f una sola vez sobre Dual(x, 1) y retorna (f(x), f'(x))."""
+	# Derivada semilla entera: sirve también con mpmath.mpf y decimal.Decimal
+	result = f(Dual(x, 1))
+	if isinstance(result, Dual):
+		return result.value, result.deriv
+	# f no depende de x (constante)
+	return result, 0.0
+
+
+def derivative(f: Callable) -> Callable[[float], float]:
+	"""Retorna la función derivada f' calculada por diferenciación automática."""
+	def df(x: float) -> float:
+		return value_and_derivative(f, x)[1]
+	return df
@@ -13,16 +13,16 @@ Este script solicita p (1 a 15), ejecuta bisección y muestra la tabla de iterac
 """
 
 import math
-import time
 import sys
+from typing import Optional
 
 try:
-	from common_functions import bisection_method, print_bisection_table
+	from common_functions import bisection_steps, profile_solver, print_bisection_table, print_evaluation_comparison, chebyshev_roots, CountedFunction
 except ImportError:  # Permitir ejecución desde la subcarpeta
 	import os as _os
 	import sys as _sys
 	_sys.path.append(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))
-	from common_functions import bisection_method, print_bisection_table
+	from common_functions import bisection_steps, profile_solver, print_bisection_table, print_evaluation_comparison, chebyshev_roots, CountedFunction
 
 
 def f1(x: float) -> float:
@@ -33,9 +33,10 @@ def f2(x: float) -> float:
 	return math.exp(x) - x**2 + 3 * x - 2
 
 
-def main() -> None:
+def main(prec_exp: Optional[int] = None) -> None:
 	try:
-		prec_exp = int(input("Ingrese un exponente p entre 1 y 15 (para 10^-p): "))
+		if prec_exp is None:
+			prec_exp = int(input("Ingrese un exponente p entre 1 y 15 (para 10^-p): "))
 		if not (1 <= prec_exp <= 15):
 			raise ValueError
 	except ValueError:
@@ -51,14 +52,17 @@ def main() -> None:
 
 	for label, func, a, b, title in cases:
 		print(f"\nBisección para {title}:")
-		start = time.time()
-		root, iters, history = bisection_method(func, a, b, tol=EPS, max_iter=1000, capture_history=True)
-		end = time.time()
-		if history is not None:
-			print_bisection_table(label, history)
+		history = []
+		root, iters, stats = profile_solver(bisection_steps, func, a, b, tol=EPS, max_iter=1000, history=history)
+		print_bisection_table(label, history)
 		print(f"\nRaíz encontrada: {root:.9f}")
 		print(f"Iteraciones: {iters}")
-		print(f"Tiempo de ejecución: {end - start:.9f} segundos")
+		print(stats.report())
+		print_evaluation_comparison(func, a, b, EPS)
+		counted = CountedFunction(func)
+		roots = chebyshev_roots(counted, a, b)
+		print(f"Todas las raíces en [{a}, {b}] (Chebyshev, {counted.calls} evaluaciones): "
+			  f"{', '.join(f'{r:.15f}' for r in roots)}")
 
 
 if __name__ == "__main__":
@@ -7,46 +7,55 @@ Consigna:
   con una precisión ε = 10^{-5}. Respuesta: 17 iteraciones.
 - Hacer el ejercicio y reproducirlo con el programa.
 
-Este script aplica bisección en [1, 2] y muestra la tabla de iteraciones.
+Este script aplica bisección en [1, 2] y muestra la tabla de iteraciones. Para p > 15
+(por debajo de la resolución de float64) los últimos pasos se hacen en precisión extendida.
 """
 
-import time
 import sys
+from typing import Optional
 
 try:
-	from common_functions import bisection_method, print_bisection_table
+	from common_functions import bisection_method, bisection_steps, profile_solver, print_bisection_table, print_evaluation_comparison, Polynomial
 except ImportError:
 	import os as _os
 	import sys as _sys
 	_sys.path.append(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))
-	from common_functions import bisection_method, print_bisection_table
+	from common_functions import bisection_method, bisection_steps, profile_solver, print_bisection_table, print_evaluation_comparison, Polynomial
 
 
-def f3(x: float) -> float:
-    return x**3 + 4 * x**2 - 10
+# f3(x) = x³ + 4x² - 10, evaluado con Horner
+f3 = Polynomial([1, 4, 0, -10])
 
 
-def main() -> None:
+def main(prec_exp: Optional[int] = None) -> None:
     try:
-        prec_exp = int(input("Ingrese un exponente p entre 1 y 15 (para 10^-p): "))
-        if not (1 <= prec_exp <= 15):
+        if prec_exp is None:
+            prec_exp = int(input("Ingrese un exponente p entre 1 y 30 (para 10^-p): "))
+        if not (1 <= prec_exp <= 30):
             raise ValueError
     except ValueError:
-        print("Por favor ingrese un exponente entero entre 1 y 15.")
+        print("Por favor ingrese un exponente entero entre 1 y 30.")
         sys.exit(1)
 
     EPS = 10 ** (-prec_exp)
 
     a3, b3 = 1.0, 2.0
     print("\nBisección para f3 (x³ + 4x² - 10 = 0):\n")
-    start = time.time()
-    root3, iter3, history = bisection_method(f3, a3, b3, tol=EPS, max_iter=1000, capture_history=True)
-    end = time.time()
-    if history is not None:
+    if prec_exp > 15:
+        root3, iter3, history = bisection_method(f3, a3, b3, tol=EPS, max_iter=1000, adaptive_precision=True)
         print_bisection_table("c", history)
+        print(f"\nRaíz encontrada (precisión extendida): {root3:.{prec_exp + 1}f}")
+        print(f"Iteraciones: {iter3}")
+        return
+
+    history = []
+    root3, iter3, stats = profile_solver(bisection_steps, f3, a3, b3, tol=EPS, max_iter=1000, history=history)
+    print_bisection_table("c", history)
     print(f"\nRaíz encontrada: {root3:.9f}")
     print(f"Iteraciones: {iter3}")
-    print(f"Tiempo de ejecución: {end - start:.9f} segundos")
+    print(stats.report())
+    print_evaluation_comparison(f3, a3, b3, EPS)
+    print(f"\nRaíces reales de f3 (matriz compañera): {f3.real_roots()}")
 
 
 if __name__ == "__main__":
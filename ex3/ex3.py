@@ -13,17 +13,18 @@ Este script aplica bisección en ambos intervalos, reporta resultados y grafica
 con su asíntota vertical en x = 2.
 """
 
-import time
-import numpy as np
-import matplotlib.pyplot as plt
+from typing import TYPE_CHECKING
 
 try:
-	from common_functions import bisection_method, print_bisection_table
+	from common_functions import bisection_steps, profile_solver, print_bisection_table, adaptive_sample, insert_pole_breaks, show_or_save
 except ImportError:
 	import os as _os
 	import sys as _sys
 	_sys.path.append(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))
-	from common_functions import bisection_method, print_bisection_table
+	from common_functions import bisection_steps, profile_solver, print_bisection_table, adaptive_sample, insert_pole_breaks, show_or_save
+
+if TYPE_CHECKING:
+	import numpy as np
 
 
 def f(x: float) -> float:
@@ -32,26 +33,20 @@ def f(x: float) -> float:
     return (4 * x - 7) / ((x - 2) ** 2)
 
 
-def plot_function(roots=None, intervals=None):
-    x_left = np.linspace(-14, 1.9, 1000)
-    x_right = np.linspace(2.1, 20, 1000)
+def f_vectorized(x: "np.ndarray") -> "np.ndarray":
+    """Versión NumPy de f: en x = 2 produce inf, que se grafica como un corte."""
+    return (4 * x - 7) / ((x - 2) ** 2)
+
+
+def plot_function(roots=None, intervals=None, save_path=None):
+    import matplotlib.pyplot as plt
 
-    y_left = []
-    y_right = []
-    for xi in x_left:
-        try:
-            y_left.append(f(xi))
-        except ValueError:
-            y_left.append(np.nan)
-    for xi in x_right:
-        try:
-            y_right.append(f(xi))
-        except ValueError:
-            y_right.append(np.nan)
+    # Muestreo adaptativo: densifica cerca de la asíntota y usa pocos puntos en lo plano
+    x, y = adaptive_sample(f_vectorized, -14, 20, ylim=(-6, 10))
+    x, y = insert_pole_breaks(x, y)
 
     plt.figure(figsize=(12, 8))
-    plt.plot(x_left, y_left, 'r-', label='f(x)')
-    plt.plot(x_right, y_right, 'r-')
+    plt.plot(x, y, 'r-', label='f(x)')
     plt.xlim(-14, 20)
     plt.ylim(-6, 10)
     plt.axhline(y=0, color='k', linestyle='-', alpha=0.3)
@@ -70,44 +65,41 @@ def plot_function(roots=None, intervals=None):
     plt.title('Gráfica de f(x) = (4x - 7)/(x - 2)²')
     plt.xlabel('x')
     plt.ylabel('f(x)')
-    plt.show()
+    show_or_save(save_path)
 
 
-def main() -> None:
+def main(plot: bool = True, save_path=None) -> None:
     EPS = 1e-5
     roots = []
     intervals = [(1.5, 2.2), (1.5, 2.5)]
 
     # Caso a) intervalo [1.5, 2.2]
     try:
-        start = time.time()
-        root_a, iter_a, history_a = bisection_method(f, 1.5, 2.2, EPS, capture_history=True)
-        end = time.time()
+        history_a = []
+        root_a, iter_a, stats_a = profile_solver(bisection_steps, f, 1.5, 2.2, EPS, history=history_a)
         print("(a) Bisección en [1.5, 2.2]")
-        if history_a is not None:
-            print_bisection_table("a", history_a)
+        print_bisection_table("a", history_a)
         print(f"Raíz aproximada: {root_a:.9f}")
         print(f"Iteraciones: {iter_a}")
-        print(f"Tiempo: {end - start:.9f} segundos\n")
+        print(stats_a.report() + "\n")
         roots.append(root_a)
     except Exception as e:
         print(f"(a) Error: {e}\n")
 
     # Caso b) intervalo [1.5, 2.5]
     try:
-        start = time.time()
-        root_b, iter_b, history_b = bisection_method(f, 1.5, 2.5, EPS, capture_history=True)
-        end = time.time()
+        history_b = []
+        root_b, iter_b, stats_b = profile_solver(bisection_steps, f, 1.5, 2.5, EPS, history=history_b)
         print("(b) Bisección en [1.5, 2.5]")
-        if history_b is not None:
-            print_bisection_table("b", history_b)
+        print_bisection_table("b", history_b)
         print(f"Raíz aproximada: {root_b:.9f}")
         print(f"Iteraciones: {iter_b}")
-        print(f"Tiempo: {end - start:.9f} segundos\n")
+        print(stats_b.report() + "\n")
     except Exception as e:
         print(f"(b) Error: {e}\n")
 
-    plot_function(roots=roots, intervals=intervals)
+    if plot:
+        plot_function(roots=roots, intervals=intervals, save_path=save_path)
 
 
 if __name__ == "__main__":
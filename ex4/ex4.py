@@ -8,31 +8,114 @@ Consigna:
   de la serie armónica divergente. Conclusiones.
 
 Este script verifica la identidad y visualiza la divergencia de la serie.
+
+Las sumas parciales se obtienen de un prefijo acumulado que se calcula una sola
+vez (con suma compensada) y se extiende bajo demanda; para n muy grande se usa
+el desarrollo asintótico p_n ≈ ln n + γ + 1/(2n) − 1/(12n²) + 1/(120n⁴) − 1/(252n⁶).
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+try:
+	from common_functions import show_or_save
+except ImportError:
+	import os as _os
+	import sys as _sys
+	_sys.path.append(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))
+	from common_functions import show_or_save
+
+EULER_GAMMA = 0.5772156649015329
+
+
+def _compensated_cumsum(start_hi: float, start_lo: float, terms: np.ndarray):
+    """
+    Suma acumulada vectorizada con compensación de errores (equivalente a Neumaier).
+
+    Calcula cumsum en float64 y recupera el error exacto de redondeo de cada suma
+    con la transformación TwoSum; el acumulado de esos errores se suma al final.
+    Retorna (prefijos, hi, lo) donde hi + lo es el total para el siguiente bloque.
+    """
+    c = np.cumsum(np.concatenate(([start_hi], terms)))
+    prev, s = c[:-1], c[1:]
+    bb = s - prev
+    err = (prev - (s - bb)) + (terms - bb)
+    comp = start_lo + np.cumsum(err)
+    return s + comp, s[-1], comp[-1]
+
+
+class HarmonicSeries:
+    """
+    Motor incremental de sumas parciales p_n = sum_{k=1}^n 1/k.
+
+    Mantiene en caché el prefijo p_0..p_m y lo extiende por bloques cuando se pide
+    un n mayor. A partir de `asymptotic_from` usa el desarrollo asintótico, cuyo
+    error es despreciable en float64 para esos n.
+    """
+
+    def __init__(self, block_size: int = 1 << 16, asymptotic_from: int = 1_000_000) -> None:
+        self.block_size = block_size
+        self.asymptotic_from = asymptotic_from
+        self._prefix = np.zeros(1)
+        self._hi = 0.0
+        self._lo = 0.0
+
+    def _extend(self, n: int) -> None:
+        m = len(self._prefix) - 1
+        if n <= m:
+            return
+        target = min(max(n, 2 * m), self.asymptotic_from)
+        blocks = [self._prefix]
+        for start in range(m + 1, target + 1, self.block_size):
+            k = np.arange(start, min(start + self.block_size, target + 1), dtype=float)
+            block, self._hi, self._lo = _compensated_cumsum(self._hi, self._lo, 1.0 / k)
+            blocks.append(block)
+        self._prefix = np.concatenate(blocks)
+
+    @staticmethod
+    def asymptotic(n: np.ndarray) -> np.ndarray:
+        n = np.asarray(n, dtype=float)
+        inv2 = 1.0 / (n * n)
+        return (np.log(n) + EULER_GAMMA + 0.5 / n
+                - inv2 * (1.0 / 12 - inv2 * (1.0 / 120 - inv2 / 252)))
+
+    def partial_sums(self, n) -> np.ndarray:
+        """Sumas parciales p_n para un entero o un arreglo de enteros n >= 0."""
+        n = np.asarray(n, dtype=np.int64)
+        small = n <= self.asymptotic_from
+        if np.any(small):
+            self._extend(int(n[small].max()))
+        out = np.empty(n.shape, dtype=float)
+        out[small] = self._prefix[n[small]]
+        out[~small] = self.asymptotic(n[~small])
+        return out
+
+
+_SERIES = HarmonicSeries()
 
 
 def harmonic_sum(n: int) -> float:
     if n < 1:
         raise ValueError("n debe ser un número positivo")
-    return sum(1.0 / i for i in range(1, n + 1))
+    return float(_SERIES.partial_sums(n))
 
 
 def demonstrate_difference(n: int):
     if n < 2:
         raise ValueError("n debe ser mayor que 1 para calcular la diferencia")
-    pn = harmonic_sum(n)
-    pn_1 = harmonic_sum(n - 1)
+    pn, pn_1 = map(float, _SERIES.partial_sums([n, n - 1]))
     difference = pn - pn_1
     expected = 1.0 / n
     return difference, expected
 
 
-def plot_harmonic_series(n_max: int) -> None:
-    n_values = np.arange(1, n_max + 1)
-    partial_sums = [harmonic_sum(n) for n in n_values]
+def plot_harmonic_series(n_max: int, max_points: int = 10_000, save_path=None) -> None:
+    import matplotlib.pyplot as plt
+
+    # Para n_max grande basta con muestrear n: la curva se evalúa en max_points valores
+    if n_max <= max_points:
+        n_values = np.arange(1, n_max + 1)
+    else:
+        n_values = np.unique(np.geomspace(1, n_max, max_points).astype(np.int64))
+    partial_sums = _SERIES.partial_sums(n_values)
 
     plt.figure(figsize=(10, 6))
     plt.plot(n_values, partial_sums, 'b-', label='Suma parcial pₙ')
@@ -46,10 +129,10 @@ def plot_harmonic_series(n_max: int) -> None:
     log_reference = np.log(n_values)
     plt.plot(n_values, log_reference, 'r--', label='ln(n) (referencia)')
     plt.legend()
-    plt.show()
+    show_or_save(save_path)
 
 
-def main() -> None:
+def main(plot: bool = True, save_path=None) -> None:
     print("1. Demostración de (pₙ - pₙ₋₁) = 1/n:")
     for n in [2, 5, 10, 100]:
         diff, expected = demonstrate_difference(n)
@@ -63,8 +146,9 @@ def main() -> None:
         sum_n = harmonic_sum(n)
         print(f"Suma parcial para n = {n}: {sum_n}")
 
-    print("\n3. Generando gráfica de las sumas parciales...")
-    plot_harmonic_series(1000)
+    if plot:
+        print("\n3. Generando gráfica de las sumas parciales...")
+        plot_harmonic_series(1000, save_path=save_path)
 
     print("\nConclusiones:")
     print("1. Se verifica que (pₙ - pₙ₋₁) = 1/n para todo n ≥ 1")
@@ -12,16 +12,16 @@ Este script aplica bisección en [1, 2] y muestra la tabla de iteraciones.
 """
 
 try:
-	from common_functions import bisection_method, print_bisection_table
+	from common_functions import bisection_method, print_bisection_table, print_evaluation_comparison, Polynomial
 except ImportError:
 	import os as _os
 	import sys as _sys
 	_sys.path.append(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))
-	from common_functions import bisection_method, print_bisection_table
+	from common_functions import bisection_method, print_bisection_table, print_evaluation_comparison, Polynomial
 
 
-def f(x: float) -> float:
-    return x**3 - x - 1
+# f(x) = x³ - x - 1, evaluado con Horner
+f = Polynomial([1, 0, -1, -1])
 
 
 def main() -> None:
@@ -30,6 +30,8 @@ def main() -> None:
     root, iters, history = bisection_method(f, a, b, tol=tol, capture_history=True)
     print_bisection_table("a", history or [])
     print(f"\nRaíz ≈ {root:.9f} | Iteraciones: {iters}")
+    print_evaluation_comparison(f, a, b, tol)
+    print(f"\nRaíces reales de f (matriz compañera): {f.real_roots()}")
 
 
 if __name__ == "__main__":
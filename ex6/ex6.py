@@ -15,22 +15,22 @@ de la función con raíces y de la convergencia de los métodos.
 """
 
 import math
-import numpy as np
-import matplotlib.pyplot as plt
+import os
 try:
-	from common_functions import newton_method, secant_method, print_iteration_table
+	from common_functions import newton_method, secant_method, print_iteration_table, find_all_roots, CachedFunction, show_or_save, adaptive_sample, Polynomial, ConvergencePlotter, render_convergence_plots
 except ImportError:
 	import os as _os
 	import sys as _sys
 	_sys.path.append(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))
-	from common_functions import newton_method, secant_method, print_iteration_table
+	from common_functions import newton_method, secant_method, print_iteration_table, find_all_roots, CachedFunction, show_or_save, adaptive_sample, Polynomial, ConvergencePlotter, render_convergence_plots
+import dual_math as dmath
 
 # Configuración general
 TOLERANCE = 1e-4  # Tolerancia para convergencia
 MAX_ITERATIONS = 50  # Máximo número de iteraciones permitidas
 
 
-def plot_function_and_roots(f, x_range, roots, methods, iterations, title, problem_num):
+def plot_function_and_roots(f, x_range, roots, methods, iterations, title, problem_num, save_path=None):
     """
     Genera un gráfico de la función y las raíces encontradas por los métodos numéricos.
 
@@ -42,10 +42,13 @@ def plot_function_and_roots(f, x_range, roots, methods, iterations, title, probl
         iterations (list): Número de iteraciones para cada método
         title (str): Título del gráfico
         problem_num (int): Número del problema
+        save_path (str): Si se indica, guarda el gráfico (PNG/SVG) en lugar de mostrarlo
     """
-    # Genera puntos para graficar la función
-    x = np.linspace(x_range[0], x_range[1], 1000)
-    y = [f(xi) for xi in x]
+    import numpy as np
+    import matplotlib.pyplot as plt
+
+    # Genera puntos para graficar la función (más densos donde la curva se dobla)
+    x, y = adaptive_sample(f, x_range[0], x_range[1])
 
     # Configura el tamaño y crea la figura
     plt.figure(figsize=(12, 7))
@@ -70,66 +73,26 @@ def plot_function_and_roots(f, x_range, roots, methods, iterations, title, probl
     # Ajusta la leyenda y muestra el gráfico
     plt.legend(bbox_to_anchor=(0.5, -0.15), loc='upper center', ncol=2)
     plt.tight_layout()
-    plt.show()
+    show_or_save(save_path)
 
-def plot_convergence(rows_newton, rows_secant, title, problem_num):
+def plot_convergence(rows_newton, rows_secant, title, problem_num, save_path=None):
     """
     Genera un gráfico comparativo de la convergencia de los métodos.
 
+    Con `save_path` se usa el gráfico compartido de `render_convergence_plots`, que
+    reutiliza una misma figura para todos los problemas; sin ruta se muestra en pantalla.
+
     Argumentos:
         rows_newton (list): Historial de iteraciones del método de Newton
         rows_secant (list): Historial de iteraciones del método de la Secante
         title (str): Título del gráfico
         problem_num (int): Número del problema
+        save_path (str): Si se indica, guarda el gráfico (PNG/SVG) en lugar de mostrarlo
     """
-    plt.figure(figsize=(12, 7))
-
-    # Extrae los valores de error para el método de Newton
-    n_newton = []
-    errors_newton = []
-    for i, row in enumerate(rows_newton):
-        n_newton.append(i)
-        if len(row) > 3:
-            errors_newton.append(row[3])  # Usa el error calculado si está disponible
-        elif i > 0:
-            # Calcula el error como la diferencia entre iteraciones consecutivas
-            errors_newton.append(abs(row[1] - rows_newton[i-1][1]))
-
-    # Extrae los valores de error para el método de la Secante
-    n_secant = []
-    errors_secant = []
-    for i, row in enumerate(rows_secant):
-        n_secant.append(i)
-        if len(row) > 3:
-            errors_secant.append(row[3])  # Usa el error calculado si está disponible
-        elif i > 0:
-            # Calcula el error como la diferencia entre iteraciones consecutivas
-            errors_secant.append(abs(row[1] - rows_secant[i-1][1]))
-
-    # Grafica los errores en escala logarítmica (omitir la iteración 0)
-    plt.semilogy(n_newton[1:], errors_newton[1:], 'bo-',
-                 label=f'Newton (convergencia en {len(errors_newton) - 1} pasos)')
-    plt.semilogy(n_secant[1:], errors_secant[1:], 'ro-',
-                 label=f'Secante (convergencia en {len(errors_secant) - 1} pasos)')
-
-    # Configura la apariencia del gráfico
-    plt.grid(True, alpha=0.3)
-    plt.title(f'Análisis de Convergencia: {title}', pad=20, size=12)
-    plt.suptitle(f'Velocidad de Convergencia - Problema {problem_num}', size=14)
-    plt.xlabel('Número de Iteración')
-    plt.ylabel('Error (escala logarítmica)')
-
-    # Agrega información sobre el error final
-    final_error_newton = errors_newton[-1]
-    final_error_secant = errors_secant[-1]
-    info_text = f'Error final:\nNewton: {final_error_newton:.2e}\nSecante: {final_error_secant:.2e}'
-    plt.text(0.02, 0.02, info_text, transform=plt.gca().transAxes,
-             bbox=dict(facecolor='white', alpha=0.8), fontsize=9)
-
-    # Ajusta la leyenda y muestra el gráfico
-    plt.legend(bbox_to_anchor=(0.5, -0.15), loc='upper center', ncol=2)
-    plt.tight_layout()
-    plt.show()
+    if save_path is not None:
+        render_convergence_plots([((rows_newton, rows_secant), title, save_path, problem_num)])
+    else:
+        ConvergencePlotter(pyplot=True).render((rows_newton, rows_secant), title, problem_num=problem_num)
 
 def print_table(title, rows):
     # Mantener compatibilidad pero delegar al helper común
@@ -146,7 +109,7 @@ class Problem1:
     @staticmethod
     def f(x):
         """Función objetivo: f(x) = x - cos(x)"""
-        return x - math.cos(x)
+        return x - dmath.cos(x)
 
     @staticmethod
     def df(x):
@@ -157,6 +120,7 @@ class Problem1:
     newton_p0 = 0.7854  # π/4 aproximadamente
     secant_x0 = 0.0
     secant_x1 = math.pi / 2
+    domain = [0, math.pi / 2]
     plot_range = [0, 2]
     title = "f(x) = x - cos(x)"
 
@@ -164,37 +128,38 @@ class Problem1:
 class Problem2:
     """Problema 2: f(x) = x³ + 3x² - 1"""
 
-    @staticmethod
-    def f(x):
-        """Función objetivo: f(x) = x³ + 3x² - 1"""
-        return x**3 + 3 * x**2 - 1
-
-    @staticmethod
-    def df(x):
-        """Derivada de la función: f'(x) = 3x² + 6x"""
-        return 3 * x**2 + 6 * x
+    # Función objetivo f(x) = x³ + 3x² - 1 y su derivada f'(x) = 3x² + 6x,
+    # obtenida de los coeficientes
+    f = Polynomial([1, 3, 0, -1])
+    df = f.derivative()
 
     # Parámetros iniciales
     newton_p0 = -1.0
     secant_x0 = -1.0
     secant_x1 = -0.5  # Más cerca de la raíz negativa
+    domain = [-4, 0]
     plot_range = [-2, 1]
     title = "f(x) = x³ + 3x² - 1"
 
 
-def solve_and_plot(problem, problem_num):
+def solve_and_plot(problem, problem_num, output_dir=None, plot=True):
     """
     Resuelve un problema usando ambos métodos y muestra los resultados.
 
     Argumentos:
         problem: Clase que define el problema (Problem1 o Problem2)
         problem_num: Número del problema para los títulos
+        output_dir: Si se indica, los gráficos se guardan como PNG en esa carpeta
+        plot: Con False solo se imprimen las tablas (sin NumPy ni matplotlib)
     """
+    # Una sola caché de f para Newton, Secante, el barrido de raíces y el gráfico
+    f = CachedFunction(problem.f)
+
     # Resolver usando el método de Newton
-    root_n, it_n, tab_n = newton_method(problem.f, problem.df, problem.newton_p0, tol=TOLERANCE, max_iter=MAX_ITERATIONS)
+    root_n, it_n, tab_n = newton_method(f, problem.df, problem.newton_p0, tol=TOLERANCE, max_iter=MAX_ITERATIONS)
 
     # Resolver usando el método de la Secante
-    root_s, it_s, tab_s = secant_method(problem.f, problem.secant_x0, problem.secant_x1, tol=TOLERANCE, max_iter=MAX_ITERATIONS)
+    root_s, it_s, tab_s = secant_method(f, problem.secant_x0, problem.secant_x1, tol=TOLERANCE, max_iter=MAX_ITERATIONS)
 
     # Mostrar resultados en tablas
     print_table(f"Newton: {problem.title}, p0={problem.newton_p0}", tab_n)
@@ -203,23 +168,41 @@ def solve_and_plot(problem, problem_num):
     print_table(f"Secant: {problem.title}, x0={problem.secant_x0}, x1={problem.secant_x1}", tab_s)
     print(f"Secant result: x ≈ {root_s:.7f} in {it_s} iterations\n")
 
+    if not plot:
+        print(f"Caché de f: {f.cache_info()}")
+        return
+
+    # Todas las raíces del dominio con un barrido vectorizado (NumPy) y bisección en lote
+    all_roots = find_all_roots(f, *problem.domain)
+    print(f"Raíces en {problem.domain}: {', '.join(f'{r:.7f}' for r in all_roots)}\n")
+
     # Visualizar resultados
-    plot_function_and_roots(problem.f, problem.plot_range,
+    roots_path = convergence_path = None
+    if output_dir is not None:
+        roots_path = os.path.join(output_dir, f"problema{problem_num}_raices.png")
+        convergence_path = os.path.join(output_dir, f"problema{problem_num}_convergencia.png")
+
+    plot_function_and_roots(f, problem.plot_range,
                             [root_n, root_s], ["Newton", "Secante"],
-                            [it_n, it_s], problem.title, problem_num)
+                            [it_n, it_s], problem.title, problem_num, roots_path)
+    print(f"Caché de f: {f.cache_info()}")
 
-    plot_convergence(tab_n, tab_s, problem.title, problem_num)
+    plot_convergence(tab_n, tab_s, problem.title, problem_num, convergence_path)
 
 
 # =============================================================================
 # Ejecución principal
 # =============================================================================
 
-if __name__ == "__main__":
+def main(plot: bool = True, output_dir=None) -> None:
     print("\nResolviendo Problema 1...")
     print("=" * 50)
-    solve_and_plot(Problem1, 1)
+    solve_and_plot(Problem1, 1, output_dir, plot)
 
     print("\nResolviendo Problema 2...")
     print("=" * 50)
-    solve_and_plot(Problem2, 2)
+    solve_and_plot(Problem2, 2, output_dir, plot)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,20 +12,20 @@ Este script minimiza g(x) = (x − 1)^2 + x^4 encontrando g'(x) = 0 con secante.
 
 import math
 try:
-	from common_functions import secant_method, print_iteration_table
+	from common_functions import secant_method, print_iteration_table, Polynomial
 except ImportError:
 	import os as _os
 	import sys as _sys
 	_sys.path.append(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))
-	from common_functions import secant_method, print_iteration_table
+	from common_functions import secant_method, print_iteration_table, Polynomial
 
 
 def g(x: float) -> float:
     return (x - 1) ** 2 + x**4
 
 
-def gp(x: float) -> float:
-    return 4 * x**3 + 2 * x - 2
+# g'(x) = 4x³ + 2x - 2, evaluado con Horner
+gp = Polynomial([4, 0, 2, -2])
 
 
 def main() -> None:
@@ -11,20 +11,25 @@ Este script resuelve x^2 − 3 = 0 con Newton y Secante e imprime las tablas.
 """
 
 try:
-	from common_functions import newton_method, secant_method, print_iteration_table
+	from common_functions import newton_method, secant_method, print_iteration_table, estimate_order, continuation, Polynomial
 except ImportError:
 	import os as _os
 	import sys as _sys
 	_sys.path.append(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__))))
-	from common_functions import newton_method, secant_method, print_iteration_table
+	from common_functions import newton_method, secant_method, print_iteration_table, estimate_order, continuation, Polynomial
 
 
-def f(x: float) -> float:
-    return x * x - 3.0
+# f(x) = x² - 3 y su derivada f'(x) = 2x, obtenida de los coeficientes
+f = Polynomial([1, 0, -3])
+df = f.derivative()
 
 
-def df(x: float) -> float:
-    return 2.0 * x
+def print_observed_order(rows) -> None:
+    order, rate = estimate_order(rows)
+    if order is None:
+        print("Orden de convergencia observado: (sin deltas suficientes)\n")
+    else:
+        print(f"Orden de convergencia observado: q≈{order:.3f}, λ≈{rate:.3e}\n")
 
 
 def main() -> None:
@@ -33,12 +38,26 @@ def main() -> None:
     root_newt, it_newt, tab_newt = newton_method(f, df, 2.0, tol=tol)
     print("Newton (p0=2.0):")
     print_iteration_table("Newton", tab_newt)
-    print(f"Result: x≈{root_newt:.12f} in {it_newt} iterations\n")
+    print(f"Result: x≈{root_newt:.12f} in {it_newt} iterations")
+    print_observed_order(tab_newt)
+
+    root_ad, it_ad, tab_ad = newton_method(f, None, 2.0, tol=tol)
+    print("Newton con derivada automática (p0=2.0):")
+    print_iteration_table("Newton (AD)", tab_ad)
+    print(f"Result: x≈{root_ad:.12f} in {it_ad} iterations\n")
 
     root_sec, it_sec, tab_sec = secant_method(f, 2.0, 1.5, tol=tol)
     print("Secante (p0=2.0, p1=1.5):")
     print_iteration_table("Secante", tab_sec)
-    print(f"Result: x≈{root_sec:.12f} in {it_sec} iterations\n")
+    print(f"Result: x≈{root_sec:.12f} in {it_sec} iterations")
+    print_observed_order(tab_sec)
+
+    # Familia x² - c: cada √c parte de la raíz anterior con predictor tangente
+    print("Continuación en c (x² - c = 0, c = 1, 1.5, ..., 10):")
+    path = continuation(lambda x, c: x * x - c, [1 + 0.5 * k for k in range(19)], 1.0, tol=1e-10)
+    print(" c       √c                 iter")
+    for c, root, iters in path:
+        print(f"{c:4.1f}  {root:.15f}  {iters:3d}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,109 @@
+"""
+Registro de los problemas de los ejercicios: función, derivada opcional, intervalo
+y puntos iniciales de cada uno.
+
+Las funciones se definen aquí con las mismas fórmulas que ex1–ex8, así `cli.py`,
+`benchmark.py` y `sweep.py` resuelven un problema sin importar el script del
+ejercicio (ni lo que ese script necesita para graficar). Se escriben con
+`dual_math` y `Polynomial`, de modo que Newton puede usar diferenciación automática.
+"""
+
+import math
+from typing import Callable, Dict, List, Optional, Tuple
+
+import dual_math as dm
+from common_functions import Polynomial
+
+
+class Problem:
+	"""Problema de los ejercicios: función, derivada opcional, intervalo y puntos iniciales."""
+
+	def __init__(
+		self,
+		name: str,
+		f: Callable,
+		bracket: Tuple[float, float],
+		df: Optional[Callable] = None,
+		p0: Optional[float] = None,
+		x0x1: Optional[Tuple[float, float]] = None,
+	) -> None:
+		self.name = name
+		self.f = f
+		self.bracket = bracket
+		self.df = df
+		self.p0 = p0 if p0 is not None else sum(bracket) / 2.0
+		self.x0x1 = x0x1 if x0x1 is not None else bracket
+
+	def __repr__(self) -> str:
+		return f"Problem({self.name!r}, bracket={self.bracket!r})"
+
+	@property
+	def vectorized(self) -> bool:
+		"""True si f (y df) aceptan arreglos de NumPy, requisito de los métodos en lote."""
+		import numpy as np
+
+		x = np.linspace(*self.bracket, 3)
+		try:
+			np.asarray(self.f(x), dtype=float)
+			if self.df is not None:
+				np.asarray(self.df(x), dtype=float)
+		except (TypeError, ValueError):
+			return False
+		return True
+
+
+# Ejercicio 1
+def ex1a(x: float) -> float:
+	return x - dm.exp(-x)
+
+
+def ex1b(x: float) -> float:
+	return dm.exp(x) - x**2 + 3 * x - 2
+
+
+# Ejercicio 3: polo doble en x = 2
+def ex3a(x: float) -> float:
+	if x == 2:
+		raise ValueError("f(x) no está definida en x=2")
+	return (4 * x - 7) / ((x - 2) ** 2)
+
+
+# Ejercicio 6, problema 1
+def ex6_1(x: float) -> float:
+	return x - dm.cos(x)
+
+
+def ex6_1_derivative(x: float) -> float:
+	return 1 + dm.sin(x)
+
+
+_ex2 = Polynomial([1, 4, 0, -10])      # x³ + 4x² - 10
+_ex5 = Polynomial([1, 0, -1, -1])      # x³ - x - 1
+_ex6_2 = Polynomial([1, 3, 0, -1])     # x³ + 3x² - 1
+_ex7 = Polynomial([4, 0, 2, -2])       # g'(x) = 4x³ + 2x - 2
+_ex8 = Polynomial([1, 0, -3])          # x² - 3
+
+PROBLEMS: Dict[str, Problem] = {
+	p.name: p
+	for p in [
+		Problem("ex1a", ex1a, (0.0, 1.0)),
+		Problem("ex1b", ex1b, (0.0, 1.0)),
+		Problem("ex2", _ex2, (1.0, 2.0)),
+		Problem("ex3a", ex3a, (1.5, 2.2)),
+		Problem("ex5", _ex5, (1.0, 2.0)),
+		Problem("ex6-1", ex6_1, (0.0, math.pi / 2), ex6_1_derivative, 0.7854, (0.0, math.pi / 2)),
+		Problem("ex6-2", _ex6_2, (-1.0, 0.0), _ex6_2.derivative(), -1.0, (-1.0, -0.5)),
+		Problem("ex7", _ex7, (0.0, 1.0), _ex7.derivative(), 1.0, (0.0, 1.0)),
+		Problem("ex8", _ex8, (1.0, 2.0), _ex8.derivative(), 2.0, (2.0, 1.5)),
+	]
+}
+
+
+def load_problems(names: Optional[List[str]] = None) -> List[Problem]:
+	"""Problemas pedidos por nombre (todos por defecto), en el orden del registro."""
+	if names is None:
+		return list(PROBLEMS.values())
+	unknown = [name for name in names if name not in PROBLEMS]
+	if unknown:
+		raise KeyError(f"Problemas desconocidos: {', '.join(unknown)} (disponibles: {', '.join(PROBLEMS)})")
+	return [p for p in PROBLEMS.values() if p.name in names]
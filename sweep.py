@@ -0,0 +1,114 @@
+"""
+Barrido no interactivo de tolerancias para los Ejercicios 1 y 2 (y el resto de los problemas).
+
+ex1 y ex2 piden por teclado un exponente p y resuelven una sola tolerancia 10^-p.
+Este script recorre el producto cartesiano problemas x tolerancias x métodos en un
+`ProcessPoolExecutor`, despachando las tareas por bloques (`chunksize`), y reúne
+los resultados en una sola tabla de iteraciones por p.
+
+Uso:
+    python sweep.py                                   # ex1a, ex1b, ex2 con p = 1..15
+    python sweep.py --problems ex5 ex8 --methods bisection brent --workers 4
+    python sweep.py --json resultados.json
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from typing import Dict, List, Optional, Tuple
+
+from common_functions import CountedFunction
+from benchmark import METHODS
+from problems import PROBLEMS, load_problems
+
+DEFAULT_PROBLEMS = ["ex1a", "ex1b", "ex2"]
+DEFAULT_METHODS = ["bisection", "illinois", "brent"]
+SCALAR_METHODS = [name for name, (_, _, is_batch) in METHODS.items() if not is_batch]
+
+# Problemas ya cargados en cada proceso trabajador
+_PROBLEMS: Dict[str, object] = {}
+
+
+def _solve_task(task: Tuple[str, str, int]) -> Dict[str, object]:
+	"""Resuelve una tarea (problema, método, p) dentro de un proceso trabajador."""
+	problem_name, method, p = task
+	if problem_name not in _PROBLEMS:
+		for problem in load_problems([problem_name]):
+			_PROBLEMS[problem.name] = problem
+	problem = _PROBLEMS[problem_name]
+	runner = METHODS[method][0]
+	# Sin df del problema, Newton usa diferenciación automática (df=None)
+	f = CountedFunction(problem.f)
+	try:
+		root, iters = runner(problem, f, problem.df, 10.0 ** (-p), False, 1)
+	except (ValueError, ZeroDivisionError, OverflowError) as exc:
+		return {"problem": problem_name, "method": method, "p": p, "error": str(exc)}
+	return {"problem": problem_name, "method": method, "p": p, "root": root,
+			"iterations": iters, "evaluations": f.calls}
+
+
+def run_sweep(
+	problems: List[str],
+	methods: List[str],
+	exponents: List[int],
+	workers: Optional[int] = None,
+	chunksize: Optional[int] = None,
+) -> List[Dict[str, object]]:
+	"""
+	Ejecuta todas las combinaciones en paralelo. Las tareas viajan como tuplas de
+	nombres (no como funciones), así que cada trabajador carga los problemas una vez.
+	"""
+	tasks = list(product(problems, methods, exponents))
+	workers = workers or os.cpu_count() or 1
+	if chunksize is None:
+		chunksize = max(1, len(tasks) // (4 * workers))
+	if workers == 1:
+		return [_solve_task(task) for task in tasks]
+	with ProcessPoolExecutor(max_workers=workers) as pool:
+		return list(pool.map(_solve_task, tasks, chunksize=chunksize))
+
+
+def print_sweep(results: List[Dict[str, object]], exponents: List[int]) -> None:
+	"""Tabla única: una fila por (problema, método), iteraciones para cada p y raíz final."""
+	by_case: Dict[Tuple[str, str], Dict[int, Dict[str, object]]] = {}
+	for r in results:
+		by_case.setdefault((r["problem"], r["method"]), {})[r["p"]] = r
+
+	header = " ".join(f"{p:>4}" for p in exponents)
+	print(f"{'problema':<7} | {'método':<10} | {header} | {'raíz (p máx)':>18}")
+	print("-" * (43 + 5 * len(exponents)))
+	for (problem, method), cells in by_case.items():
+		iters = " ".join(
+			f"{cells[p]['iterations']:>4}" if "iterations" in cells.get(p, {}) else f"{'-':>4}"
+			for p in exponents
+		)
+		last = cells.get(exponents[-1], {})
+		root = f"{last['root']:18.15f}" if "root" in last else f"{last.get('error', '-'):>18}"
+		print(f"{problem:<7} | {method:<10} | {iters} | {root}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+	parser = argparse.ArgumentParser(description="Barrido de tolerancias 10^-p en paralelo")
+	parser.add_argument("--problems", nargs="+", default=DEFAULT_PROBLEMS, choices=list(PROBLEMS))
+	parser.add_argument("--methods", nargs="+", default=DEFAULT_METHODS, choices=SCALAR_METHODS)
+	parser.add_argument("--pmin", type=int, default=1, help="exponente mínimo (10^-pmin)")
+	parser.add_argument("--pmax", type=int, default=15, help="exponente máximo (10^-pmax)")
+	parser.add_argument("--workers", type=int, default=None, help="procesos (por defecto, todos los núcleos)")
+	parser.add_argument("--chunksize", type=int, default=None, help="tareas por envío a cada proceso")
+	parser.add_argument("--json", metavar="ARCHIVO", help="guarda los resultados en JSON")
+	args = parser.parse_args(argv)
+
+	exponents = list(range(args.pmin, args.pmax + 1))
+	results = run_sweep(args.problems, args.methods, exponents, args.workers, args.chunksize)
+	print_sweep(results, exponents)
+	if args.json:
+		with open(args.json, "w", encoding="utf-8") as fh:
+			json.dump(results, fh, indent=1)
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
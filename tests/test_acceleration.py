@@ -0,0 +1,88 @@
+import math
+
+import pytest
+
+from common_functions import (
+	accelerated_method,
+	accelerated_steps,
+	aitken_extrapolate,
+	estimate_order,
+	fixed_point_method,
+	fixed_point_steps,
+	newton_method,
+	newton_steps,
+	secant_method,
+	secant_steps,
+)
+
+DOTTIE = 0.7390851332151607
+
+
+def test_fixed_point_converges_linearly():
+	root, iters, rows = fixed_point_method(math.cos, 1.0, tol=1e-10, max_iter=200)
+	assert root == pytest.approx(DOTTIE, abs=1e-9)
+	assert rows[-1][0] == iters
+	order, rate = estimate_order(rows)
+	assert order == pytest.approx(1.0, abs=1e-3)
+	assert rate == pytest.approx(math.sin(DOTTIE), abs=1e-3)
+
+
+def test_fixed_point_starting_at_the_fixed_point():
+	root, iters, rows = fixed_point_method(lambda x: x, 3.0)
+	assert (root, iters) == (3.0, 1)
+	assert rows[-1] == (1, 3.0, 0.0, 0.0)
+
+
+def test_steffensen_needs_far_fewer_iterations():
+	_, plain, _ = fixed_point_method(math.cos, 1.0, tol=1e-10, max_iter=200)
+	root, iters, rows, info = accelerated_method(fixed_point_steps, math.cos, 1.0, tol=1e-10, max_iter=200)
+	assert root == pytest.approx(DOTTIE, abs=1e-12)
+	assert iters < plain / 3
+	assert info["extrapolations"] >= 1
+	assert [row[0] for row in rows] == list(range(len(rows)))
+
+
+def test_aitken_on_newton_at_a_double_root():
+	f = lambda x: (x - 1) ** 2 * (x + 2)
+	df = lambda x: 2 * (x - 1) * (x + 2) + (x - 1) ** 2
+	_, plain, _ = newton_method(f, df, 2.0, tol=1e-10, max_iter=200)
+	root, iters, _, info = accelerated_method(newton_steps, f, df, 2.0, tol=1e-10, max_iter=200)
+	assert root == pytest.approx(1.0, abs=1e-8)
+	assert iters < plain / 2
+	assert info["rate"] == pytest.approx(0.5, abs=1e-3)
+
+
+def test_superlinear_methods_run_unchanged():
+	g = lambda x: x * x - 2
+	root, iters, rows, info = accelerated_method(newton_steps, g, lambda x: 2 * x, 1.0, tol=1e-12)
+	assert info["extrapolations"] == 0
+	assert list(rows) == list(newton_method(g, lambda x: 2 * x, 1.0, tol=1e-12)[2])
+
+	root, iters, rows, info = accelerated_method(secant_steps, g, 1.0, 2.0, tol=1e-12)
+	assert info["extrapolations"] == 0
+	assert (root, iters) == secant_method(g, 1.0, 2.0, tol=1e-12)[:2]
+	assert info["order"] == pytest.approx((1 + math.sqrt(5)) / 2, abs=0.05)
+
+
+def test_accelerated_steps_respects_max_iter():
+	steps = accelerated_steps(fixed_point_steps, math.cos, 1.0, tol=1e-15, max_iter=5)
+	rows = []
+	while True:
+		try:
+			rows.append(next(steps))
+		except StopIteration as stop:
+			root, n, _ = stop.value
+			break
+	assert n <= 5 and rows[-1][0] == n
+
+
+def test_estimate_order_needs_three_deltas():
+	assert estimate_order([(0, 1.0, 0.5, 0.0), (1, 0.9, 0.1, 0.1), (2, 0.85, 0.05, 0.05)]) == (None, None)
+	assert estimate_order([(0, 1.0, 0.0, 0.0), (1, 1.0, 0.0, 0.0), (2, 1.0, 0.0, 0.0), (3, 1.0, 0.0, 0.0)]) == (None, None)
+
+
+def test_aitken_extrapolate():
+	# Exacta para una sucesión geométrica x_n = L + c·r^n
+	xs = [2.0 + 3.0 * 0.5**n for n in range(3)]
+	assert aitken_extrapolate(*xs) == pytest.approx(2.0)
+	assert aitken_extrapolate(1.0, 2.0, 3.0) is None
@@ -0,0 +1,97 @@
+import asyncio
+import math
+
+import pytest
+
+from async_solvers import LocalService, async_bisection, async_newton, async_secant, main, run_many
+from common_functions import bisection_method, newton_method, secant_method
+
+
+def f(x):
+	return x * x - 2
+
+
+def df(x):
+	return 2 * x
+
+
+def test_async_solvers_match_sync_versions():
+	root, iters, rows = asyncio.run(async_bisection(f, 1.0, 2.0, tol=1e-8))
+	assert (root, iters) == bisection_method(f, 1.0, 2.0, tol=1e-8)[:2]
+
+	root, iters, rows = asyncio.run(async_newton(f, df, 1.0, tol=1e-12))
+	expected = newton_method(f, df, 1.0, tol=1e-12)
+	assert (root, iters) == expected[:2]
+	assert list(rows) == list(expected[2])
+
+	root, iters, _ = asyncio.run(async_secant(f, 1.0, 2.0, tol=1e-12))
+	assert (root, iters) == secant_method(f, 1.0, 2.0, tol=1e-12)[:2]
+
+
+def test_async_bisection_exact_root_endpoints():
+	assert asyncio.run(async_bisection(lambda x: x - 1, 1.0, 3.0)) == (1.0, 0, [])
+	assert asyncio.run(async_bisection(lambda x: x - 3, 1.0, 3.0))[:2] == (3.0, 0)
+
+
+def test_async_bisection_without_sign_change():
+	with pytest.raises(ValueError):
+		asyncio.run(async_bisection(f, 2.0, 3.0))
+
+
+def test_async_newton_does_not_evaluate_df_at_the_final_point():
+	fs = LocalService(f, latency=0)
+	dfs = LocalService(df, latency=0)
+	root, iters, _ = asyncio.run(async_newton(fs, dfs, 1.0, tol=1e-12, capture_history=False))
+	assert root == pytest.approx(math.sqrt(2), abs=1e-12)
+	assert fs.calls == iters + 1
+	assert dfs.calls == iters
+
+
+def test_async_newton_stops_at_max_iter_without_extra_df():
+	dfs = LocalService(df, latency=0)
+	_, iters, _ = asyncio.run(async_newton(f, dfs, 100.0, tol=1e-15, max_iter=3))
+	assert iters == 3
+	assert dfs.calls == 3
+
+
+def test_solve_many_isolates_arbitrary_exceptions():
+	async def service_down(x):
+		raise OSError("conexión rechazada")
+
+	async def missing(x):
+		return {}["x"]
+
+	jobs = [
+		lambda: async_newton(f, df, 1.0, tol=1e-10),
+		lambda: async_newton(service_down, df, 1.0),
+		lambda: async_secant(missing, 1.0, 2.0),
+		lambda: async_bisection(f, 2.0, 3.0),
+		lambda: async_newton(f, df, 3.0, tol=1e-10),
+	]
+	results = run_many(jobs, concurrency=2)
+	assert [r["job"] for r in results] == list(range(5))
+	assert results[0]["root"] == pytest.approx(math.sqrt(2))
+	assert results[1]["error"].startswith("OSError")
+	assert results[2]["error"].startswith("KeyError")
+	assert results[3]["error"].startswith("ValueError")
+	assert results[4]["root"] == pytest.approx(math.sqrt(2))
+
+
+def test_solve_many_timeout_and_concurrency_limit():
+	service = LocalService(f, latency=0.01)
+	slow = LocalService(f, latency=1.0)
+	jobs = [lambda: async_bisection(service, 1.0, 2.0, tol=1e-2) for _ in range(6)]
+	jobs.append(lambda: async_bisection(slow, 1.0, 2.0))
+	results = run_many(jobs, concurrency=3, timeout=0.3)
+	assert all("root" in r for r in results[:6])
+	assert "tiempo agotado" in results[6]["error"]
+	assert service.max_in_flight <= 6
+	with pytest.raises(ValueError):
+		run_many(jobs, concurrency=0)
+
+
+def test_main_when_every_solve_times_out(capsys):
+	assert main(["--solves", "5", "--timeout", "0.0001", "--latency", "0.01"]) == 0
+	out = capsys.readouterr().out
+	assert "5 errores" in out
+	assert "nan" in out
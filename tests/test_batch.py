@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+from common_functions import bisection_batch, bisection_method, newton_batch, secant_batch
+
+
+def square_minus(x, c):
+	return x * x - c
+
+
+def test_bisection_batch_matches_scalar_bisection():
+	c = np.array([2.0, 3.0, 5.0, 10.0])
+	roots, iters = bisection_batch(square_minus, 0.0, 4.0, tol=1e-10, args=(c,))
+	np.testing.assert_allclose(roots, np.sqrt(c), atol=1e-10)
+	for ci, root, n in zip(c, roots, iters):
+		expected = bisection_method(lambda x: x * x - ci, 0.0, 4.0, tol=1e-10)
+		assert (root, n) == expected[:2]
+
+
+def test_bisection_batch_keeps_the_broadcast_shape():
+	a = np.zeros((2, 3))
+	roots, iters = bisection_batch(np.cos, a, 3.0, tol=1e-8)
+	assert roots.shape == iters.shape == (2, 3)
+	np.testing.assert_allclose(roots, np.pi / 2, atol=1e-8)
+
+
+def test_bisection_batch_exact_root_endpoints():
+	a = np.array([1.0, 0.0, 0.0, 1.0])
+	b = np.array([3.0, 1.0, 2.0, 1.0])
+	roots, iters = bisection_batch(lambda x: x - 1, a, b, tol=1e-8)
+	np.testing.assert_array_equal(roots, [1.0, 1.0, 1.0, 1.0])
+	assert iters[0] == iters[1] == iters[3] == 0
+	assert iters[2] == 1  # el punto medio es la raíz exacta
+
+
+def test_bisection_batch_reports_intervals_without_sign_change():
+	with pytest.raises(ValueError, match=r"\[1\]"):
+		bisection_batch(square_minus, 0.0, 1.0, args=(np.array([0.5, 4.0]),))
+
+
+def dsquare_minus(x, c):
+	return 2 * x
+
+
+def test_newton_batch_matches_scalar_newton():
+	from common_functions import newton_method
+
+	c = np.array([2.0, 3.0, 100.0])
+	roots, iters, converged, breakdown = newton_batch(square_minus, dsquare_minus, c, tol=1e-12, args=(c,))
+	np.testing.assert_allclose(roots, np.sqrt(c), rtol=1e-14)
+	assert converged.all() and not breakdown.any()
+	for ci, n in zip(c, iters):
+		assert newton_method(lambda x: x * x - ci, lambda x: 2 * x, ci, tol=1e-12)[1] == n
+
+
+def test_newton_batch_flags_zero_derivative_and_exact_start():
+	roots, iters, converged, breakdown = newton_batch(square_minus, dsquare_minus, np.array([0.0, 2.0, 1.0]), tol=1e-10, args=(4.0,))
+	assert breakdown.tolist() == [True, False, False]
+	assert converged.tolist() == [False, True, True]
+	assert roots[1] == 2.0 and iters[1] == 1
+	assert roots[2] == pytest.approx(2.0)
+
+
+def test_newton_batch_stops_at_max_iter():
+	_, iters, converged, _ = newton_batch(square_minus, dsquare_minus, np.array([1e6]), tol=1e-12, max_iter=3, args=(2.0,))
+	assert iters[0] == 3 and not converged[0]
+
+
+def test_secant_batch_matches_scalar_secant():
+	from common_functions import secant_method
+
+	c = np.array([2.0, 3.0, 7.0])
+	roots, iters, converged, breakdown = secant_batch(square_minus, 1.0, 3.0, tol=1e-12, args=(c,))
+	np.testing.assert_allclose(roots, np.sqrt(c), rtol=1e-14)
+	assert converged.all() and not breakdown.any()
+	for ci, root, n in zip(c, roots, iters):
+		assert secant_method(lambda x: x * x - ci, 1.0, 3.0, tol=1e-12)[:2] == (root, n)
+
+
+def test_secant_batch_exact_roots_and_flat_secant():
+	roots, _, converged, breakdown = secant_batch(lambda x: x - 1, np.array([0.0, 1.0]), np.array([1.0, 3.0]), tol=1e-10)
+	np.testing.assert_array_equal(roots, [1.0, 1.0])
+	assert converged.all()
+	_, _, converged, breakdown = secant_batch(square_minus, np.array([-1.0]), np.array([1.0]), args=(4.0,))
+	assert breakdown[0] and not converged[0]
+
+
+def test_linear_polynomial_batch():
+	from common_functions import Polynomial
+
+	p = Polynomial([2, -3])
+	roots, _, converged, _ = newton_batch(p, p.derivative(), np.linspace(-5, 5, 7), tol=1e-12)
+	np.testing.assert_allclose(roots, 1.5)
+	assert converged.all()
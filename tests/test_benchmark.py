@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+import benchmark
+from common_functions import CountedFunction, TimedFunction
+from problems import PROBLEMS
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_counted_function_counts_array_elements():
+	f = CountedFunction(np.sin)
+	f(0.5)
+	f(np.zeros(10))
+	f(np.zeros((2, 3)))
+	assert f.calls == 3
+	assert f.evaluations == 1 + 10 + 6
+	timed = TimedFunction(np.sin)
+	timed(np.zeros(4))
+	assert (timed.calls, timed.evaluations) == (1, 4)
+
+
+@pytest.mark.parametrize("method", ["bisection_batch", "newton_batch", "secant_batch"])
+def test_batch_evaluations_scale_with_batch_size(method):
+	problem = PROBLEMS["ex8"]
+	one = benchmark.run_case(method, problem, 1e-8, False, 1, repeat=1)
+	many = benchmark.run_case(method, problem, 1e-8, False, 50, repeat=1)
+	assert many["iterations"] == one["iterations"]
+	assert many["evaluations"] == 50 * one["evaluations"]
+
+
+def test_scalar_evaluations_match_calls():
+	result = benchmark.run_case("brent", PROBLEMS["ex1a"], 1e-10, False, 1, repeat=1)
+	assert 2 < result["evaluations"] < 20
+
+
+def test_newton_runs_without_explicit_derivative():
+	# Newton escalar usa diferenciación automática; en lote, la derivada del Polynomial
+	results = benchmark.run_suite(["newton", "newton_aitken", "newton_batch"], [1e-8], [1], repeat=1)
+	cases = {(r["problem"], r["method"]) for r in results}
+	assert {("ex1a", "newton"), ("ex3a", "newton_aitken"), ("ex2", "newton_batch"), ("ex5", "newton_batch")} <= cases
+	assert ("ex1a", "newton_batch") not in cases
+	root = next(r["root"] for r in results if (r["problem"], r["method"]) == ("ex1a", "newton"))
+	assert root == pytest.approx(0.5671432904097838, abs=1e-8)
+
+
+def test_benchmark_does_not_import_plotting_or_exercises():
+	code = (
+		"import sys, benchmark; "
+		"heavy = [m for m in ('matplotlib', 'cli', 'ex1', 'ex3', 'ex6') if m in sys.modules]; "
+		"assert not heavy, heavy"
+	)
+	subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True)
+
+
+def test_compare_baseline_flags_more_evaluations(tmp_path):
+	results = [benchmark.run_case("bisection", PROBLEMS["ex2"], 1e-6, False, 1, repeat=1)]
+	path = str(tmp_path / "base.json")
+	benchmark.save_baseline(results, path)
+	assert benchmark.compare_baseline(results, path, threshold=1e9) == []
+	worse = [dict(results[0], evaluations=results[0]["evaluations"] + 1)]
+	assert benchmark.compare_baseline(worse, path, threshold=1e9)[0][1].startswith("evaluations")
@@ -0,0 +1,59 @@
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from common_functions import bisection_method, brent_method, illinois_method, ksection_method
+
+OMEGA = 0.5671432904097838
+
+
+def omega(x):
+	return x - math.exp(-x)
+
+
+@pytest.mark.parametrize("method", [bisection_method, illinois_method, brent_method, ksection_method])
+def test_normal_path(method):
+	root, iters, history = method(omega, 0.0, 1.0, tol=1e-10)
+	assert root == pytest.approx(OMEGA, abs=1e-10)
+	assert len(history) == iters
+
+
+@pytest.mark.parametrize("method", [bisection_method, illinois_method, brent_method, ksection_method])
+@pytest.mark.parametrize("a, b, expected", [(0.0, 1.0, 0.0), (-1.0, 0.0, 0.0)])
+def test_exact_root_at_endpoint(method, a, b, expected):
+	root, iters, _ = method(lambda x: x, a, b)
+	assert root == expected
+	assert iters == 0
+
+
+@pytest.mark.parametrize("method", [bisection_method, illinois_method, brent_method, ksection_method])
+def test_no_sign_change(method):
+	with pytest.raises(ValueError):
+		method(lambda x: x * x + 1, -1.0, 1.0)
+
+
+@pytest.mark.parametrize("k", [2, 3, 4, 9])
+def test_ksection_interior_exact_root(k):
+	root, _, _ = ksection_method(lambda x: x - 0.5, 0.0, 1.0, k=k)
+	assert root == 0.5
+
+
+def test_ksection_non_finite_sample():
+	with pytest.raises(ValueError, match="finita"):
+		ksection_method(lambda x: math.nan if 0.4 < x < 0.6 else x - 0.9, 0.0, 1.0, k=2)
+	with pytest.raises(ValueError, match="finita"):
+		ksection_method(lambda x: math.inf, 0.0, 1.0, k=4)
+
+
+def test_ksection_rounds_and_executor():
+	with ThreadPoolExecutor(max_workers=3) as pool:
+		root, rounds, _ = ksection_method(omega, 0.0, 1.0, tol=1e-8, k=4, executor=pool)
+	assert root == pytest.approx(OMEGA, abs=1e-8)
+	assert rounds <= math.ceil(math.log(1e8, 4))
+
+
+def test_bisection_stops_at_float_resolution():
+	root, iters, _ = bisection_method(omega, 0.0, 1.0, tol=1e-30)
+	assert root == pytest.approx(OMEGA, abs=1e-15)
+	assert iters < 60
@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from common_functions import CachedFunction, newton_method, secant_method
+import dual_math as dm
+from dual_math import Dual
+
+
+class Recorder:
+	def __init__(self, func):
+		self.func = func
+		self.sizes = []
+
+	def __call__(self, x):
+		self.sizes.append(np.size(x))
+		return self.func(x)
+
+
+def test_scalar_cache_and_lru_eviction():
+	f = Recorder(lambda x: x * x)
+	cached = CachedFunction(f, maxsize=2)
+	assert cached(2) == 4 and cached(2.0) == 4
+	assert cached.cache_info() == {"hits": 1, "misses": 1, "maxsize": 2, "currsize": 1}
+	cached(3.0)
+	cached(2.0)
+	cached(4.0)  # expulsa 3.0, el menos usado
+	cached(3.0)
+	assert f.sizes == [1, 1, 1, 1]
+	cached.cache_clear()
+	assert cached.cache_info()["currsize"] == 0
+
+
+def test_duals_are_not_cached():
+	cached = CachedFunction(lambda x: x * x)
+	assert cached(Dual(3.0, 1.0)).deriv == 6.0
+	assert cached.cache_info()["currsize"] == 0
+
+
+def test_array_evaluates_each_distinct_miss_once():
+	f = Recorder(np.sin)
+	cached = CachedFunction(f)
+	cached(1.0)
+	x = np.array([[1.0, 2.0, 2.0], [3.0, 1.0, 2.0]])
+	np.testing.assert_array_equal(cached(x), np.sin(x))
+	assert f.sizes == [1, 2]
+	assert cached.cache_info()["hits"] == 4
+	assert cached.cache_info()["misses"] == 3
+	np.testing.assert_array_equal(cached(x), np.sin(x))
+	assert f.sizes == [1, 2]
+	assert cached(2.0) == np.sin(2.0) and f.sizes == [1, 2]
+
+
+def test_array_nan_is_evaluated_but_not_stored():
+	f = Recorder(lambda x: np.where(x >= 0, np.sqrt(np.abs(x)), np.nan))
+	cached = CachedFunction(f)
+	out = cached(np.array([np.nan, 4.0, np.nan, -1.0]))
+	assert np.isnan(out[[0, 2, 3]]).all() and out[1] == 2.0
+	assert cached.cache_info()["currsize"] == 2
+	cached(np.array([np.nan, 4.0]))
+	assert f.sizes == [3, 1]
+
+
+def test_scalar_nan_is_evaluated_but_not_stored():
+	cached = CachedFunction(lambda x: x)
+	for _ in range(3):
+		assert np.isnan(cached(float("nan")))
+	assert cached.cache_info()["currsize"] == 0
+
+
+def test_negative_zero_has_its_own_entry():
+	cached = CachedFunction(lambda x: np.copysign(1.0, x))
+	assert (cached(0.0), cached(-0.0)) == (1.0, -1.0)
+	np.testing.assert_array_equal(cached(np.array([-0.0, 0.0, -0.0])), [-1.0, 1.0, -1.0])
+	assert cached.cache_info() == {"hits": 3, "misses": 2, "maxsize": 4096, "currsize": 2}
+	cached.cache_clear()
+	np.testing.assert_array_equal(cached(np.array([0.0, -0.0])), [1.0, -1.0])
+	assert cached(-0.0) == -1.0
+
+
+def test_large_array_bypasses_the_cache():
+	f = Recorder(np.exp)
+	cached = CachedFunction(f, maxsize=10)
+	x = np.linspace(0, 1, 50)
+	np.testing.assert_array_equal(cached(x), np.exp(x))
+	assert f.sizes == [50]
+	assert cached.cache_info()["currsize"] == 0
+
+
+def test_scalar_only_function_on_arrays():
+	def f(x):
+		if isinstance(x, np.ndarray):
+			raise TypeError("solo escalares")
+		return x + 1
+
+	cached = CachedFunction(f)
+	np.testing.assert_array_equal(cached([1.0, 2.0, 1.0]), [2.0, 3.0, 2.0])
+	assert cached(2.0) == 3.0 and cached.cache_info()["misses"] == 2
+
+
+def test_shared_cache_between_solvers():
+	f = Recorder(lambda x: x - dm.cos(x))
+	cached = CachedFunction(f)
+	root_n = newton_method(cached, None, 0.5, tol=1e-10)[0]
+	calls = len(f.sizes)
+	root_s = secant_method(cached, 0.5, root_n, tol=1e-10)[0]
+	assert root_s == pytest.approx(root_n)
+	assert cached.hits >= 1 and len(f.sizes) < calls + 5
+
+
+def test_invalid_maxsize():
+	with pytest.raises(ValueError):
+		CachedFunction(abs, maxsize=0)
@@ -0,0 +1,49 @@
+import math
+
+import numpy as np
+import pytest
+
+from common_functions import CountedFunction, Polynomial, chebyshev_roots
+
+
+def test_all_roots_of_sin():
+	roots = chebyshev_roots(np.sin, -10, 10)
+	np.testing.assert_allclose(roots, np.pi * np.arange(-3, 4), atol=1e-13)
+
+
+def test_many_roots_need_subdivision():
+	roots = chebyshev_roots(lambda x: np.cos(50 * x), 0, 1)
+	expected = [(k + 0.5) * math.pi / 50 for k in range(16)]
+	np.testing.assert_allclose(roots, expected, atol=1e-13)
+
+
+def test_polynomial_roots_match_companion_matrix():
+	p = Polynomial([1, 0, -7, 6])  # (x - 1)(x - 2)(x + 3)
+	np.testing.assert_allclose(chebyshev_roots(p, -4, 4), [-3.0, 1.0, 2.0], atol=1e-13)
+
+
+def test_constant_and_linear_functions():
+	assert chebyshev_roots(lambda x: np.ones_like(x), 0, 1) == []
+	assert chebyshev_roots(lambda x: x - 0.3, 0, 1) == pytest.approx([0.3], abs=1e-15)
+
+
+def test_exact_root_endpoints():
+	assert chebyshev_roots(lambda x: x, 0, 1) == [0.0]
+	assert chebyshev_roots(lambda x: x - 1, 0, 1) == [1.0]
+
+
+def test_scalar_only_function():
+	roots = chebyshev_roots(lambda x: math.cos(x) - x, 0, 1)
+	assert roots == pytest.approx([0.7390851332151607], abs=1e-15)
+
+
+def test_samples_are_reused_when_the_degree_doubles():
+	f = CountedFunction(np.sin)
+	chebyshev_roots(f, -10, 10, polish=False)
+	# Grados 16, 32 y 64: 17 + 16 + 32 puntos distintos, un lote por grado
+	assert (f.calls, f.evaluations) == (3, 65)
+
+
+def test_poles_raise_value_error():
+	with pytest.raises(ValueError, match="suave"):
+		chebyshev_roots(lambda x: 1 / (x - 0.5), 0, 1, max_depth=4)
@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import cli
+from common_functions import brent_method
+from problems import PROBLEMS, load_problems
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize("name", list(PROBLEMS))
+def test_registry_brackets_contain_a_root(name):
+	problem = PROBLEMS[name]
+	root, _, _ = brent_method(problem.f, *problem.bracket, tol=1e-12)
+	assert abs(problem.f(root)) < 1e-9
+
+
+def test_load_problems():
+	assert [p.name for p in load_problems(["ex8", "ex1a"])] == ["ex1a", "ex8"]
+	assert len(load_problems()) == len(PROBLEMS)
+	with pytest.raises(KeyError):
+		load_problems(["nope"])
+
+
+def test_solve_problem(capsys):
+	assert cli.main(["solve", "brent", "ex1a", "--tol", "1e-12"]) == 0
+	assert "0.56714329040978" in capsys.readouterr().out
+
+
+def test_solve_expression_with_automatic_derivative(capsys):
+	assert cli.main(["solve", "newton", "--expr", "x - cos(x)", "--p0", "1", "--tol", "1e-12"]) == 0
+	assert "0.739085133215161" in capsys.readouterr().out
+
+
+def test_solve_requires_problem_or_expression():
+	assert cli.main(["solve", "brent"]) == 2
+
+
+def test_solve_path_imports_stay_light():
+	code = (
+		"import sys, cli; cli.main(['solve', 'brent', 'ex1a']); "
+		"heavy = [m for m in ('benchmark', 'numpy', 'matplotlib', 'ex1') if m in sys.modules]; "
+		"assert not heavy, heavy"
+	)
+	subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True)
+
+
+def test_exercise_without_plots_does_not_import_numpy():
+	code = (
+		"import sys, cli; cli.main(['ex6', '--no-plot']); "
+		"heavy = [m for m in ('numpy', 'matplotlib') if m in sys.modules]; "
+		"assert not heavy, heavy"
+	)
+	subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True)
+
+
+def test_benchmark_does_not_import_cli():
+	code = "import sys, benchmark; assert 'cli' not in sys.modules"
+	subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True)
@@ -0,0 +1,67 @@
+import math
+
+import pytest
+
+import dual_math as dm
+from common_functions import continuation
+
+
+def square(x, theta):
+	return x * x - theta
+
+
+def kepler(E, e):
+	# Ecuación de Kepler con anomalía media M = 1
+	return E - e * dm.sin(E) - 1.0
+
+
+def test_follows_the_root_with_automatic_derivatives():
+	thetas = [1.0, 2.0, 3.0, 4.0, 100.0]
+	results = continuation(square, thetas, 1.0)
+	assert [t for t, _, _ in results] == thetas
+	for theta, root, _ in results:
+		assert root == pytest.approx(math.sqrt(theta), rel=1e-14)
+	assert results[0][2] <= 1  # x0 ya es la raíz
+
+
+def test_explicit_partials_give_the_same_path():
+	thetas = [0.0, 0.3, 0.6, 0.9, 0.99]
+	auto = continuation(kepler, thetas, 1.0)
+	explicit = continuation(
+		kepler, thetas, 1.0,
+		df=lambda E, e: 1 - e * math.cos(E),
+		dtheta=lambda E, e: -math.sin(E),
+	)
+	for (_, a, _), (_, b, _) in zip(auto, explicit):
+		assert a == pytest.approx(b, abs=1e-12)
+	for e, E, _ in auto:
+		assert kepler(E, e) == pytest.approx(0.0, abs=1e-12)
+
+
+def test_predictor_saves_iterations():
+	thetas = [float(t) for t in range(1, 50)]
+	with_predictor = sum(n for _, _, n in continuation(square, thetas, 1.0))
+	without = sum(n for _, _, n in continuation(square, thetas, 1.0, predictor=False))
+	assert with_predictor < without
+
+
+def test_secant_method():
+	for theta, root, _ in continuation(square, [1.0, 2.0, 3.0], 1.0, method="secant"):
+		assert root == pytest.approx(math.sqrt(theta), rel=1e-12)
+
+
+def test_large_jump_is_refined():
+	_, (_, root, iters) = continuation(square, [1.0, 1e4], 1.0, max_iter=4)
+	assert root == pytest.approx(100.0, rel=1e-14)
+	assert iters > 4
+
+
+def test_failures_raise_value_error():
+	with pytest.raises(ValueError):
+		continuation(lambda x, t: x * x + t, [1.0, 2.0], 1.0)
+	with pytest.raises(ValueError):
+		continuation(square, [1.0, 1e6], 1.0, max_iter=4)
+	with pytest.raises(ValueError):
+		continuation(square, [1.0], 1.0, method="bisection")
+	with pytest.raises(ValueError):
+		continuation(square, [], 1.0)
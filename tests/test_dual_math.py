@@ -0,0 +1,70 @@
+import math
+
+import pytest
+
+import dual_math as dm
+from dual_math import Dual, derivative, value_and_derivative
+
+X = 0.3
+
+FUNCTIONS = [
+	(dm.exp, math.exp),
+	(dm.log, lambda x: 1 / x),
+	(dm.sqrt, lambda x: 0.5 / math.sqrt(x)),
+	(dm.sin, math.cos),
+	(dm.cos, lambda x: -math.sin(x)),
+	(dm.tan, lambda x: 1 / math.cos(x) ** 2),
+	(dm.asin, lambda x: 1 / math.sqrt(1 - x * x)),
+	(dm.acos, lambda x: -1 / math.sqrt(1 - x * x)),
+	(dm.atan, lambda x: 1 / (1 + x * x)),
+	(dm.sinh, math.cosh),
+	(dm.cosh, math.sinh),
+	(dm.tanh, lambda x: 1 - math.tanh(x) ** 2),
+]
+
+
+@pytest.mark.parametrize("func, dfunc", FUNCTIONS, ids=[f.__name__ for f, _ in FUNCTIONS])
+def test_elementary_derivatives(func, dfunc):
+	value, slope = value_and_derivative(func, X)
+	assert value == getattr(math, func.__name__)(X)
+	assert slope == pytest.approx(dfunc(X), rel=1e-14)
+	assert func(X) == value and type(func(X)) is float
+
+
+def test_arithmetic_rules():
+	f = lambda x: (3 * x**2 - 2 / x + x / (1 + x) - 1) * dm.exp(-x)
+	h = 1e-6
+	numeric = (f(X + h) - f(X - h)) / (2 * h)
+	assert derivative(f)(X) == pytest.approx(numeric, rel=1e-8)
+
+
+def test_powers():
+	assert value_and_derivative(lambda x: x**0, X) == (1.0, 0.0)
+	assert value_and_derivative(lambda x: x**3, 2.0) == (8.0, 12.0)
+	assert value_and_derivative(lambda x: 2**x, 1.0) == pytest.approx((2.0, 2 * math.log(2)))
+	assert value_and_derivative(lambda x: x**x, 1.0) == pytest.approx((1.0, 1.0))
+
+
+def test_constant_function():
+	assert value_and_derivative(lambda x: 5.0, X) == (5.0, 0.0)
+
+
+def test_abs_and_comparisons():
+	assert value_and_derivative(abs, -2.0) == (2.0, -1.0)
+	a, b = Dual(1.0, 5.0), Dual(2.0, -1.0)
+	assert a < b and b > 1.5 and a == 1.0 and a != b and a <= 1 and b >= b
+	assert hash(a) == hash(1.0)
+
+
+def test_dual_never_silently_becomes_float():
+	with pytest.raises(TypeError):
+		float(Dual(1.0, 1.0))
+	with pytest.raises(TypeError):
+		math.cos(Dual(1.0, 1.0))
+
+
+def test_newton_with_automatic_derivative():
+	from common_functions import newton_method
+
+	root, _, _ = newton_method(lambda x: x - dm.cos(x), None, 1.0, tol=1e-12)
+	assert root == pytest.approx(0.7390851332151607, abs=1e-15)
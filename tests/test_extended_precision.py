@@ -0,0 +1,76 @@
+import math
+import sys
+from decimal import Decimal
+
+import pytest
+
+import dual_math as dm
+from common_functions import Polynomial, bisection_method, newton_method
+
+OMEGA = Decimal("0.567143290409783872999968662210355549753815787186512508135131")
+DOTTIE = Decimal("0.739085133215160641655312087673873404013411758900757464965681")
+SQRT2 = Decimal("1.414213562373095048801688724209698078569671875376948073176680")
+
+
+@pytest.fixture(params=["mpmath", "decimal"])
+def backend(request, monkeypatch):
+	"""Corre cada prueba con mpmath y con el respaldo de decimal (mpmath no disponible)."""
+	if request.param == "mpmath":
+		pytest.importorskip("mpmath")
+	else:
+		monkeypatch.setitem(sys.modules, "mpmath", None)
+	return request.param
+
+
+def test_bisection_extended_precision(backend):
+	root, _, _ = bisection_method(lambda x: x - dm.exp(-x), 0, 1, tol=1e-25, adaptive_precision=True)
+	assert isinstance(root, Decimal)
+	assert abs(root - OMEGA) < Decimal("1e-25")
+
+
+def test_polynomial_extended_precision(backend):
+	p = Polynomial([1, 0, -2])
+	root, _, _ = bisection_method(p, 1, 2, tol=1e-30, adaptive_precision=True)
+	assert abs(root - SQRT2) < Decimal("1e-30")
+	root, _, _ = newton_method(p, None, 1.0, tol=1e-30, adaptive_precision=True)
+	assert abs(root - SQRT2) < Decimal("1e-30")
+
+
+def test_triple_root_extended_precision(backend):
+	# (x² - 2)³ expandido: en float64 el cambio de signo queda lejos de √2
+	p = Polynomial([1, 0, -6, 0, 12, 0, -8])
+	root, _, _ = bisection_method(p, 1, 2, tol=1e-25, adaptive_precision=True)
+	assert abs(root - SQRT2) < Decimal("1e-25")
+
+
+@pytest.mark.parametrize("multiplicity", [2, None])
+def test_double_root_newton_extended_precision(backend, multiplicity):
+	# En la raíz doble f' se anula: la verificación de precisión no puede basarse en la pendiente allí
+	q = Polynomial([1, -2, 1])
+	root, _, _ = newton_method(q, q.derivative(), 3.0, tol=1e-30, multiplicity=multiplicity, adaptive_precision=True)
+	assert isinstance(root, Decimal)
+	assert abs(root - 1) < Decimal("1e-30")
+
+
+def test_newton_extended_precision_dual_math():
+	pytest.importorskip("mpmath")
+	root, _, _ = newton_method(lambda x: x - dm.cos(x), None, 1.0, tol=1e-25, adaptive_precision=True)
+	assert abs(root - DOTTIE) < Decimal("1e-25")
+
+
+def test_trig_without_mpmath_raises(monkeypatch):
+	monkeypatch.setitem(sys.modules, "mpmath", None)
+	with pytest.raises(TypeError):
+		newton_method(lambda x: x - dm.cos(x), None, 1.0, tol=1e-25, adaptive_precision=True)
+
+
+def test_float_precision_function_raises(backend):
+	with pytest.raises(TypeError):
+		bisection_method(lambda x: x - math.exp(-x), 0, 1, tol=1e-25, adaptive_precision=True)
+	with pytest.raises(TypeError):
+		newton_method(lambda x: x - math.cos(x), lambda x: 1 + math.sin(x), 1.0, tol=1e-25, adaptive_precision=True)
+
+
+def test_float_tolerance_stays_in_float64():
+	root, _, _ = bisection_method(lambda x: x - dm.exp(-x), 0, 1, tol=1e-8, adaptive_precision=True)
+	assert isinstance(root, float)
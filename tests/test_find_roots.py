@@ -0,0 +1,46 @@
+import math
+
+import numpy as np
+
+from common_functions import find_all_roots, find_brackets
+
+
+def test_finds_every_sign_change():
+	roots = find_all_roots(np.sin, -10, 10)
+	np.testing.assert_allclose(roots, np.pi * np.arange(-3, 4), atol=1e-10)
+
+
+def test_exact_zero_sample_is_a_degenerate_bracket():
+	brackets = find_brackets(lambda x: x * (x - 0.55), -1, 1, samples=201)
+	assert (0.0, 0.0) in brackets
+	assert len(brackets) == 2
+	np.testing.assert_allclose(find_all_roots(lambda x: x * (x - 0.55), -1, 1, samples=201), [0.0, 0.55], atol=1e-10)
+
+
+def test_poles_are_rejected():
+	f = lambda x: (4 * x - 7) / (x - 2.01)  # raíz en 1.75, polo simple en 2.01
+	brackets = find_brackets(f, 0, 4)
+	assert len(brackets) == 1
+	a, b = brackets[0]
+	assert a <= 1.75 <= b
+	assert len(find_brackets(f, 0, 4, reject_poles=False)) == 2
+	assert find_all_roots(np.tan, 1, 2).size == 0
+
+
+def test_scalar_only_function_and_no_roots():
+	def f(x):
+		return math.exp(x) - x**2 + 3 * x - 2
+
+	np.testing.assert_allclose(find_all_roots(f, 0, 1), [0.2575302854398608], atol=1e-10)
+	assert find_all_roots(lambda x: x * x + 1, -2, 2).size == 0
+
+
+def test_custom_refiner():
+	calls = []
+
+	def refine(func, a, b, tol, max_iter):
+		calls.append(a.size)
+		return (a + b) / 2, None
+
+	roots = find_all_roots(np.cos, 0, 10, samples=11, refine=refine)
+	assert calls == [3] and roots.size == 3
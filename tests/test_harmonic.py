@@ -0,0 +1,41 @@
+import math
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from cli import load_exercise
+
+ex4 = load_exercise(4)
+
+
+def exact_harmonic(n):
+	return float(sum(Fraction(1, k) for k in range(1, n + 1)))
+
+
+def test_partial_sums_are_correctly_rounded():
+	for n in (1, 2, 10, 100, 1000):
+		assert ex4.harmonic_sum(n) == exact_harmonic(n)
+
+
+def test_prefix_extends_across_blocks():
+	series = ex4.HarmonicSeries(block_size=7, asymptotic_from=10_000)
+	np.testing.assert_array_equal(series.partial_sums([0, 1, 20, 5]), [0.0, 1.0, exact_harmonic(20), exact_harmonic(5)])
+	assert series.partial_sums(300) == exact_harmonic(300)
+
+
+def test_asymptotic_branch_is_continuous():
+	series = ex4.HarmonicSeries(asymptotic_from=1000)
+	below, above = series.partial_sums([1000, 1001])
+	assert above - below == pytest.approx(1 / 1001, rel=1e-9)
+	assert ex4.HarmonicSeries.asymptotic(1000) == pytest.approx(exact_harmonic(1000), rel=1e-15)
+
+
+def test_difference_and_errors():
+	diff, expected = ex4.demonstrate_difference(10)
+	assert diff == pytest.approx(expected, rel=1e-14)
+	with pytest.raises(ValueError):
+		ex4.harmonic_sum(0)
+	with pytest.raises(ValueError):
+		ex4.demonstrate_difference(1)
+	assert ex4.harmonic_sum(10**9) == pytest.approx(math.log(10**9) + ex4.EULER_GAMMA, rel=1e-9)
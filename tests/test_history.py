@@ -0,0 +1,146 @@
+import math
+
+import pytest
+
+from common_functions import (
+	BISECTION_COLUMNS,
+	ITERATIVE_COLUMNS,
+	IterationHistory,
+	bisection_method,
+	brent_method,
+	newton_method,
+	secant_method,
+)
+
+
+def f(x):
+	return x**3 + 4 * x**2 - 10
+
+
+def test_compact_history_has_the_same_rows_as_the_list():
+	_, _, rows = bisection_method(f, 1.0, 2.0, tol=1e-8)
+	_, _, compact = bisection_method(f, 1.0, 2.0, tol=1e-8, compact=True)
+	assert isinstance(compact, IterationHistory)
+	assert compact.columns == BISECTION_COLUMNS
+	assert list(compact) == list(rows)
+	assert compact[-1] == rows[-1] and len(compact) == len(rows)
+
+	_, _, rows = newton_method(f, None, 1.5, tol=1e-12)
+	_, _, compact = newton_method(f, None, 1.5, tol=1e-12, compact=True)
+	assert list(compact) == list(rows)
+
+
+def test_history_grows_past_its_capacity():
+	history = IterationHistory(ITERATIVE_COLUMNS, 2)
+	for n in range(10):
+		history.append((n, float(n), 0.0, 1.0 / (n + 1)))
+	assert len(history) == 10
+	assert list(history.column("n")) == list(range(10))
+
+
+def test_ring_buffer_keeps_the_last_rows_and_a_summary():
+	_, iters, full = secant_method(f, 1.0, 2.0, tol=1e-12)
+	_, _, last = secant_method(f, 1.0, 2.0, tol=1e-12, keep_last=3)
+	assert list(last) == list(full)[-3:]
+	assert list(last.column("n")) == [row[0] for row in list(full)[-3:]]
+	summary = last.summary()
+	assert summary["total_rows"] == len(full)
+	assert summary["dropped_rows"] == len(full) - 3
+	assert summary["first"] == full[0]
+	assert summary["last"] == full[-1]
+	deltas = [row[3] for row in full if row[0] > 0]
+	assert summary["min delta"] == min(deltas) and summary["max delta"] == max(deltas)
+
+
+def test_as_arrays_and_indexing():
+	np = pytest.importorskip("numpy")
+	history = IterationHistory(ITERATIVE_COLUMNS, 4, keep_last=2)
+	for n in range(5):
+		history.append((n, n / 2, -n, 2.0**-n))
+	arrays = history.as_arrays()
+	assert arrays["n"].dtype == np.int64 and arrays["n"].tolist() == [3, 4]
+	assert arrays["delta"].tolist() == [2.0**-3, 2.0**-4]
+	assert history[0] == (3, 1.5, -3.0, 0.125)
+	with pytest.raises(IndexError):
+		history[2]
+
+
+def test_invalid_keep_last():
+	with pytest.raises(ValueError):
+		IterationHistory(ITERATIVE_COLUMNS, 4, keep_last=0)
+
+
+def test_bisection_capacity_from_theorem_bound():
+	history = IterationHistory.for_bisection(1.0, 2.0, 1e-6, 1000)
+	assert history._capacity == math.ceil(math.log2(1e6)) + 1
+
+
+@pytest.mark.parametrize("tol", [0.0, -1.0])
+def test_bisection_without_tolerance_bound(tol):
+	# Sin cota del Teorema 2.1 el historial se dimensiona con max_iter
+	root, iters, rows = bisection_method(f, 1.0, 2.0, tol=tol, max_iter=60, compact=True)
+	assert abs(f(root)) < 1e-12
+	assert len(rows) == iters
+	root, _, rows = brent_method(f, 1.0, 2.0, tol=tol, keep_last=5)
+	assert abs(f(root)) < 1e-12
+	assert len(rows) <= 5
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_write_history_formats(compact):
+	import io
+	import json
+
+	from common_functions import format_bisection_table, write_history
+
+	_, _, history = bisection_method(f, 1.0, 2.0, tol=1e-4, compact=compact)
+	rows = list(history)
+
+	out = io.StringIO()
+	write_history(history, out, "csv")
+	lines = out.getvalue().splitlines()
+	assert lines[0] == ",".join(BISECTION_COLUMNS)
+	assert len(lines) == len(rows) + 1
+	assert [float(v) for v in lines[-1].split(",")] == list(rows[-1])
+
+	out = io.StringIO()
+	write_history(history, out, "jsonl")
+	records = [json.loads(line) for line in out.getvalue().splitlines()]
+	assert records[0] == dict(zip(BISECTION_COLUMNS, rows[0]))
+
+	out = io.StringIO()
+	write_history(history, out, "text", title="a")
+	assert out.getvalue() == format_bisection_table("a", history) + "\n"
+
+	with pytest.raises(ValueError):
+		write_history(history, io.StringIO(), "xml")
+
+
+def test_write_history_iterative_columns():
+	import io
+
+	from common_functions import write_history
+
+	_, _, rows = newton_method(f, None, 1.5, tol=1e-10)
+	out = io.StringIO()
+	write_history(rows, out, "csv")
+	assert out.getvalue().splitlines()[0] == ",".join(ITERATIVE_COLUMNS)
+
+
+@pytest.mark.parametrize("suffix", [".npz", ".npy"])
+@pytest.mark.parametrize("compact", [False, True])
+def test_save_history_arrays(tmp_path, suffix, compact):
+	np = pytest.importorskip("numpy")
+	from common_functions import save_history_arrays
+
+	_, _, history = bisection_method(f, 1.0, 2.0, tol=1e-4, compact=compact)
+	path = str(tmp_path / f"h{suffix}")
+	save_history_arrays(history, path)
+	table = np.array(list(history), dtype=float)
+	if suffix == ".npz":
+		data = np.load(path)
+		assert sorted(data.files) == sorted(["n", "a", "b", "p", "fp", "half_width"])
+		assert data["n"].dtype == np.int64
+		np.testing.assert_array_equal(data["half_width"], table[:, 5])
+	else:
+		np.testing.assert_array_equal(np.load(path), table)
@@ -0,0 +1,77 @@
+import pytest
+
+import dual_math as dm
+from common_functions import estimate_multiplicity, newton_method
+
+
+def cubic(x):
+	return x ** 3 - 2 * x - 5
+
+
+def dcubic(x):
+	return 3 * x * x - 2
+
+
+CUBIC_ROOT = 2.0945514815423265
+
+
+def test_newton_simple_root():
+	root, iters, rows = newton_method(cubic, dcubic, 2.0, tol=1e-12)
+	assert root == pytest.approx(CUBIC_ROOT, abs=1e-12)
+	assert rows[0][:2] == (0, 2.0)
+	assert len(rows) == iters + 1
+
+
+def test_newton_automatic_derivative():
+	root, _, _ = newton_method(lambda x: x - dm.cos(x), None, 1.0, tol=1e-12)
+	assert root == pytest.approx(0.7390851332151607, abs=1e-12)
+
+
+@pytest.mark.parametrize("p0", [20.0, 100.0, -50.0, 1e4])
+def test_multiplicity_detection_far_start_simple_root(p0):
+	_, classic, _ = newton_method(cubic, dcubic, p0, tol=1e-12, max_iter=200)
+	root, iters, _ = newton_method(cubic, dcubic, p0, tol=1e-12, max_iter=200, multiplicity=None)
+	assert root == pytest.approx(CUBIC_ROOT, abs=1e-12)
+	assert iters <= classic + 3
+
+
+@pytest.mark.parametrize("k", [10, 20])
+@pytest.mark.parametrize("automatic", [False, True])
+def test_multiplicity_detection_high_degree_simple_root(k, automatic):
+	# Lejos de la raíz el cociente de pasos es 1 - 1/k y simula multiplicidad k;
+	# el paso con ese factor cae cerca de 0, donde el siguiente desborda f
+	f = lambda x: x**k - 1
+	df = None if automatic else (lambda x: k * x ** (k - 1))
+	_, classic, _ = newton_method(f, df, 10.0, tol=1e-12, max_iter=200)
+	root, iters, rows = newton_method(f, df, 10.0, tol=1e-12, max_iter=200, multiplicity=None)
+	assert root == pytest.approx(1.0, abs=1e-12)
+	assert iters <= classic + 3
+	assert all(abs(row[1]) < 11 for row in rows)
+
+
+@pytest.mark.parametrize("order", [2, 3, 5])
+def test_multiplicity_detection_multiple_root(order):
+	f = lambda x: (x - 1) ** order * (x + 2)
+	_, classic, _ = newton_method(f, None, 2.0, tol=1e-10, max_iter=200)
+	root, iters, _ = newton_method(f, None, 2.0, tol=1e-10, max_iter=200, multiplicity=None)
+	assert root == pytest.approx(1.0, abs=1e-8)
+	assert iters < classic / 2
+
+
+def test_multiplicity_detection_lands_on_exact_root():
+	# El primer paso con m = 2 cae justo en la raíz: f = f' = 0 no es motivo para volver a m = 1
+	root, iters, _ = newton_method(lambda x: (x - 1) ** 2, lambda x: 2 * (x - 1), 3.0, tol=1e-12, multiplicity=None)
+	assert root == 1.0
+	assert iters <= 8
+
+
+def test_fixed_multiplicity_converges_quadratically():
+	root, iters, _ = newton_method(lambda x: (x - 1) ** 3, lambda x: 3 * (x - 1) ** 2, 2.0, tol=1e-12, multiplicity=3)
+	assert root == 1.0
+	assert iters <= 2
+
+
+def test_estimate_multiplicity():
+	_, _, rows = newton_method(lambda x: (x - 1) ** 3 * dm.exp(x), None, 2.0, tol=1e-6)
+	assert estimate_multiplicity(rows) == 3
+	assert estimate_multiplicity(rows[:2]) is None
@@ -0,0 +1,157 @@
+import numpy as np
+import pytest
+
+from common_functions import adaptive_sample, evaluate_for_plot, insert_pole_breaks
+
+
+def _breaks(x, y):
+	return x[np.isnan(y)]
+
+
+def ex3(x):
+	return (4 * x - 7) / (x - 2) ** 2
+
+
+@pytest.mark.parametrize("n", [101, 200, 1000])
+def test_even_order_pole_breaks(n):
+	x, y = evaluate_for_plot(ex3, np.linspace(-14, 20, n))
+	breaks = _breaks(x, y)
+	grid = np.linspace(-14, 20, n)
+	left = grid[grid < 2].max()
+	right = grid[grid > 2].min()
+	assert np.any((breaks > left) & (breaks < right))
+
+
+def test_even_order_pole_breaks_adaptive_sample():
+	x, y = insert_pole_breaks(*adaptive_sample(ex3, -14, 20, ylim=(-6, 10)))
+	breaks = _breaks(x, y)
+	assert breaks.size <= 2
+	below = x[~np.isnan(y) & (x < 2)].max()
+	above = x[~np.isnan(y) & (x > 2)].min()
+	assert np.any((breaks > below) & (breaks < above))
+
+
+def test_odd_order_pole_breaks_once():
+	x, y = evaluate_for_plot(lambda x: 1 / (x - 0.5), np.linspace(0, 1, 100))
+	np.testing.assert_allclose(_breaks(x, y), [0.5])
+	x, y = evaluate_for_plot(np.tan, np.linspace(-4, 4, 400))
+	np.testing.assert_allclose(np.abs(_breaks(x, y)), np.pi / 2, atol=0.02)
+
+
+@pytest.mark.parametrize("func", [np.exp, lambda x: 50 * np.sin(x), lambda x: x**3 - 2 * x, lambda x: 1 / (1 + 100 * x**2)])
+def test_smooth_curves_do_not_break(func):
+	x = np.linspace(-4, 4, 80)
+	x2, y = evaluate_for_plot(func, x)
+	assert x2.size == x.size
+	assert not np.isnan(y).any()
+
+
+def test_non_finite_values_become_nan():
+	x = np.linspace(-1, 1, 5)
+	y = np.array([1.0, np.inf, -np.inf, 2.0, 3.0])
+	_, y2 = insert_pole_breaks(x, y)
+	assert np.isnan(y2[1:3]).all()
+	assert not np.isinf(y2).any()
+
+
+def test_scalar_only_function_is_sampled_pointwise():
+	def f(x):
+		if x == 0:
+			raise ValueError("no definida")
+		return 1 / x
+
+	x, y = evaluate_for_plot(f, np.linspace(-1, 1, 5))
+	assert np.isnan(y[2])
+	assert y[0] == -1.0 and y[-1] == 1.0
+
+
+def _history(n, ratio=0.1):
+	return [(0, 1.0, 1.0, 0.0)] + [(k, 1.0, ratio**k, ratio**k) for k in range(1, n + 1)]
+
+
+def test_convergence_plotter_does_not_keep_previous_state(tmp_path):
+	from common_functions import ConvergencePlotter
+
+	plotter = ConvergencePlotter()
+	plotter.render((_history(5), _history(8)), "primero", str(tmp_path / "a.png"), 1)
+	assert plotter.figure._suptitle.get_text().endswith("Problema 1")
+
+	plotter.render((_history(3),), "segundo", str(tmp_path / "b.png"))
+	newton, secant = plotter.lines
+	assert plotter.figure._suptitle.get_text() == ""
+	assert list(newton.get_xdata()) == [1, 2, 3]
+	assert not secant.get_visible() and len(secant.get_xdata()) == 0
+	labels = [t.get_text() for t in plotter.axes.get_legend().get_texts()]
+	assert labels == ["Newton (convergencia en 3 pasos)"]
+	assert "Secante" not in plotter.info.get_text()
+
+	plotter.render((_history(2), _history(4)), "tercero", str(tmp_path / "c.png"))
+	assert secant.get_visible() and list(secant.get_xdata()) == [1, 2, 3, 4]
+	assert (tmp_path / "c.png").stat().st_size > 0
+
+	with pytest.raises(ValueError):
+		plotter.render((_history(1),) * 3, "de más", str(tmp_path / "d.png"))
+
+
+def test_render_convergence_plots_writes_files(tmp_path):
+	from common_functions import render_convergence_plots
+
+	jobs = [((_history(n), _history(n + 1)), f"p{n}", str(tmp_path / f"p{n}.svg"), n) for n in range(1, 4)]
+	paths = render_convergence_plots(jobs)
+	assert paths == [job[2] for job in jobs]
+	assert all((tmp_path / f"p{n}.svg").exists() for n in range(1, 4))
+
+
+def test_ex6_convergence_plot_reuses_the_shared_figure(tmp_path):
+	from common_functions import use_headless_backend
+	from cli import load_exercise
+
+	use_headless_backend()
+	import matplotlib.pyplot as plt
+
+	ex6 = load_exercise(6)
+	plt.close("all")
+	for n in (1, 2):
+		ex6.plot_convergence(_history(4), _history(6), "f", n, str(tmp_path / f"c{n}.png"))
+	assert plt.get_fignums() == []
+	assert (tmp_path / "c1.png").exists() and (tmp_path / "c2.png").exists()
+
+
+def test_ex4_saves_through_show_or_save(tmp_path):
+	from common_functions import use_headless_backend
+	from cli import load_exercise
+
+	use_headless_backend()
+	import matplotlib.pyplot as plt
+
+	ex4 = load_exercise(4)
+	ex4.plot_harmonic_series(100, save_path=str(tmp_path / "h.png"))
+	assert (tmp_path / "h.png").exists()
+	assert plt.get_fignums() == []
+
+
+def test_adaptive_sample_refines_only_where_needed():
+	calls = []
+
+	def f(x):
+		calls.append(np.size(x))
+		return np.tanh(50 * (x - 0.3))
+
+	x, y = adaptive_sample(f, 0, 1, max_evals=400)
+	assert x[0] == 0 and x[-1] == 1 and np.all(np.diff(x) > 0)
+	assert sum(calls) == x.size <= 400
+	dense = np.sum(np.abs(x - 0.3) < 0.05)
+	assert dense > np.sum(x > 0.6)
+
+
+def test_adaptive_sample_of_a_line_stops_after_one_check():
+	# Una sola ronda de puntos medios confirma que no hay curvatura
+	x, y = adaptive_sample(lambda x: 2 * x + 1, -1, 1, initial=17)
+	np.testing.assert_allclose(x, np.linspace(-1, 1, 33))
+	np.testing.assert_allclose(y, 2 * x + 1)
+
+
+def test_adaptive_sample_marks_non_finite_values():
+	x, y = adaptive_sample(lambda x: 1 / x, -1, 1, initial=9, max_evals=100)
+	assert np.isnan(y[x == 0]).all()
+	assert x.size <= 100
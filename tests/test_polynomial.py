@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from common_functions import Polynomial, newton_batch, newton_method
+from dual_math import value_and_derivative
+
+
+def test_scalar_horner():
+	p = Polynomial([1, 0, -2, -5])
+	assert p(2.0) == -1.0
+	assert p.derivative()(2.0) == 10.0
+	assert value_and_derivative(p, 2.0) == (-1.0, 10.0)
+
+
+def test_leading_zeros_and_degree():
+	p = Polynomial([0, 0, 3, 1])
+	assert p.coeffs == (3.0, 1.0)
+	assert p.degree == 1
+	assert Polynomial([]).coeffs == (0.0,)
+
+
+@pytest.mark.parametrize("x", [np.array([1, 2, 3]), np.array([1.0, 2.0, 3.0])])
+def test_constant_on_arrays(x):
+	result = Polynomial([5])(x)
+	assert result.shape == x.shape
+	np.testing.assert_array_equal(result, [5.0, 5.0, 5.0])
+
+
+def test_linear_and_derivative_on_arrays():
+	p = Polynomial([2, 1])
+	x = np.array([1, 2, 3])
+	np.testing.assert_array_equal(p(x), [3.0, 5.0, 7.0])
+	np.testing.assert_array_equal(p.derivative()(x), [2.0, 2.0, 2.0])
+	np.testing.assert_array_equal(Polynomial([1, 0, -2])(x), [-1.0, 2.0, 7.0])
+
+
+def test_array_input_not_modified():
+	x = np.array([1.0, 2.0])
+	Polynomial([1, 1, 1])(x)
+	np.testing.assert_array_equal(x, [1.0, 2.0])
+
+
+def test_newton_batch_with_linear_polynomial():
+	p = Polynomial([2, -1])
+	roots, _, converged, _ = newton_batch(p, p.derivative(), np.array([0.0, 3.0, -7.0]))
+	np.testing.assert_allclose(roots, 0.5)
+	assert converged.all()
+
+
+def test_roots():
+	p = Polynomial([1, -6, 11, -6])
+	np.testing.assert_allclose(p.real_roots(), [1.0, 2.0, 3.0])
+	assert Polynomial([4]).roots().size == 0
+	root, _, _ = newton_method(p, p.derivative(), 3.4, tol=1e-12)
+	assert root == pytest.approx(3.0)
@@ -0,0 +1,30 @@
+import math
+
+from common_functions import bisection_steps, newton_steps, profile_solver
+
+
+def test_profile_counts_calls_and_steps():
+	rows = []
+	seen = []
+	root, iters, stats = profile_solver(
+		bisection_steps, lambda x: x * x - 2, 1.0, 2.0, 1e-8,
+		history=rows, callback=lambda row, ns: seen.append((row, ns)),
+	)
+	assert abs(root - math.sqrt(2)) < 1e-8
+	assert len(rows) == iters == len(stats.iteration_ns) == len(seen)
+	assert [row for row, _ in seen] == rows
+	assert stats.calls("f") == iters + 2
+	assert stats.calls("df") == 0
+	info = stats.as_dict()
+	assert info["steps"] == iters
+	assert info["overhead_ns"] == stats.total_ns - stats.function_ns >= 0
+	assert "llamadas" in stats.report()
+
+
+def test_profile_wraps_callables_in_order():
+	root, iters, stats = profile_solver(newton_steps, lambda x: x * x - 2, lambda x: 2 * x, 1.0, 1e-12)
+	assert abs(root - math.sqrt(2)) < 1e-12
+	assert set(stats.functions) == {"f", "df"}
+	# f en cada iterado; df no se evalúa en el punto final
+	assert stats.calls("f") == iters + 1
+	assert stats.calls("df") == iters
@@ -0,0 +1,66 @@
+import math
+
+import pytest
+
+from common_functions import (
+	bisection_method,
+	bisection_steps,
+	newton_method,
+	newton_steps,
+	secant_method,
+	secant_steps,
+)
+
+
+def f(x):
+	return x**3 + 4 * x**2 - 10
+
+
+def df(x):
+	return 3 * x**2 + 8 * x
+
+
+def drain(steps):
+	rows = []
+	while True:
+		try:
+			rows.append(next(steps))
+		except StopIteration as stop:
+			return rows, stop.value
+
+
+@pytest.mark.parametrize(
+	"steps, method, args",
+	[
+		(bisection_steps, bisection_method, (f, 1.0, 2.0, 1e-8)),
+		(newton_steps, newton_method, (f, df, 1.5, 1e-10)),
+		(secant_steps, secant_method, (f, 1.0, 2.0, 1e-10)),
+	],
+)
+def test_generators_yield_the_method_rows(steps, method, args):
+	rows, (root, iters) = drain(steps(*args))
+	expected_root, expected_iters, history = method(*args)
+	assert (root, iters) == (expected_root, expected_iters)
+	assert rows == list(history)
+
+
+def test_consumer_can_stop_early():
+	steps = bisection_steps(f, 1.0, 2.0, 1e-12)
+	first = [next(steps) for _ in range(3)]
+	steps.close()
+	assert [row[0] for row in first] == [1, 2, 3]
+	assert first[0][3] == 1.5
+
+
+def test_bisection_steps_exact_root_endpoints_and_resolution():
+	assert drain(bisection_steps(lambda x: x - 1, 1.0, 3.0, 1e-8)) == ([], (1.0, 0))
+	assert drain(bisection_steps(lambda x: x - 3, 1.0, 3.0, 1e-8)) == ([], (3.0, 0))
+	# tol = 0: se detiene al agotar la precisión de float64 en lugar de iterar max_iter veces
+	rows, (root, iters) = drain(bisection_steps(f, 1.0, 2.0, 0.0, 10_000))
+	assert iters < 60
+	assert math.isclose(root, 1.3652300134140969, rel_tol=1e-15)
+
+
+def test_bisection_steps_without_sign_change():
+	with pytest.raises(ValueError):
+		drain(bisection_steps(f, 2.0, 3.0))
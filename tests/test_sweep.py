@@ -0,0 +1,26 @@
+import math
+
+import pytest
+
+from sweep import print_sweep, run_sweep
+
+
+def test_sweep_serial_and_parallel_agree():
+	problems, methods, exponents = ["ex1a", "ex2"], ["bisection", "brent"], [4, 8]
+	serial = run_sweep(problems, methods, exponents, workers=1)
+	parallel = run_sweep(problems, methods, exponents, workers=2)
+	assert len(serial) == 8
+	assert serial == parallel
+	for r in serial:
+		if r["problem"] == "ex1a":
+			assert r["root"] == pytest.approx(0.5671432904097838, abs=10.0 ** -r["p"])
+
+
+def test_sweep_newton_without_derivative_and_prints(capsys):
+	# ex1a no trae df: Newton la obtiene por diferenciación automática
+	results = run_sweep(["ex1a", "ex8"], ["newton"], [6], workers=1)
+	assert results[0]["root"] == pytest.approx(0.5671432904097838, abs=1e-6)
+	assert results[1]["root"] == pytest.approx(math.sqrt(3))
+	print_sweep(results, [6])
+	out = capsys.readouterr().out
+	assert "sin derivada" not in out and "1.732050807568877" in out